@@ -70,16 +70,23 @@ async def get_chunks(
     chunk_strategy: Optional[str] = Query(
         None, description="Filter by chunking strategy"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor of the page, from the previous page's next_cursor"
+    ),
+    include_total: bool = Query(True, description="Count the chunks of the file"),
 ):
     """
     Get chunks for a file from database.
+
+    Pages can be selected by number or, at the same cost for every page, by
+    following next_cursor.
     """
     try:
         # URL decode the file_id
         file_id = urllib.parse.unquote(file_id)
 
-        chunks, total = await chunking_service.get_chunks(
-            file_id, page, limit, chunk_strategy
+        chunks, total, next_cursor = await chunking_service.get_chunks(
+            file_id, page, limit, chunk_strategy, cursor, include_total
         )
 
         return {
@@ -92,12 +99,20 @@ async def get_chunks(
                 "chunk_strategy": chunk_strategy,
                 "pagination": {
                     "total": total,
-                    "page": page,
+                    "page": page if cursor is None else None,
                     "limit": limit,
-                    "pages": (total + limit - 1) // limit,
+                    "pages": (total + limit - 1) // limit
+                    if total is not None
+                    else None,
+                    "next_cursor": next_cursor,
                 },
             },
         }
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"code": 1, "message": str(e), "data": None},
+        )
     except Exception as e:
         logger.error(f"Error getting chunks for file {file_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,24 +1,28 @@
 """
 API router for file operations.
 """
+import json
 import logging
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Body, File, Form, HTTPException, Query, UploadFile
 from fastapi.responses import JSONResponse
 
 import constants
 from file_loader import FileLoaderService
 from models.base import BaseResponse
 from models.file import (
+    DatabaseIngestRequest,
     FileDeleteResponse,
     FileDetailInfo,
     FileInfo,
+    FileIngestRequest,
     FileListResponse,
     FileResponse,
+    WebIngestRequest,
 )
 
 router = APIRouter(prefix="/files", tags=["Files"])
@@ -43,6 +47,22 @@ async def upload_file(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=BaseResponse)
+async def upload_files(
+    files: List[UploadFile] = File(...),
+    loading_method: str = Form(...),
+):
+    """
+    Upload several document files at once, images are OCR'd in batches.
+    """
+    try:
+        file_infos = await file_service.upload_files(files, loading_method)
+        return {"code": 0, "message": "Success", "data": {"files": file_infos}}
+    except Exception as e:
+        logger.error(f"Error uploading files: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("", response_model=BaseResponse)
 async def get_all_files(
     page: int = Query(1, ge=1, description="Page number"),
@@ -137,6 +157,114 @@ async def get_loading_methods_for_file_type(file_type: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/ingest", response_model=BaseResponse)
+async def ingest_files(request: FileIngestRequest = Body(...)):
+    """
+    Ingest a server-side directory or list of files in the background.
+    """
+    try:
+        job = await file_service.start_ingest(request)
+        return {"code": 0, "message": "Success", "data": {"job": job}}
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"code": 1, "message": str(e), "data": None},
+        )
+    except Exception as e:
+        logger.error(f"Error starting ingest job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/ingest/web", response_model=BaseResponse)
+async def ingest_web_pages(request: WebIngestRequest = Body(...)):
+    """
+    Ingest web pages in the background, skipping pages that have not changed.
+    """
+    try:
+        job = await file_service.start_web_ingest(request)
+        return {"code": 0, "message": "Success", "data": {"job": job}}
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"code": 1, "message": str(e), "data": None},
+        )
+    except Exception as e:
+        logger.error(f"Error starting web ingest job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/ingest/database", response_model=BaseResponse)
+async def ingest_database_table(request: DatabaseIngestRequest = Body(...)):
+    """
+    Ingest a database table in the background, resuming after the last saved row.
+    """
+    try:
+        job = await file_service.start_db_ingest(request)
+        return {"code": 0, "message": "Success", "data": {"job": job}}
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"code": 1, "message": str(e), "data": None},
+        )
+    except Exception as e:
+        logger.error(f"Error starting database ingest job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/ingest/archive", response_model=BaseResponse)
+async def ingest_archive(
+    file: UploadFile = File(...),
+    loading_methods: Optional[str] = Form(
+        None,
+        description='JSON object of loading methods by file type, e.g. {"pdf": "PyPDF"}',
+    ),
+    wait: bool = Form(False, description="Respond once every file is ingested"),
+):
+    """
+    Ingest the files of a zip or tar archive, one file ID per supported member.
+    """
+    try:
+        methods = json.loads(loading_methods) if loading_methods else {}
+        if not isinstance(methods, dict):
+            raise ValueError("loading_methods must be a JSON object")
+        job = await file_service.start_archive_ingest(file, methods, wait)
+        return {"code": 0, "message": "Success", "data": {"job": job}}
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"code": 1, "message": str(e), "data": None},
+        )
+    except Exception as e:
+        logger.error(f"Error starting archive ingest job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/ingest/{job_id}", response_model=BaseResponse)
+async def get_ingest_job(
+    job_id: str,
+    include_results: bool = Query(True, description="Include per-file results"),
+):
+    """
+    Get the progress of a bulk ingestion job.
+    """
+    try:
+        job = file_service.get_ingest_job(job_id, include_results)
+        if not job:
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "code": 1,
+                    "message": f"Ingest job with ID {job_id} not found",
+                    "data": None,
+                },
+            )
+
+        return {"code": 0, "message": "Success", "data": {"job": job}}
+    except Exception as e:
+        logger.error(f"Error getting ingest job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{file_id}", response_model=BaseResponse)
 async def get_file(file_id: str):
     """
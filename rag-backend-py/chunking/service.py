@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import constants
 from models.chunk import ChunkInfo, ChunkSettings
-from database import DatabaseService
+from database import AsyncDatabaseService
 from .recursive_character_text_splitter import RecursiveCharacterTextSplitter
 from .character_text_splitter import CharacterTextSplitter
 from .llamaindex_semantics_splitter import LlamaindexSemanticsSplitter
@@ -23,7 +23,7 @@ class ChunkingService:
     """
 
     def __init__(self):
-        self.db_service = DatabaseService()
+        self.db_service = AsyncDatabaseService()
 
     async def create_chunks(
         self,
@@ -48,7 +48,7 @@ class ChunkingService:
         """
         try:
             # Get documents from database
-            documents = self.db_service.get_documents(file_id)
+            documents = await self.db_service.get_documents(file_id)
             if not documents:
                 raise FileNotFoundError(f"No documents found for file {file_id}")
 
@@ -79,7 +79,7 @@ class ChunkingService:
                 raise ValueError(f"Unsupported chunking strategy: {chunk_strategy}")
 
             # Save chunks to database
-            chunk_ids = self.db_service.save_chunks(
+            chunk_ids = await self.db_service.save_chunks(
                 file_id, chunks_data, chunk_strategy, window_size, overlap
             )
 
@@ -221,24 +221,32 @@ class ChunkingService:
         return chunks_data
 
     async def get_chunks(
-        self, file_id: str, page: int, limit: int, chunk_strategy: Optional[str] = None
-    ) -> Tuple[List[ChunkInfo], int]:
+        self,
+        file_id: str,
+        page: int,
+        limit: int,
+        chunk_strategy: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[ChunkInfo], Optional[int], Optional[str]]:
         """
         Get chunks for a file from database.
 
         Args:
             file_id: ID of the file
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             limit: Number of items per page
             chunk_strategy: Optional strategy filter
+            cursor: Cursor of the page, returned with the previous page
+            include_total: Whether to count the file's chunks
 
         Returns:
-            Tuple of (list of chunks, total count)
+            Tuple of (list of chunks, total count or None, next page cursor or None)
         """
         try:
             # Get chunks from database
-            db_chunks, total_count = self.db_service.get_chunks(
-                file_id, chunk_strategy, page, limit
+            db_chunks, total_count, next_cursor = await self.db_service.get_chunks(
+                file_id, chunk_strategy, page, limit, cursor, include_total
             )
 
             # Convert to ChunkInfo objects
@@ -253,7 +261,7 @@ class ChunkingService:
                 )
                 chunks.append(chunk)
 
-            return chunks, total_count
+            return chunks, total_count, next_cursor
 
         except Exception as e:
             logger.error(f"Error loading chunks for file {file_id}: {str(e)}")
@@ -269,7 +277,7 @@ class ChunkingService:
         Returns:
             List of strategy names
         """
-        return self.db_service.get_file_chunk_strategies(file_id)
+        return await self.db_service.get_file_chunk_strategies(file_id)
 
     async def get_chunk_stats(self, file_id: str) -> Dict[str, Any]:
         """
@@ -281,7 +289,7 @@ class ChunkingService:
         Returns:
             Dictionary with statistics
         """
-        return self.db_service.get_chunk_stats(file_id)
+        return await self.db_service.get_chunk_stats(file_id)
 
     async def update_settings(
         self, strategy: str, window_size: int, overlap: int
@@ -1,6 +1,8 @@
 """
 Constants used throughout the RAG backend.
 """
+import json
+import os
 from pathlib import Path
 
 # API
@@ -13,9 +15,39 @@ CHUNKS_DIR = DATA_DIR / "chunks"
 VECTORS_DIR = DATA_DIR / "vectors"
 INDEXES_DIR = DATA_DIR / "indexes"
 LOGS_DIR = DATA_DIR / "logs"
+PARSE_CACHE_DIR = DATA_DIR / "parse_cache"
+WEB_CACHE_PATH = DATA_DIR / "web_cache.json"
+
+# Database, set DATABASE_URL to use an external database instead of the SQLite file
+DATABASE_URL = os.getenv("DATABASE_URL") or f"sqlite:///{DATA_DIR}/rag.db"
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+DATABASE_POOL_TIMEOUT = 30  # seconds to wait for a free pooled connection
+DATABASE_POOL_RECYCLE = 1800  # seconds, reconnect before servers drop idle connections
+DATABASE_ECHO = False  # log every SQL statement
+SQLITE_BUSY_TIMEOUT = 30  # seconds a connection waits for another one's write lock
+# Applied to every SQLite connection. WAL lets readers run alongside a writer,
+# and synchronous=NORMAL is durable in WAL mode except on power loss
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64 * 1024,  # KiB when negative, 64MB per connection
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+# The request handlers use an async engine on the same database. Its URL is
+# DATABASE_URL with the async driver of the backend, unless ASYNC_DATABASE_URL is set
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+ASYNC_DATABASE_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "mysql": "aiomysql",
+    "postgresql": "asyncpg",
+}
 
 # File loading settings
 MAX_FILE_SIZE = 128 * 1024 * 1024  # 128MB
+MAX_ARCHIVE_SIZE = 2 * 1024 * 1024 * 1024  # 2GB, members are limited to MAX_FILE_SIZE
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB per read when spooling uploads to disk
 ALLOWED_FILE_TYPES = [
     "pdf",
     "txt",
@@ -27,9 +59,11 @@ ALLOWED_FILE_TYPES = [
     "pptx",
     "md",
     "markdown",
+    "xlsx",
+    "docx",
 ]
 LOADING_METHODS = {
-    "pdf": ["PyPDF", "Unstructured"],
+    "pdf": ["PyPDF", "Unstructured", "PDFPlumber", "Camelot"],
     "csv": ["Langchain", "Unstructured"],
     "txt": ["TextLoader"],
     "png": ["Unstructured"],
@@ -39,8 +73,120 @@ LOADING_METHODS = {
     "pptx": ["Unstructured"],
     "md": ["Unstructured"],
     "markdown": ["Unstructured"],
+    "xlsx": ["OpenPyXL"],
+    "docx": ["DocxXML"],
+}
+
+# Parse cache versions, bump a loader's version to invalidate only its cached results
+LOADER_VERSIONS = {
+    "PyPDF": "1",
+    "Unstructured": "1",
+    "Langchain": "3",
+    "TextLoader": "1",
+    "PDFPlumber": "1",
+    "Camelot": "1",
+    "OpenPyXL": "1",
+    "DocxXML": "1",
+}
+
+# PyPDF page-parallel loading
+PYPDF_PARALLEL_WORKERS = min(4, os.cpu_count() or 1)
+PYPDF_PARALLEL_PAGE_THRESHOLD = 64  # below this page count, load in a single process
+
+# PDF table loading, only pages with enough ruling lines go to the table extractor
+PDF_TABLE_WORKERS = min(4, os.cpu_count() or 1)
+PDF_TABLE_MIN_RULES = 8  # ruling lines for a page to be a table candidate
+PDF_TABLE_RULE_MAX_THICKNESS = 3  # points
+PDF_TABLE_RULE_MIN_LENGTH = 10  # points
+
+# Unstructured PDF loading
+UNSTRUCTURED_PDF_STRATEGY = "auto"  # "auto", "hi_res" or "fast"
+UNSTRUCTURED_AUTO_MIN_TEXT_CHARS = 100  # pages with less text go to hi_res
+UNSTRUCTURED_AUTO_MAX_IMAGES = 3  # pages with more images go to hi_res
+
+# In-memory cache budgets (estimated bytes)
+DOCS_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+FILE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+
+# Bulk ingestion of server-side files
+INGEST_ALLOWED_DIRS = [Path("fixtures"), DATA_DIR / "ingest"]
+BULK_INGEST_CONCURRENCY = max(2, (os.cpu_count() or 1) * 2)  # files in flight
+# Finished ingest jobs stay queryable for INGEST_JOB_TTL seconds, and the oldest
+# finished ones are forgotten once INGEST_JOB_MAX_COUNT jobs are kept
+INGEST_JOB_TTL = 24 * 60 * 60
+INGEST_JOB_MAX_COUNT = 1000
+
+# Web ingestion
+WEB_LOADING_METHOD = "WebBaseLoader"
+WEB_FETCH_CONCURRENCY = 32  # pooled connections in total
+WEB_FETCH_PER_HOST_CONCURRENCY = 4  # connections per host
+WEB_FETCH_TIMEOUT = 30  # seconds per page
+WEB_USER_AGENT = "rag-backend-py/0.1"
+WEB_FETCH_ALLOW_PRIVATE_HOSTS = False  # allow loopback, private and link-local hosts
+
+# Database ingestion, tables are read with keyset pagination. Requests name one of
+# the sources of DB_INGEST_SOURCES, a JSON object of source names and SQLAlchemy
+# URLs set by the server, e.g. {"crm": "mysql://reader:password@db/crm"}
+DB_LOADING_METHOD = "Database"
+DB_INGEST_SOURCES = json.loads(os.getenv("DB_INGEST_SOURCES") or "{}")
+DB_INGEST_BATCH_SIZE = 1000  # rows per query and per commit
+DB_ROWS_PER_DOCUMENT = 20
+
+# Lazy loading, files at least this large are streamed into the database in batches.
+# The size in bytes does not bound the number of documents, e.g. a compressed PDF
+# under the limit can still expand to many pages and is loaded into memory at once
+LAZY_LOAD_MIN_FILE_SIZE = 8 * 1024 * 1024  # 8MB
+DOCUMENT_BATCH_SIZE = 1000  # documents per INSERT and commit
+CHUNK_BATCH_SIZE = 5000  # chunks per INSERT
+
+# CSV loading, rows grouped into one document by the Langchain method
+CSV_ROWS_PER_DOCUMENT = 20
+CSV_ENCODING = "utf-8-sig"  # also reads plain UTF-8, dropping a leading BOM
+
+# Excel loading, rows of each sheet grouped into one document
+XLSX_ROWS_PER_DOCUMENT = 20
+
+# Word loading, one document per heading section, long sections are split
+DOCX_MAX_SECTION_CHARS = 4000
+
+# Loader executor settings
+LOADER_EXECUTOR = "process"  # "process", "thread" or "inline"
+# "forkserver" or "spawn", forking the multi-threaded server can deadlock a worker
+LOADER_START_METHOD = "forkserver"
+LOADER_MAX_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+LOADER_DEFAULT_CONCURRENCY = 2
+LOADER_CONCURRENCY = {
+    "PyPDF": 4,
+    "PyPDF-parallel": 1,  # PDFs loaded with PYPDF_PARALLEL_WORKERS processes each
+    "Unstructured": 2,
+    "Langchain": 4,
+    "TextLoader": 8,
+    "OpenPyXL": 4,
+    "DocxXML": 8,
+    "PDFPlumber": 1,  # each load runs its own page-parallel pool
+    "Camelot": 1,
+}
+LOADER_DEFAULT_TIMEOUT = 300  # seconds
+LOADER_TIMEOUTS = {
+    "Unstructured": 900,
+    "PDFPlumber": 900,
+    "Camelot": 900,
 }
 
+# Image OCR, images are downscaled and deduplicated by pixel hash
+IMAGE_TYPES = ["png", "jpg", "jpeg"]
+IMAGE_OCR_STRATEGY = "hi_res"
+IMAGE_OCR_MAX_SIDE = 2000  # pixels, larger images are downscaled before OCR
+IMAGE_BATCH_SIZE = 16  # images OCR'd per worker call
+
+# Resident workers for the Unstructured loaders, which keep their models loaded
+UNSTRUCTURED_WORKERS = 2
+UNSTRUCTURED_WARM_UP = True  # import partitioners when a worker starts
+UNSTRUCTURED_PRELOAD_LAYOUT_MODEL = (
+    True  # load the hi_res layout model when a worker starts
+)
+UNSTRUCTURED_START_WORKERS_ON_STARTUP = True
+
 # Chunking settings
 DEFAULT_CHUNK_STRATEGY = "sliding_window"
 DEFAULT_WINDOW_SIZE = 512
@@ -100,3 +246,7 @@ SUPPORTED_GENERATION_MODELS = {
 # Response codes
 SUCCESS_CODE = 0
 ERROR_CODE = 1
+
+# Loader benchmark, see file_loader/benchmark.py
+BENCHMARK_FIXTURES_DIR = Path("fixtures")
+BENCHMARK_REGRESSION_TOLERANCE = 0.2  # fraction of slowdown reported as a regression
@@ -2,6 +2,21 @@
 Database service module.
 """
 from .service import DatabaseService
-from .models import create_tables, get_db_session
+from .async_service import AsyncDatabaseService
+from .models import (
+    create_tables,
+    dispose_async_engine,
+    get_async_db_session,
+    get_db_session,
+    reset_engine,
+)
 
-__all__ = ["DatabaseService", "create_tables", "get_db_session"]
+__all__ = [
+    "AsyncDatabaseService",
+    "DatabaseService",
+    "create_tables",
+    "dispose_async_engine",
+    "get_async_db_session",
+    "get_db_session",
+    "reset_engine",
+]
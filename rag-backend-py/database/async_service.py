@@ -0,0 +1,476 @@
+"""
+Async database service for the request handlers.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select, update
+
+import constants
+from models.document import (
+    ChunkRecord,
+    Document,
+    DocumentChunk,
+    DocumentRecord,
+    FileRecord,
+    IngestCheckpoint,
+)
+from .models import get_async_db_session
+from .service import BaseDatabaseService
+
+logger = logging.getLogger("rag-backend.database")
+
+
+class AsyncDatabaseService(BaseDatabaseService):
+    """
+    Service for database operations from async code.
+
+    It has the methods of DatabaseService as coroutines, running on the async
+    engine, so a request waiting for the database does not hold up the other
+    requests of the event loop. Use DatabaseService in worker threads and
+    processes.
+    """
+
+    async def save_file_record(
+        self,
+        file_id: str,
+        file_name: str,
+        file_size: int,
+        loading_method: Optional[str],
+        storage_path: str,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Add or update a file in the files catalog.
+
+        Args:
+            file_id: File ID
+            file_name: Original file name
+            file_size: File size in bytes
+            loading_method: Loading method used
+            storage_path: Path of the stored original file
+            created_at: Creation time, defaults to now
+        """
+        async with get_async_db_session() as session:
+            await session.merge(
+                FileRecord(
+                    id=file_id,
+                    file_name=file_name,
+                    file_size=file_size,
+                    loading_method=loading_method,
+                    storage_path=storage_path,
+                    created_at=created_at or datetime.utcnow(),
+                )
+            )
+
+    async def get_file_record(self, file_id: str) -> Optional[FileRecord]:
+        """
+        Get a file from the files catalog.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            FileRecord or None if not found
+        """
+        async with get_async_db_session() as session:
+            return await session.get(FileRecord, file_id)
+
+    async def list_file_records(
+        self, page: int = 1, limit: int = 10
+    ) -> Tuple[List[FileRecord], int]:
+        """
+        Get a page of the files catalog, newest first.
+
+        Args:
+            page: Page number (1-indexed)
+            limit: Number of files per page
+
+        Returns:
+            Tuple of (file records, total count)
+        """
+        async with get_async_db_session() as session:
+            total_count = await session.scalar(select(func.count(FileRecord.id)))
+            result = await session.scalars(
+                select(FileRecord)
+                .order_by(FileRecord.created_at.desc(), FileRecord.id)
+                .offset((page - 1) * limit)
+                .limit(limit)
+            )
+            return list(result), total_count
+
+    async def count_file_records(self, storage_path: Optional[str] = None) -> int:
+        """
+        Count files in the files catalog.
+
+        Args:
+            storage_path: Only count files stored at this path
+
+        Returns:
+            Number of files
+        """
+        query = select(func.count(FileRecord.id))
+        if storage_path is not None:
+            query = query.where(FileRecord.storage_path == storage_path)
+        async with get_async_db_session() as session:
+            return await session.scalar(query)
+
+    async def get_uncataloged_file_ids(self) -> List[str]:
+        """
+        Get IDs of files that have documents but no files catalog entry.
+
+        Returns:
+            List of file IDs
+        """
+        async with get_async_db_session() as session:
+            result = await session.scalars(
+                select(Document.file_id)
+                .where(Document.file_id.notin_(select(FileRecord.id)))
+                .distinct()
+            )
+            return list(result)
+
+    async def get_first_document_metadata(
+        self, file_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the metadata of a file's first document without loading its content.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            Metadata dictionary, or None if the file has no documents
+        """
+        async with get_async_db_session() as session:
+            result = await session.execute(
+                select(Document.doc_metadata)
+                .where(Document.file_id == file_id)
+                .order_by(Document.page_number, Document.id)
+                .limit(1)
+            )
+            row = result.first()
+            return (row[0] or {}) if row else None
+
+    async def save_documents(
+        self,
+        file_id: str,
+        documents: Iterable[Any],
+        original_filename: str = None,
+        batch_size: int = constants.DOCUMENT_BATCH_SIZE,
+    ) -> List[str]:
+        """
+        Save loaded documents to database.
+
+        Documents are written like DatabaseService.save_documents, one
+        multi-row INSERT and commit every batch_size rows under a staging file
+        ID, replacing the file's previous documents at the end. The iterable is
+        consumed on the event loop, pass loaded documents rather than a lazy
+        loader.
+
+        Args:
+            file_id: File ID
+            documents: Iterable of LangChain Document objects
+            original_filename: Original filename when uploaded
+            batch_size: Number of documents per INSERT and commit
+
+        Returns:
+            List of document IDs
+        """
+        document_ids = []
+        staging_id = self._staging_file_id(file_id)
+
+        async with get_async_db_session() as session:
+            try:
+                rows = []
+                for i, doc in enumerate(documents):
+                    rows.append(
+                        self._document_row(staging_id, i, doc, original_filename)
+                    )
+                    if len(rows) >= batch_size:
+                        await session.execute(insert(Document.__table__), rows)
+                        await session.commit()
+                        document_ids.extend(row["id"] for row in rows)
+                        rows = []
+
+                if rows:
+                    await session.execute(insert(Document.__table__), rows)
+                    document_ids.extend(row["id"] for row in rows)
+
+                # Replace the existing documents for this file
+                await session.execute(
+                    delete(Document).where(Document.file_id == file_id)
+                )
+                await session.execute(
+                    update(Document)
+                    .where(Document.file_id == staging_id)
+                    .values(file_id=file_id)
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                await session.execute(
+                    delete(Document).where(Document.file_id == staging_id)
+                )
+                await session.commit()
+                raise
+
+            logger.info(f"Saved {len(document_ids)} documents for file {file_id}")
+
+        return document_ids
+
+    async def save_document_batch(
+        self,
+        file_id: str,
+        documents: List[Any],
+        start_index: int,
+        last_key: str,
+        rows: int,
+        file_size: int,
+        original_filename: str = None,
+    ) -> List[str]:
+        """
+        Append a batch of documents and advance the file's ingest checkpoint.
+
+        See DatabaseService.save_document_batch.
+
+        Args:
+            file_id: File ID
+            documents: LangChain Document objects of the batch
+            start_index: Index of the first document of the batch in the file
+            last_key: JSON encoded key of the last row of the batch
+            rows: Total rows saved for the file, including this batch
+            file_size: Total content size in bytes, including this batch
+            original_filename: Original filename, saved with the file's first document
+
+        Returns:
+            List of document IDs
+        """
+        document_rows = [
+            self._document_row(file_id, start_index + i, doc, original_filename)
+            for i, doc in enumerate(documents)
+        ]
+        async with get_async_db_session() as session:
+            if document_rows:
+                await session.execute(insert(Document.__table__), document_rows)
+            await session.merge(
+                IngestCheckpoint(
+                    file_id=file_id,
+                    last_key=last_key,
+                    rows=rows,
+                    documents=start_index + len(documents),
+                    updated_at=datetime.utcnow(),
+                )
+            )
+            await session.execute(
+                update(FileRecord)
+                .where(FileRecord.id == file_id)
+                .values(file_size=file_size)
+            )
+
+        return [row["id"] for row in document_rows]
+
+    async def get_ingest_checkpoint(self, file_id: str) -> Optional[IngestCheckpoint]:
+        """
+        Get the ingest checkpoint of a file.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            IngestCheckpoint or None if the file has none
+        """
+        async with get_async_db_session() as session:
+            return await session.get(IngestCheckpoint, file_id)
+
+    async def get_documents(
+        self, file_id: str, include_content: bool = True
+    ) -> List[DocumentRecord]:
+        """
+        Get all documents for a file.
+
+        Args:
+            file_id: File ID
+            include_content: Whether to read page_content, None when False
+
+        Returns:
+            List of DocumentRecord tuples
+        """
+        async with get_async_db_session() as session:
+            result = await session.execute(
+                self._documents_query(file_id, include_content)
+            )
+            return [DocumentRecord._make(row) for row in result]
+
+    async def get_all_documents(
+        self, include_content: bool = True
+    ) -> List[DocumentRecord]:
+        """
+        Get all documents from the database.
+
+        Args:
+            include_content: Whether to read page_content, None when False
+
+        Returns:
+            List of DocumentRecord tuples
+        """
+        async with get_async_db_session() as session:
+            result = await session.execute(self._documents_query(None, include_content))
+            return [DocumentRecord._make(row) for row in result]
+
+    async def save_chunks(
+        self,
+        file_id: str,
+        chunks: List[Dict[str, Any]],
+        chunk_strategy: str,
+        window_size: Optional[int] = None,
+        overlap: Optional[int] = None,
+        batch_size: int = constants.CHUNK_BATCH_SIZE,
+    ) -> List[str]:
+        """
+        Save document chunks to database.
+
+        Chunks are written with multi-row INSERTs of batch_size rows, all in
+        one transaction, so a file's chunks are replaced atomically.
+
+        Args:
+            file_id: File ID
+            chunks: List of chunk dictionaries
+            chunk_strategy: Chunking strategy used
+            window_size: Window size used
+            overlap: Overlap used
+            batch_size: Number of chunks per INSERT
+
+        Returns:
+            List of chunk IDs
+        """
+        rows = self._chunk_rows(file_id, chunks, chunk_strategy, window_size, overlap)
+
+        async with get_async_db_session() as session:
+            # Clear existing chunks for this file and strategy
+            await session.execute(
+                delete(DocumentChunk).where(
+                    DocumentChunk.file_id == file_id,
+                    DocumentChunk.chunk_strategy == chunk_strategy,
+                )
+            )
+
+            for start in range(0, len(rows), batch_size):
+                await session.execute(
+                    insert(DocumentChunk.__table__), rows[start : start + batch_size]
+                )
+
+            await session.commit()
+            logger.info(
+                f"Saved {len(chunks)} chunks for file {file_id} using strategy {chunk_strategy}"
+            )
+
+        return [row["id"] for row in rows]
+
+    async def get_chunks(
+        self,
+        file_id: str,
+        chunk_strategy: Optional[str] = None,
+        page: int = 1,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        include_content: bool = True,
+    ) -> Tuple[List[ChunkRecord], Optional[int], Optional[str]]:
+        """
+        Get chunks for a file, ordered by strategy and chunk index.
+
+        See DatabaseService.get_chunks for the pagination.
+
+        Args:
+            file_id: File ID
+            chunk_strategy: Chunking strategy filter
+            page: Page number (1-indexed), ignored when cursor is given
+            limit: Number of chunks per page
+            cursor: Cursor returned with the previous page
+            include_total: Whether to count the file's chunks
+            include_content: Whether to read the chunk content, None when False
+
+        Returns:
+            Tuple of (ChunkRecord tuples, total_count or None, cursor of the
+            next page or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        count_query, page_query = self._chunk_page_queries(
+            file_id, chunk_strategy, page, limit, cursor, include_content
+        )
+        async with get_async_db_session() as session:
+            total_count = await session.scalar(count_query) if include_total else None
+            result = await session.execute(page_query)
+            chunks = [ChunkRecord._make(row) for row in result]
+
+        chunks, next_cursor = self._chunk_page(chunks, limit)
+        return chunks, total_count, next_cursor
+
+    async def get_file_chunk_strategies(self, file_id: str) -> List[str]:
+        """
+        Get all chunking strategies used for a file.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            List of strategy names
+        """
+        async with get_async_db_session() as session:
+            result = await session.scalars(
+                select(DocumentChunk.chunk_strategy)
+                .where(DocumentChunk.file_id == file_id)
+                .distinct()
+            )
+            return list(result)
+
+    async def delete_file_data(self, file_id: str) -> None:
+        """
+        Delete all documents, chunks and the catalog entry for a file.
+
+        Args:
+            file_id: File ID
+        """
+        async with get_async_db_session() as session:
+            await session.execute(
+                delete(DocumentChunk).where(DocumentChunk.file_id == file_id)
+            )
+            await session.execute(delete(Document).where(Document.file_id == file_id))
+            await session.execute(delete(FileRecord).where(FileRecord.id == file_id))
+            await session.execute(
+                delete(IngestCheckpoint).where(IngestCheckpoint.file_id == file_id)
+            )
+            logger.info(f"Deleted all data for file {file_id}")
+
+    async def get_chunk_stats(self, file_id: str) -> Dict[str, Any]:
+        """
+        Get chunking statistics for a file.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            Dictionary with statistics
+        """
+        async with get_async_db_session() as session:
+            result = await session.execute(
+                select(DocumentChunk.chunk_strategy, func.count(DocumentChunk.id))
+                .where(DocumentChunk.file_id == file_id)
+                .group_by(DocumentChunk.chunk_strategy)
+            )
+            strategy_counts = result.all()
+            doc_count = await session.scalar(
+                select(func.count(Document.id)).where(Document.file_id == file_id)
+            )
+
+            return {
+                "document_count": doc_count,
+                "chunk_strategies": {
+                    strategy: count for strategy, count in strategy_counts
+                },
+                "total_chunks": sum(count for _, count in strategy_counts),
+            }
@@ -0,0 +1,305 @@
+"""
+Benchmark of the document and chunk write and read paths.
+
+Compares adding one ORM object per row, the previous write path, with the
+batched INSERTs of DatabaseService, and loading ORM objects, the previous
+read path, with the read records of DatabaseService, on a fresh SQLite
+database.
+
+Usage:
+    python -m database.benchmark --rows 50000 --batch-sizes 1000 5000
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from langchain_core.documents import Document as LangchainDocument
+
+import constants
+from database import DatabaseService, get_db_session
+from database.models import SessionLocal, create_db_engine
+from models.base import Base
+from models.document import Document, DocumentChunk
+
+
+def _make_chunks(rows: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "document_id": str(uuid.uuid4()),
+            "content": f"Chunk {i} " + "lorem ipsum dolor sit amet " * 20,
+            "metadata": {"page": i // 20, "chunk": i},
+            "start_offset": i * 500,
+            "end_offset": (i + 1) * 500,
+        }
+        for i in range(rows)
+    ]
+
+
+def _make_documents(rows: int) -> List[LangchainDocument]:
+    return [
+        LangchainDocument(
+            page_content=f"Page {i} " + "lorem ipsum dolor sit amet " * 80,
+            metadata={"source": "benchmark.pdf", "page": i},
+        )
+        for i in range(rows)
+    ]
+
+
+def _save_chunks_per_row(file_id: str, chunks: List[Dict[str, Any]]) -> None:
+    """Save chunks like the previous save_chunks, one session.add per row."""
+    with get_db_session() as session:
+        session.query(DocumentChunk).filter(
+            DocumentChunk.file_id == file_id,
+            DocumentChunk.chunk_strategy == "benchmark",
+        ).delete()
+        for i, chunk_data in enumerate(chunks):
+            session.add(
+                DocumentChunk(
+                    id=str(uuid.uuid4()),
+                    file_id=file_id,
+                    document_id=chunk_data.get("document_id"),
+                    content=chunk_data["content"],
+                    chunk_metadata=chunk_data.get("metadata", {}),
+                    start_offset=chunk_data.get("start_offset"),
+                    end_offset=chunk_data.get("end_offset"),
+                    chunk_index=i,
+                    chunk_strategy="benchmark",
+                    window_size=None,
+                    overlap=None,
+                )
+            )
+        session.commit()
+
+
+def _save_documents_per_row(
+    file_id: str,
+    documents: Iterable[LangchainDocument],
+    original_filename: str = None,
+    batch_size: int = constants.DOCUMENT_BATCH_SIZE,
+) -> None:
+    """
+    Save documents like the previous save_documents, one session.add per row
+    and a commit every batch_size rows.
+    """
+    with get_db_session() as session:
+        session.query(Document).filter(Document.file_id == file_id).delete()
+        count = 0
+        for i, doc in enumerate(documents):
+            doc_metadata = doc.metadata.copy() if doc.metadata else {}
+            if i == 0 and original_filename:
+                doc_metadata["original_filename"] = original_filename
+            page_number = doc.metadata.get("page") if doc.metadata else None
+            if isinstance(page_number, int) and page_number >= 0:
+                page_number += 1
+            session.add(
+                Document(
+                    id=str(uuid.uuid4()),
+                    file_id=file_id,
+                    page_content=doc.page_content,
+                    doc_metadata=doc_metadata,
+                    page_number=page_number,
+                )
+            )
+            count += 1
+            if count % batch_size == 0:
+                session.commit()
+                session.expunge_all()
+        session.commit()
+
+
+def _get_documents_orm(file_id: str) -> List[Document]:
+    """Load documents as ORM objects and copy them to detach them."""
+    with get_db_session() as session:
+        documents = (
+            session.query(Document)
+            .filter(Document.file_id == file_id)
+            .order_by(Document.page_number, Document.id)
+            .all()
+        )
+        return [
+            Document(
+                id=doc.id,
+                file_id=doc.file_id,
+                page_content=doc.page_content,
+                doc_metadata=doc.doc_metadata,
+                page_number=doc.page_number,
+                created_at=doc.created_at,
+            )
+            for doc in documents
+        ]
+
+
+def _get_chunks_orm(file_id: str) -> List[DocumentChunk]:
+    """Load chunks as ORM objects and copy them to detach them."""
+    with get_db_session() as session:
+        chunks = (
+            session.query(DocumentChunk)
+            .filter(DocumentChunk.file_id == file_id)
+            .order_by(DocumentChunk.chunk_strategy, DocumentChunk.chunk_index)
+            .all()
+        )
+        return [
+            DocumentChunk(
+                id=chunk.id,
+                file_id=chunk.file_id,
+                document_id=chunk.document_id,
+                content=chunk.content,
+                chunk_metadata=chunk.chunk_metadata,
+                start_offset=chunk.start_offset,
+                end_offset=chunk.end_offset,
+                chunk_index=chunk.chunk_index,
+                chunk_strategy=chunk.chunk_strategy,
+                window_size=chunk.window_size,
+                overlap=chunk.overlap,
+                created_at=chunk.created_at,
+            )
+            for chunk in chunks
+        ]
+
+
+def _measure(operation: str, path: str, rows: int, func, *args) -> Dict[str, Any]:
+    start = time.perf_counter()
+    func(*args)
+    seconds = time.perf_counter() - start
+    return {
+        "operation": operation,
+        "path": path,
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(rows / seconds, 1),
+        "seconds_per_10k_rows": round(seconds * 10000 / rows, 4),
+    }
+
+
+def _measure_read(operation: str, path: str, func, *args) -> Dict[str, Any]:
+    """Time a read, then repeat it under tracemalloc for its allocations."""
+    rows = len(func(*args))  # warm up
+    result = _measure(operation, path, rows, func, *args)
+    tracemalloc.start()
+    records = func(*args)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    result["retained_kib"] = round(retained / 1024)
+    result["peak_kib"] = round(peak / 1024)
+    return result
+
+
+def run_benchmark(rows: int, batch_sizes: List[int]) -> List[Dict[str, Any]]:
+    """
+    Time saving rows chunks and rows documents with each write path, then
+    reading them back with each read path.
+
+    Args:
+        rows: Number of chunks and of documents per run
+        batch_sizes: Batch sizes of the bulk write path
+
+    Returns:
+        One result per operation and write path
+    """
+    db_service = DatabaseService()
+    chunks = _make_chunks(rows)
+    documents = _make_documents(rows)
+
+    results = [
+        _measure(
+            "save_chunks",
+            "orm_add",
+            rows,
+            _save_chunks_per_row,
+            "orm_chunks",
+            chunks,
+        ),
+        _measure(
+            "save_documents",
+            "orm_add",
+            rows,
+            _save_documents_per_row,
+            "orm_documents",
+            iter(documents),
+            "benchmark.pdf",
+        ),
+    ]
+    for batch_size in batch_sizes:
+        results.append(
+            _measure(
+                "save_chunks",
+                f"bulk_insert_{batch_size}",
+                rows,
+                lambda: db_service.save_chunks(
+                    f"bulk_chunks_{batch_size}",
+                    chunks,
+                    "benchmark",
+                    batch_size=batch_size,
+                ),
+            )
+        )
+        results.append(
+            _measure(
+                "save_documents",
+                f"bulk_insert_{batch_size}",
+                rows,
+                lambda: db_service.save_documents(
+                    f"bulk_documents_{batch_size}",
+                    iter(documents),
+                    "benchmark.pdf",
+                    batch_size=batch_size,
+                ),
+            )
+        )
+
+    file_id = f"bulk_documents_{batch_sizes[-1]}"
+    results.append(
+        _measure_read("get_documents", "orm_detached", _get_documents_orm, file_id)
+    )
+    results.append(
+        _measure_read("get_documents", "records", db_service.get_documents, file_id)
+    )
+    file_id = f"bulk_chunks_{batch_sizes[-1]}"
+    results.append(
+        _measure_read("get_chunks", "orm_detached", _get_chunks_orm, file_id)
+    )
+    for path, include_content in (("records", True), ("records_no_content", False)):
+        results.append(
+            _measure_read(
+                "get_chunks",
+                path,
+                lambda: db_service.get_chunks(
+                    file_id, limit=rows, include_content=include_content
+                )[0],
+            )
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000, help="rows per run")
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 5000],
+        help="batch sizes of the bulk write path",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="rag-db-benchmark-") as workdir:
+        # Point the sessions of the service at a scratch database
+        engine = create_db_engine(f"sqlite:///{Path(workdir) / 'benchmark.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+        try:
+            results = run_benchmark(args.rows, args.batch_sizes)
+        finally:
+            engine.dispose()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,185 @@
 """
 Database models and configuration.
 """
-import os
-from sqlalchemy import create_engine
+import logging
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from models.base import Base
-from models.document import Document, DocumentChunk
+from models.document import Document, DocumentChunk, FileRecord, IngestCheckpoint
 import constants
 
+logger = logging.getLogger("rag-backend.database")
+
 # Database configuration
-DATABASE_URL = f"sqlite:///{constants.DATA_DIR}/rag.db"
+DATABASE_URL = constants.DATABASE_URL
+
+
+def _sqlite_file(url: URL) -> Optional[Path]:
+    """Path of a file-backed SQLite database, None for in-memory and other databases."""
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+    return Path(url.database)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in constants.SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def _engine_options(url: URL) -> Dict[str, Any]:
+    """Keyword arguments of create_engine for a database URL."""
+    if url.get_backend_name() != "sqlite":
+        return {
+            "pool_size": constants.DATABASE_POOL_SIZE,
+            "max_overflow": constants.DATABASE_MAX_OVERFLOW,
+            "pool_timeout": constants.DATABASE_POOL_TIMEOUT,
+            "pool_recycle": constants.DATABASE_POOL_RECYCLE,
+            "pool_pre_ping": True,  # replace connections closed by the server
+            "echo": constants.DATABASE_ECHO,
+        }
+    if _sqlite_file(url) is None:
+        # Each connection to an in-memory database is a new database, keep the default pool
+        return {
+            "connect_args": {"check_same_thread": False},
+            "echo": constants.DATABASE_ECHO,
+        }
+    return {
+        "connect_args": {
+            "check_same_thread": False,  # connections move between threads
+            "timeout": constants.SQLITE_BUSY_TIMEOUT,
+        },
+        "pool_size": constants.DATABASE_POOL_SIZE,
+        "max_overflow": constants.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": constants.DATABASE_POOL_TIMEOUT,
+        "echo": constants.DATABASE_ECHO,
+    }
+
+
+def create_db_engine(url: str = DATABASE_URL) -> Engine:
+    """
+    Create the database engine.
+
+    SQLite connections get the SQLITE_PRAGMAS, WAL mode among them, and wait
+    up to SQLITE_BUSY_TIMEOUT for a write lock instead of failing with
+    "database is locked". Other databases get a connection pool of
+    DATABASE_POOL_SIZE connections plus DATABASE_MAX_OVERFLOW.
+
+    Args:
+        url: SQLAlchemy database URL
+
+    Returns:
+        The engine
+    """
+    url = make_url(url)
+    engine = create_engine(url, **_engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+
+    logger.info(f"Using database {url.render_as_string(hide_password=True)}")
+    return engine
+
+
+def async_database_url(url: str = DATABASE_URL) -> URL:
+    """
+    Get the URL of a database with the async driver of its backend.
+
+    Args:
+        url: SQLAlchemy database URL
+
+    Returns:
+        The URL with the driver from ASYNC_DATABASE_DRIVERS
+
+    Raises:
+        ValueError: If the backend has no known async driver
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in constants.ASYNC_DATABASE_DRIVERS:
+        raise ValueError(
+            f"No async driver for {backend} databases, set ASYNC_DATABASE_URL"
+        )
+    return url.set(drivername=f"{backend}+{constants.ASYNC_DATABASE_DRIVERS[backend]}")
+
+
+def create_async_db_engine(url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create the async database engine used by the request handlers.
+
+    It is configured like the engine of create_db_engine and connects to the
+    same database through an async driver, so queries wait for the database
+    without blocking the event loop.
+
+    Args:
+        url: SQLAlchemy database URL with an async driver, defaults to
+            ASYNC_DATABASE_URL or DATABASE_URL with the async driver
+
+    Returns:
+        The async engine
+    """
+    url = make_url(url or constants.ASYNC_DATABASE_URL or async_database_url())
+    engine = create_async_engine(url, **_engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+    logger.info(f"Using async database {url.render_as_string(hide_password=True)}")
+    return engine
+
 
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # For SQLite
-    echo=False,  # Set to True for SQL logging
-)
+engine = create_db_engine()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async engine and session factory, objects stay readable after commit
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def create_tables():
     """Create all tables in the database."""
     # Ensure data directory exists
     constants.DATA_DIR.mkdir(parents=True, exist_ok=True)
+    database_file = _sqlite_file(engine.url)
+    if database_file is not None:
+        database_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips existing tables, add indexes introduced after a table was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+@asynccontextmanager
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    """Get async database session context manager."""
+    session = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
 
 @contextmanager
 def get_db_session() -> Session:
@@ -46,6 +195,22 @@ def get_db_session() -> Session:
         session.close()
 
 
+def reset_engine():
+    """
+    Drop pooled connections, sync and async, inherited from a parent process.
+
+    Call this at the start of a forked worker process so it opens its own
+    database connections instead of sharing the parent's.
+    """
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+
 def get_db() -> Session:
     """Get database session (for dependency injection)."""
     return SessionLocal()
+
+
+async def dispose_async_engine():
+    """Close the connections of the async engine, at application shutdown."""
+    await async_engine.dispose()
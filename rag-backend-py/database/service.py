@@ -1,135 +1,479 @@
 """
 Database service for managing documents and chunks.
 """
+import base64
+import json
 import uuid
-from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from datetime import datetime
+from typing import Iterable, List, Optional, Dict, Any, Tuple
+from sqlalchemy import and_, func, insert, null, select, tuple_
 import logging
 
-from models.document import Document, DocumentChunk
+import constants
+from models.document import (
+    ChunkRecord,
+    Document,
+    DocumentChunk,
+    DocumentRecord,
+    FileRecord,
+    IngestCheckpoint,
+)
 from .models import get_db_session
 
 logger = logging.getLogger("rag-backend.database")
 
 
-class DatabaseService:
+class BaseDatabaseService:
+    """Queries and row conversions shared by the sync and async services."""
+
+    def _staging_file_id(self, file_id: str) -> str:
+        """Get a unique file ID to stage a file's new documents under while they are saved."""
+        return f"{file_id}.staging-{uuid.uuid4().hex}"
+
+    def _document_row(
+        self,
+        file_id: str,
+        i: int,
+        doc: Any,
+        original_filename: str = None,
+    ) -> Dict[str, Any]:
+        """Convert one LangChain document to the column values of its row."""
+        doc_id = str(uuid.uuid4())
+
+        # Extract page number from metadata if available
+        page_number = None
+        doc_metadata = (
+            doc.metadata.copy() if hasattr(doc, "metadata") and doc.metadata else {}
+        )
+
+        # Save original filename in the first document's metadata
+        if i == 0 and original_filename:
+            doc_metadata["original_filename"] = original_filename
+
+        if hasattr(doc, "metadata") and doc.metadata:
+            page_number = doc.metadata.get("page")
+            # Convert 0-based to 1-based if necessary
+            if isinstance(page_number, int) and page_number >= 0:
+                page_number += 1
+
+        return {
+            "id": doc_id,
+            "file_id": file_id,
+            "page_content": doc.page_content,
+            "doc_metadata": doc_metadata,
+            "page_number": page_number,
+            "created_at": datetime.utcnow(),
+        }
+
+    def _chunk_rows(
+        self,
+        file_id: str,
+        chunks: List[Dict[str, Any]],
+        chunk_strategy: str,
+        window_size: Optional[int],
+        overlap: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Convert chunk dictionaries to the column values of their rows."""
+        created_at = datetime.utcnow()
+        return [
+            {
+                "id": str(uuid.uuid4()),
+                "file_id": file_id,
+                "document_id": chunk_data.get("document_id"),
+                "content": chunk_data["content"],
+                "chunk_metadata": chunk_data.get("metadata", {}),
+                "start_offset": chunk_data.get("start_offset"),
+                "end_offset": chunk_data.get("end_offset"),
+                "chunk_index": i,
+                "chunk_strategy": chunk_strategy,
+                "window_size": window_size,
+                "overlap": overlap,
+                "created_at": created_at,
+            }
+            for i, chunk_data in enumerate(chunks)
+        ]
+
+    def _record_columns(
+        self, model: Any, record_type: Any, skip: Iterable[str] = ()
+    ) -> List[Any]:
+        """Columns selecting the fields of a record type, NULL for skipped ones."""
+        return [
+            null().label(name) if name in skip else getattr(model, name)
+            for name in record_type._fields
+        ]
+
+    def _documents_query(self, file_id: Optional[str], include_content: bool):
+        """Select the DocumentRecord columns of a file's documents, or of all."""
+        columns = self._record_columns(
+            Document, DocumentRecord, () if include_content else ("page_content",)
+        )
+        if file_id is None:
+            return select(*columns).order_by(
+                Document.file_id, Document.page_number, Document.id
+            )
+        return (
+            select(*columns)
+            .where(Document.file_id == file_id)
+            .order_by(Document.page_number, Document.id)
+        )
+
+    def _chunk_page_queries(
+        self,
+        file_id: str,
+        chunk_strategy: Optional[str],
+        page: int,
+        limit: int,
+        cursor: Optional[str],
+        include_content: bool,
+    ) -> Tuple[Any, Any]:
+        """
+        Build the queries of a page of chunks, see DatabaseService.get_chunks.
+
+        Returns:
+            Tuple of (count query, query of the page and one extra row)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        conditions = [DocumentChunk.file_id == file_id]
+        if chunk_strategy:
+            conditions.append(DocumentChunk.chunk_strategy == chunk_strategy)
+        count_query = select(func.count()).select_from(DocumentChunk).where(*conditions)
+
+        columns = self._record_columns(
+            DocumentChunk, ChunkRecord, () if include_content else ("content",)
+        )
+        query = select(*columns).where(*conditions)
+        query = query.order_by(DocumentChunk.chunk_strategy, DocumentChunk.chunk_index)
+        if cursor is not None:
+            after_strategy, after_index = self._decode_chunk_cursor(cursor)
+            # A row value comparison is a single seek into the composite index
+            query = query.where(
+                tuple_(DocumentChunk.chunk_strategy, DocumentChunk.chunk_index)
+                > tuple_(after_strategy, after_index)
+            )
+        else:
+            query = query.offset((page - 1) * limit)
+        # One extra row tells whether there is a next page
+        return count_query, query.limit(limit + 1)
+
+    def _chunk_page(
+        self, chunks: List[ChunkRecord], limit: int
+    ) -> Tuple[List[ChunkRecord], Optional[str]]:
+        """Drop the extra row of a page of chunks and make the next page cursor."""
+        if len(chunks) <= limit:
+            return chunks, None
+        chunks = chunks[:limit]
+        return chunks, self._encode_chunk_cursor(
+            chunks[-1].chunk_strategy, chunks[-1].chunk_index
+        )
+
+    def _encode_chunk_cursor(self, chunk_strategy: str, chunk_index: int) -> str:
+        """Encode the position of a chunk as an opaque page cursor."""
+        position = json.dumps([chunk_strategy, chunk_index]).encode("utf-8")
+        return base64.urlsafe_b64encode(position).decode("ascii")
+
+    def _decode_chunk_cursor(self, cursor: str) -> Tuple[str, int]:
+        """Decode a page cursor into the strategy and index of a chunk."""
+        try:
+            chunk_strategy, chunk_index = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+            )
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        if not isinstance(chunk_strategy, str) or not isinstance(chunk_index, int):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return chunk_strategy, chunk_index
+
+
+class DatabaseService(BaseDatabaseService):
     """Service for database operations."""
 
+    def save_file_record(
+        self,
+        file_id: str,
+        file_name: str,
+        file_size: int,
+        loading_method: Optional[str],
+        storage_path: str,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Add or update a file in the files catalog.
+
+        Args:
+            file_id: File ID
+            file_name: Original file name
+            file_size: File size in bytes
+            loading_method: Loading method used
+            storage_path: Path of the stored original file
+            created_at: Creation time, defaults to now
+        """
+        with get_db_session() as session:
+            session.merge(
+                FileRecord(
+                    id=file_id,
+                    file_name=file_name,
+                    file_size=file_size,
+                    loading_method=loading_method,
+                    storage_path=storage_path,
+                    created_at=created_at or datetime.utcnow(),
+                )
+            )
+            session.commit()
+
+    def get_file_record(self, file_id: str) -> Optional[FileRecord]:
+        """
+        Get a file from the files catalog.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            FileRecord or None if not found
+        """
+        with get_db_session() as session:
+            record = session.get(FileRecord, file_id)
+            if record is not None:
+                session.expunge(record)
+            return record
+
+    def list_file_records(
+        self, page: int = 1, limit: int = 10
+    ) -> Tuple[List[FileRecord], int]:
+        """
+        Get a page of the files catalog, newest first.
+
+        Args:
+            page: Page number (1-indexed)
+            limit: Number of files per page
+
+        Returns:
+            Tuple of (file records, total count)
+        """
+        with get_db_session() as session:
+            total_count = session.query(func.count(FileRecord.id)).scalar()
+            records = (
+                session.query(FileRecord)
+                .order_by(FileRecord.created_at.desc(), FileRecord.id)
+                .offset((page - 1) * limit)
+                .limit(limit)
+                .all()
+            )
+            session.expunge_all()
+            return records, total_count
+
+    def count_file_records(self, storage_path: Optional[str] = None) -> int:
+        """
+        Count files in the files catalog.
+
+        Args:
+            storage_path: Only count files stored at this path
+
+        Returns:
+            Number of files
+        """
+        with get_db_session() as session:
+            query = session.query(func.count(FileRecord.id))
+            if storage_path is not None:
+                query = query.filter(FileRecord.storage_path == storage_path)
+            return query.scalar()
+
+    def get_uncataloged_file_ids(self) -> List[str]:
+        """
+        Get IDs of files that have documents but no files catalog entry.
+
+        Returns:
+            List of file IDs
+        """
+        with get_db_session() as session:
+            cataloged = session.query(FileRecord.id)
+            rows = (
+                session.query(Document.file_id)
+                .filter(Document.file_id.notin_(cataloged))
+                .distinct()
+                .all()
+            )
+            return [row[0] for row in rows]
+
+    def get_first_document_metadata(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the metadata of a file's first document without loading its content.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            Metadata dictionary, or None if the file has no documents
+        """
+        with get_db_session() as session:
+            row = (
+                session.query(Document.doc_metadata)
+                .filter(Document.file_id == file_id)
+                .order_by(Document.page_number, Document.id)
+                .first()
+            )
+            return (row[0] or {}) if row else None
+
     def save_documents(
-        self, file_id: str, documents: List[Any], original_filename: str = None
+        self,
+        file_id: str,
+        documents: Iterable[Any],
+        original_filename: str = None,
+        batch_size: int = constants.DOCUMENT_BATCH_SIZE,
     ) -> List[str]:
         """
         Save loaded documents to database.
 
+        Documents are consumed lazily and written with one multi-row INSERT and
+        commit every batch_size rows, so a generator of documents is persisted
+        without materializing it. They are written under a staging file ID and
+        replace the file's previous documents in one final transaction, so if
+        saving fails part way the staged rows are removed and the previous
+        documents are kept.
+
         Args:
             file_id: File ID
-            documents: List of LangChain Document objects
+            documents: Iterable of LangChain Document objects
             original_filename: Original filename when uploaded
+            batch_size: Number of documents per INSERT and commit
 
         Returns:
             List of document IDs
         """
         document_ids = []
+        staging_id = self._staging_file_id(file_id)
 
         with get_db_session() as session:
-            # Clear existing documents for this file
-            session.query(Document).filter(Document.file_id == file_id).delete()
+            try:
+                rows = []
+                for i, doc in enumerate(documents):
+                    rows.append(
+                        self._document_row(staging_id, i, doc, original_filename)
+                    )
+                    if len(rows) >= batch_size:
+                        session.execute(insert(Document.__table__), rows)
+                        session.commit()
+                        document_ids.extend(row["id"] for row in rows)
+                        rows = []
+
+                if rows:
+                    session.execute(insert(Document.__table__), rows)
+                    document_ids.extend(row["id"] for row in rows)
+
+                # Replace the existing documents for this file
+                session.query(Document).filter(Document.file_id == file_id).delete()
+                session.query(Document).filter(Document.file_id == staging_id).update(
+                    {Document.file_id: file_id}
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                session.query(Document).filter(Document.file_id == staging_id).delete()
+                session.commit()
+                raise
 
-            for i, doc in enumerate(documents):
-                doc_id = str(uuid.uuid4())
+            logger.info(f"Saved {len(document_ids)} documents for file {file_id}")
 
-                # Extract page number from metadata if available
-                page_number = None
-                doc_metadata = (
-                    doc.metadata.copy()
-                    if hasattr(doc, "metadata") and doc.metadata
-                    else {}
-                )
+        return document_ids
 
-                # Save original filename in the first document's metadata
-                if i == 0 and original_filename:
-                    doc_metadata["original_filename"] = original_filename
+    def save_document_batch(
+        self,
+        file_id: str,
+        documents: List[Any],
+        start_index: int,
+        last_key: str,
+        rows: int,
+        file_size: int,
+        original_filename: str = None,
+    ) -> List[str]:
+        """
+        Append a batch of documents and advance the file's ingest checkpoint.
+
+        The documents, the checkpoint and the catalog size are committed in one
+        transaction, so an interrupted ingestion resumes right after the last
+        saved batch without duplicating or losing rows.
 
-                if hasattr(doc, "metadata") and doc.metadata:
-                    page_number = doc.metadata.get("page")
-                    # Convert 0-based to 1-based if necessary
-                    if isinstance(page_number, int) and page_number >= 0:
-                        page_number += 1
+        Args:
+            file_id: File ID
+            documents: LangChain Document objects of the batch
+            start_index: Index of the first document of the batch in the file
+            last_key: JSON encoded key of the last row of the batch
+            rows: Total rows saved for the file, including this batch
+            file_size: Total content size in bytes, including this batch
+            original_filename: Original filename, saved with the file's first document
 
-                db_document = Document(
-                    id=doc_id,
+        Returns:
+            List of document IDs
+        """
+        document_rows = [
+            self._document_row(file_id, start_index + i, doc, original_filename)
+            for i, doc in enumerate(documents)
+        ]
+        with get_db_session() as session:
+            if document_rows:
+                session.execute(insert(Document.__table__), document_rows)
+            session.merge(
+                IngestCheckpoint(
                     file_id=file_id,
-                    page_content=doc.page_content,
-                    doc_metadata=doc_metadata,
-                    page_number=page_number,
+                    last_key=last_key,
+                    rows=rows,
+                    documents=start_index + len(documents),
+                    updated_at=datetime.utcnow(),
                 )
+            )
+            session.query(FileRecord).filter(FileRecord.id == file_id).update(
+                {FileRecord.file_size: file_size}
+            )
 
-                session.add(db_document)
-                document_ids.append(doc_id)
+        return [row["id"] for row in document_rows]
 
-            session.commit()
-            logger.info(f"Saved {len(documents)} documents for file {file_id}")
+    def get_ingest_checkpoint(self, file_id: str) -> Optional[IngestCheckpoint]:
+        """
+        Get the ingest checkpoint of a file.
 
-        return document_ids
+        Args:
+            file_id: File ID
 
-    def get_documents(self, file_id: str) -> List[Document]:
+        Returns:
+            IngestCheckpoint or None if the file has none
+        """
+        with get_db_session() as session:
+            checkpoint = session.get(IngestCheckpoint, file_id)
+            if checkpoint is not None:
+                session.expunge(checkpoint)
+            return checkpoint
+
+    def get_documents(
+        self, file_id: str, include_content: bool = True
+    ) -> List[DocumentRecord]:
         """
         Get all documents for a file.
 
         Args:
             file_id: File ID
+            include_content: Whether to read page_content, None when False
 
         Returns:
-            List of Document objects
+            List of DocumentRecord tuples
         """
         with get_db_session() as session:
-            documents = (
-                session.query(Document)
-                .filter(Document.file_id == file_id)
-                .order_by(Document.page_number, Document.id)
-                .all()
-            )
+            result = session.execute(self._documents_query(file_id, include_content))
+            return [DocumentRecord._make(row) for row in result]
 
-            # Return detached objects
-            return [
-                Document(
-                    id=doc.id,
-                    file_id=doc.file_id,
-                    page_content=doc.page_content,
-                    doc_metadata=doc.doc_metadata,
-                    page_number=doc.page_number,
-                    created_at=doc.created_at,
-                )
-                for doc in documents
-            ]
-
-    def get_all_documents(self) -> List[Document]:
+    def get_all_documents(self, include_content: bool = True) -> List[DocumentRecord]:
         """
         Get all documents from the database.
 
+        Args:
+            include_content: Whether to read page_content, None when False
+
         Returns:
-            List of Document objects
+            List of DocumentRecord tuples
         """
         with get_db_session() as session:
-            documents = (
-                session.query(Document)
-                .order_by(Document.file_id, Document.page_number, Document.id)
-                .all()
-            )
-
-            # Return detached objects
-            return [
-                Document(
-                    id=doc.id,
-                    file_id=doc.file_id,
-                    page_content=doc.page_content,
-                    doc_metadata=doc.doc_metadata,
-                    page_number=doc.page_number,
-                    created_at=doc.created_at,
-                )
-                for doc in documents
-            ]
+            result = session.execute(self._documents_query(None, include_content))
+            return [DocumentRecord._make(row) for row in result]
 
     def save_chunks(
         self,
@@ -138,21 +482,26 @@ class DatabaseService:
         chunk_strategy: str,
         window_size: Optional[int] = None,
         overlap: Optional[int] = None,
+        batch_size: int = constants.CHUNK_BATCH_SIZE,
     ) -> List[str]:
         """
         Save document chunks to database.
 
+        Chunks are written with multi-row INSERTs of batch_size rows, all in
+        one transaction, so a file's chunks are replaced atomically.
+
         Args:
             file_id: File ID
             chunks: List of chunk dictionaries
             chunk_strategy: Chunking strategy used
             window_size: Window size used
             overlap: Overlap used
+            batch_size: Number of chunks per INSERT
 
         Returns:
             List of chunk IDs
         """
-        chunk_ids = []
+        rows = self._chunk_rows(file_id, chunks, chunk_strategy, window_size, overlap)
 
         with get_db_session() as session:
             # Clear existing chunks for this file and strategy
@@ -163,32 +512,17 @@ class DatabaseService:
                 )
             ).delete()
 
-            for i, chunk_data in enumerate(chunks):
-                chunk_id = str(uuid.uuid4())
-
-                db_chunk = DocumentChunk(
-                    id=chunk_id,
-                    file_id=file_id,
-                    document_id=chunk_data.get("document_id"),
-                    content=chunk_data["content"],
-                    chunk_metadata=chunk_data.get("metadata", {}),
-                    start_offset=chunk_data.get("start_offset"),
-                    end_offset=chunk_data.get("end_offset"),
-                    chunk_index=i,
-                    chunk_strategy=chunk_strategy,
-                    window_size=window_size,
-                    overlap=overlap,
+            for start in range(0, len(rows), batch_size):
+                session.execute(
+                    insert(DocumentChunk.__table__), rows[start : start + batch_size]
                 )
 
-                session.add(db_chunk)
-                chunk_ids.append(chunk_id)
-
             session.commit()
             logger.info(
                 f"Saved {len(chunks)} chunks for file {file_id} using strategy {chunk_strategy}"
             )
 
-        return chunk_ids
+        return [row["id"] for row in rows]
 
     def get_chunks(
         self,
@@ -196,60 +530,45 @@ class DatabaseService:
         chunk_strategy: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
-    ) -> Tuple[List[DocumentChunk], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        include_content: bool = True,
+    ) -> Tuple[List[ChunkRecord], Optional[int], Optional[str]]:
         """
-        Get chunks for a file.
+        Get chunks for a file, ordered by strategy and chunk index.
+
+        With a cursor, the page starts right after the chunk the cursor points
+        at and is read as a range of the (file_id, chunk_strategy, chunk_index)
+        index, so every page costs the same. Without one, page selects the
+        page by offset.
 
         Args:
             file_id: File ID
             chunk_strategy: Chunking strategy filter
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             limit: Number of chunks per page
+            cursor: Cursor returned with the previous page
+            include_total: Whether to count the file's chunks
+            include_content: Whether to read the chunk content, None when False
 
         Returns:
-            Tuple of (chunks, total_count)
+            Tuple of (ChunkRecord tuples, total_count or None, cursor of the
+            next page or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
+        count_query, page_query = self._chunk_page_queries(
+            file_id, chunk_strategy, page, limit, cursor, include_content
+        )
         with get_db_session() as session:
-            query = session.query(DocumentChunk).filter(
-                DocumentChunk.file_id == file_id
+            total_count = (
+                session.execute(count_query).scalar() if include_total else None
             )
+            chunks = [ChunkRecord._make(row) for row in session.execute(page_query)]
 
-            if chunk_strategy:
-                query = query.filter(DocumentChunk.chunk_strategy == chunk_strategy)
-
-            # Get total count
-            total_count = query.count()
-
-            # Apply pagination
-            offset = (page - 1) * limit
-            chunks = (
-                query.order_by(DocumentChunk.chunk_index)
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
-
-            # Return detached objects
-            return (
-                [
-                    DocumentChunk(
-                        id=chunk.id,
-                        file_id=chunk.file_id,
-                        document_id=chunk.document_id,
-                        content=chunk.content,
-                        chunk_metadata=chunk.chunk_metadata,
-                        start_offset=chunk.start_offset,
-                        end_offset=chunk.end_offset,
-                        chunk_index=chunk.chunk_index,
-                        chunk_strategy=chunk.chunk_strategy,
-                        window_size=chunk.window_size,
-                        overlap=chunk.overlap,
-                        created_at=chunk.created_at,
-                    )
-                    for chunk in chunks
-                ],
-                total_count,
-            )
+        chunks, next_cursor = self._chunk_page(chunks, limit)
+        return chunks, total_count, next_cursor
 
     def get_file_chunk_strategies(self, file_id: str) -> List[str]:
         """
@@ -273,7 +592,7 @@ class DatabaseService:
 
     def delete_file_data(self, file_id: str) -> None:
         """
-        Delete all documents and chunks for a file.
+        Delete all documents, chunks and the catalog entry for a file.
 
         Args:
             file_id: File ID
@@ -287,6 +606,12 @@ class DatabaseService:
             # Delete documents
             session.query(Document).filter(Document.file_id == file_id).delete()
 
+            # Delete the catalog entry and ingest progress
+            session.query(FileRecord).filter(FileRecord.id == file_id).delete()
+            session.query(IngestCheckpoint).filter(
+                IngestCheckpoint.file_id == file_id
+            ).delete()
+
             session.commit()
             logger.info(f"Deleted all data for file {file_id}")
 
@@ -9,6 +9,7 @@ from typing import List, Optional, Tuple
 import numpy as np
 
 import constants
+from database import AsyncDatabaseService
 from models.embedding import EmbeddingModel, VectorSettings
 
 logger = logging.getLogger("rag-backend.embedding")
@@ -19,6 +20,9 @@ class EmbeddingService:
     Service for handling vector embedding operations.
     """
 
+    def __init__(self):
+        self.db_service = AsyncDatabaseService()
+
     async def get_supported_models(self) -> List[EmbeddingModel]:
         """
         Get a list of supported embedding models.
@@ -58,8 +62,7 @@ class EmbeddingService:
             Tuple of (number of vectors created, vector dimensions, status)
         """
         # Check if file exists
-        file_paths = list(constants.ORIGINAL_FILES_DIR.glob(f"{file_id}.*"))
-        if not file_paths:
+        if await self.db_service.get_file_record(file_id) is None:
             raise FileNotFoundError(f"File with ID {file_id} not found")
 
         # Check if model is supported
@@ -0,0 +1,88 @@
+"""
+Sequential reading of zip and tar archive members.
+"""
+import logging
+import tarfile
+import zipfile
+from pathlib import PurePosixPath
+from typing import BinaryIO, Iterator, Tuple
+
+logger = logging.getLogger("rag-backend.file_loader.archive")
+
+# Zip flag bit telling that member names are UTF-8
+_ZIP_UTF8_FLAG = 0x800
+
+
+def archive_format(path) -> str:
+    """
+    Detect the format of an archive from its content.
+
+    Returns:
+        "zip" or "tar"
+
+    Raises:
+        ValueError: If the file is neither a zip nor a (compressed) tar archive
+    """
+    if zipfile.is_zipfile(path):
+        return "zip"
+    if tarfile.is_tarfile(path):
+        return "tar"
+    raise ValueError("Unsupported archive. Supported formats: zip, tar, tar.gz")
+
+
+def _zip_member_name(info: zipfile.ZipInfo) -> str:
+    if info.flag_bits & _ZIP_UTF8_FLAG:
+        return info.filename
+    # Names without the UTF-8 flag were decoded as cp437, but archives made on
+    # Chinese Windows store them as GBK
+    raw = info.filename.encode("cp437")
+    for encoding in ("utf-8", "gbk"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return info.filename
+
+
+def _skip(name: str) -> bool:
+    """Skip directories and the metadata files added by macOS archivers."""
+    parts = PurePosixPath(name).parts
+    return (
+        not parts
+        or name.endswith("/")
+        or parts[0] == "__MACOSX"
+        or parts[-1].startswith(".")
+    )
+
+
+def iter_members(path) -> Iterator[Tuple[str, BinaryIO]]:
+    """
+    Iterate over the regular files of an archive, in archive order.
+
+    Members are read as a stream, nothing is extracted to disk. Each file
+    object is only readable until the next member is requested, which lets tar
+    archives, including compressed ones, be read in a single forward pass.
+
+    Args:
+        path: Path of the zip or tar archive
+
+    Yields:
+        Tuples of (member path inside the archive, readable file object)
+    """
+    if archive_format(path) == "zip":
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                name = _zip_member_name(info)
+                if info.is_dir() or _skip(name):
+                    continue
+                with archive.open(info) as f:
+                    yield name, f
+    else:
+        # "r|*" reads the archive as a stream with transparent decompression
+        with tarfile.open(path, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile() or _skip(member.name):
+                    continue
+                f = archive.extractfile(member)
+                if f is not None:
+                    yield member.name, f
@@ -0,0 +1,333 @@
+"""
+Benchmark of every registered loading method over the bundled fixtures.
+
+Usage:
+    python -m file_loader.benchmark --output bench.json
+    python -m file_loader.benchmark --types pdf --methods PyPDF Unstructured
+    python -m file_loader.benchmark --baseline bench.json --tolerance 0.2
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import constants
+
+logger = logging.getLogger("rag-backend.file_loader.benchmark")
+
+
+def _peak_rss_mb() -> float:
+    """Peak RSS of this process and of its finished child processes, in MB."""
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _count_pages(path: Path, file_ext: str) -> Optional[int]:
+    if file_ext != "pdf":
+        return None
+    from pypdf import PdfReader
+
+    return len(PdfReader(path).pages)
+
+
+def _run_loader(
+    conn, file_ext: str, loading_method: str, path: str, workdir: str
+) -> None:
+    """Load one file in a fresh process and send the measurements back."""
+    # The data directory is relative, so an empty working directory keeps the
+    # OCR cache and the catalog of previous runs out of the measurement
+    os.chdir(workdir)
+    from file_loader.service import FileLoaderService
+
+    service = FileLoaderService()
+    start = time.perf_counter()
+    try:
+        documents = 0
+        characters = 0
+        for doc in service.lazy_load_file(file_ext, loading_method, Path(path)):
+            documents += 1
+            characters += len(doc.page_content)
+        conn.send(
+            {
+                "status": "success",
+                "wall_seconds": time.perf_counter() - start,
+                "documents": documents,
+                "characters": characters,
+                "peak_rss_mb": _peak_rss_mb(),
+            }
+        )
+    except Exception as e:
+        conn.send(
+            {
+                "status": "failed",
+                "error": f"{type(e).__name__}: {e}",
+                "wall_seconds": time.perf_counter() - start,
+                "peak_rss_mb": _peak_rss_mb(),
+            }
+        )
+    finally:
+        conn.close()
+
+
+def run_case(path: Path, file_ext: str, loading_method: str, timeout: float) -> Dict:
+    """
+    Run one loading method on one file in a separate process.
+
+    A fresh process per case keeps peak RSS and warm caches of one loader
+    from leaking into the next measurement.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    with tempfile.TemporaryDirectory(prefix="rag-benchmark-") as workdir:
+        process = ctx.Process(
+            target=_run_loader,
+            args=(child_conn, file_ext, loading_method, str(path), workdir),
+        )
+        process.start()
+        child_conn.close()
+
+        if parent_conn.poll(timeout):
+            try:
+                result = parent_conn.recv()
+            except EOFError:
+                result = {"status": "failed", "error": "loader process crashed"}
+        else:
+            process.terminate()
+            result = {
+                "status": "timeout",
+                "error": f"timed out after {timeout} seconds",
+            }
+        process.join()
+    return result
+
+
+def discover_cases(
+    fixtures_dir: Path,
+    types: Optional[List[str]] = None,
+    methods: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """List every (file, loading method) pair to benchmark."""
+    cases = []
+    for path in sorted(fixtures_dir.rglob("*")):
+        file_ext = path.suffix.lstrip(".").lower()
+        if not path.is_file() or file_ext not in constants.LOADING_METHODS:
+            continue
+        if types and file_ext not in types:
+            continue
+        for loading_method in constants.LOADING_METHODS[file_ext]:
+            if methods and loading_method not in methods:
+                continue
+            cases.append(
+                {
+                    "file": path.relative_to(fixtures_dir).as_posix(),
+                    "type": file_ext,
+                    "loading_method": loading_method,
+                }
+            )
+    return cases
+
+
+def _rate(amount: Optional[int], seconds: float) -> Optional[float]:
+    if amount is None or seconds <= 0:
+        return None
+    return round(amount / seconds, 2)
+
+
+def run_benchmark(
+    fixtures_dir: Path,
+    types: Optional[List[str]] = None,
+    methods: Optional[List[str]] = None,
+    repeat: int = 1,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Benchmark the loading methods over the fixtures.
+
+    Args:
+        fixtures_dir: Directory searched recursively for fixture files
+        types: Only benchmark these file types
+        methods: Only benchmark these loading methods
+        repeat: Runs per case, the fastest run is reported
+        timeout: Seconds per run, defaults to the loader timeout
+
+    Returns:
+        Report with one result per case and a summary per loading method
+    """
+    results = []
+    for case in discover_cases(fixtures_dir, types, methods):
+        path = fixtures_dir / case["file"]
+        loading_method = case["loading_method"]
+        case_timeout = timeout or constants.LOADER_TIMEOUTS.get(
+            loading_method, constants.LOADER_DEFAULT_TIMEOUT
+        )
+
+        runs = [
+            run_case(path.resolve(), case["type"], loading_method, case_timeout)
+            for _ in range(repeat)
+        ]
+        succeeded = [run for run in runs if run["status"] == "success"]
+        run = min(succeeded, key=lambda r: r["wall_seconds"]) if succeeded else runs[0]
+
+        file_size = path.stat().st_size
+        pages = _count_pages(path, case["type"])
+        wall_seconds = round(run.get("wall_seconds", 0.0), 4)
+        result = case | {
+            "status": run["status"],
+            "bytes": file_size,
+            "pages": pages,
+            "documents": run.get("documents"),
+            "characters": run.get("characters"),
+            "wall_seconds": wall_seconds,
+            "pages_per_second": _rate(pages, wall_seconds) if succeeded else None,
+            "bytes_per_second": _rate(file_size, wall_seconds) if succeeded else None,
+            "peak_rss_mb": run.get("peak_rss_mb"),
+        }
+        if "error" in run:
+            result["error"] = run["error"]
+        results.append(result)
+        logger.info(
+            f"{loading_method} {path}: {result['status']} in {wall_seconds}s, "
+            f"{result['documents']} documents"
+        )
+
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+        "summary": summarize(results),
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate the successful results per loading method and file type."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        key = f"{result['type']}/{result['loading_method']}"
+        entry = summary.setdefault(
+            key,
+            {
+                "files": 0,
+                "failed": 0,
+                "pages": 0,
+                "bytes": 0,
+                "documents": 0,
+                "wall_seconds": 0.0,
+                "max_peak_rss_mb": 0.0,
+            },
+        )
+        if result["status"] != "success":
+            entry["failed"] += 1
+            continue
+        entry["files"] += 1
+        entry["pages"] += result["pages"] or 0
+        entry["bytes"] += result["bytes"]
+        entry["documents"] += result["documents"]
+        entry["wall_seconds"] = round(entry["wall_seconds"] + result["wall_seconds"], 4)
+        entry["max_peak_rss_mb"] = max(
+            entry["max_peak_rss_mb"], result["peak_rss_mb"] or 0.0
+        )
+
+    for entry in summary.values():
+        entry["pages_per_second"] = _rate(entry["pages"] or None, entry["wall_seconds"])
+        entry["bytes_per_second"] = _rate(entry["bytes"], entry["wall_seconds"])
+    return summary
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[Dict[str, Any]]:
+    """
+    Find cases that got slower than the baseline by more than tolerance.
+
+    Returns:
+        One entry per regressed case
+    """
+    previous = {
+        (r["file"], r["loading_method"]): r
+        for r in baseline.get("results", [])
+        if r["status"] == "success"
+    }
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["file"], result["loading_method"]))
+        if before is None:
+            continue
+        if result["status"] != "success":
+            regressions.append(
+                {
+                    "file": result["file"],
+                    "loading_method": result["loading_method"],
+                    "reason": result["status"],
+                }
+            )
+        elif result["wall_seconds"] > before["wall_seconds"] * (1 + tolerance):
+            regressions.append(
+                {
+                    "file": result["file"],
+                    "loading_method": result["loading_method"],
+                    "reason": "slower",
+                    "baseline_seconds": before["wall_seconds"],
+                    "wall_seconds": result["wall_seconds"],
+                }
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--fixtures", type=Path, default=constants.BENCHMARK_FIXTURES_DIR
+    )
+    parser.add_argument("--types", nargs="*", help="file types to benchmark")
+    parser.add_argument("--methods", nargs="*", help="loading methods to benchmark")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case")
+    parser.add_argument("--timeout", type=float, help="seconds per run")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="report to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=constants.BENCHMARK_REGRESSION_TOLERANCE,
+        help="allowed slowdown against the baseline, as a fraction",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    report = run_benchmark(
+        args.fixtures, args.types, args.methods, args.repeat, args.timeout
+    )
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance)
+        exit_code = 1 if report["regressions"] else 0
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
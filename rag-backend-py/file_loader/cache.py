@@ -0,0 +1,135 @@
+"""
+Byte-bounded LRU cache for loaded documents and file information.
+"""
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger("rag-backend.file_loader.cache")
+
+
+def estimate_metadata_size(metadata: Optional[Dict[str, Any]]) -> int:
+    """Roughly estimate the memory used by a metadata dict."""
+    if not metadata:
+        return 0
+    size = sys.getsizeof(metadata)
+    for key, value in metadata.items():
+        size += sys.getsizeof(key)
+        if isinstance(value, dict):
+            size += estimate_metadata_size(value)
+        elif isinstance(value, (list, tuple)):
+            size += sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value)
+        else:
+            size += sys.getsizeof(value)
+    return size
+
+
+def estimate_docs_size(docs: Optional[List[Any]]) -> int:
+    """Roughly estimate the memory used by a list of LangChain documents."""
+    if not docs:
+        return 0
+    size = sys.getsizeof(docs)
+    for doc in docs:
+        size += sys.getsizeof(doc.page_content)
+        size += estimate_metadata_size(getattr(doc, "metadata", None))
+    return size
+
+
+def estimate_file_info_size(file_info: Any) -> int:
+    """Roughly estimate the memory used by a FileInfo and its documents."""
+    size = sys.getsizeof(file_info.file_id) + sys.getsizeof(file_info.file_name)
+    size += sys.getsizeof(file_info.storage_path)
+    return size + estimate_docs_size(file_info.docs)
+
+
+class LRUCache:
+    """
+    LRU cache bounded by the estimated size of its entries in bytes.
+
+    Least recently used entries are evicted once the total estimated size
+    exceeds max_bytes. Entries larger than the whole budget are not cached.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get an entry and mark it as most recently used."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or replace an entry, evicting old entries if needed."""
+        size = self.sizeof(value)
+        with self._lock:
+            self.pop(key)
+            if size > self.max_bytes:
+                logger.info(
+                    f"Not caching {key}: {size} bytes exceeds cache budget of {self.max_bytes} bytes"
+                )
+                return
+
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+                logger.debug(f"Evicted {old_key} from cache")
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return it."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._bytes -= self._sizes.pop(key)
+            return self._entries.pop(key)
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of the cached keys, least recently used first."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache usage and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -1,16 +1,75 @@
-from langchain_community.document_loaders import CSVLoader
+import csv
+from typing import Iterator, Optional
+
+from langchain_core.documents import Document
+
+import constants
+
+
+def _format_row(header, row) -> str:
+    # Same "column: value" layout as langchain's CSVLoader, missing cells are empty
+    lines = [
+        f"{column.strip()}: {row[i].strip() if i < len(row) else ''}"
+        for i, column in enumerate(header)
+    ]
+    # Cells beyond the header are kept together under one key
+    if len(row) > len(header):
+        extra = ", ".join(value.strip() for value in row[len(header) :])
+        lines.append(f"_extra: {extra}")
+    return "\n".join(lines)
+
+
+def lazy_load(
+    path, rows_per_document: Optional[int] = None, encoding: Optional[str] = None
+) -> Iterator[Document]:
+    """
+    Stream a CSV file as documents of consecutive rows.
+
+    Rows are read one at a time, so memory stays bounded by a single row group
+    regardless of the file size.
+
+    Args:
+        path: Path of the CSV file
+        rows_per_document: Number of rows per document
+        encoding: Text encoding of the file, defaults to CSV_ENCODING
+
+    Returns:
+        Iterator of documents
+    """
+    rows_per_document = rows_per_document or constants.CSV_ROWS_PER_DOCUMENT
+    encoding = encoding or constants.CSV_ENCODING
+    source = str(path)
+
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, delimiter=",", quotechar='"')
+        header = next(reader, None)
+        if header is None:
+            return
+
+        lines = []
+        start_row = 0
+        for i, row in enumerate(reader):
+            if not row:
+                continue
+            if not lines:
+                start_row = i
+            lines.append(_format_row(header, row))
+            if len(lines) >= rows_per_document:
+                yield Document(
+                    page_content="\n\n".join(lines),
+                    metadata={"source": source, "row": start_row, "rows": len(lines)},
+                )
+                lines = []
+
+        if lines:
+            yield Document(
+                page_content="\n\n".join(lines),
+                metadata={"source": source, "row": start_row, "rows": len(lines)},
+            )
 
 
 def load(path):
-    loader = CSVLoader(
-        file_path=path,
-        csv_args={
-            "delimiter": ",",
-            "quotechar": '"',
-        },
-    )
-    docs = loader.load()
-    return docs
+    return list(lazy_load(path))
 
 
 def main():
@@ -1,10 +1,13 @@
 from langchain_community.document_loaders import UnstructuredCSVLoader
 
 
-def load(path):
+def lazy_load(path):
     loader = UnstructuredCSVLoader(path)
-    docs = loader.load()
-    return docs
+    return loader.lazy_load()
+
+
+def load(path):
+    return list(lazy_load(path))
 
 
 def main():
@@ -0,0 +1,167 @@
+from datetime import date, datetime, time
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+from langchain_core.documents import Document
+from sqlalchemy import MetaData, Table, create_engine, select
+from sqlalchemy.engine import make_url
+
+import constants
+
+
+class RowBatch(NamedTuple):
+    documents: List[Document]
+    last_key: Any
+    rows: int
+
+
+def source_of(uri: str, table: str) -> str:
+    """Identify a table without leaking the database password."""
+    return f"{make_url(uri).render_as_string(hide_password=True)}#{table}"
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _key_value(column, value: Any) -> Any:
+    """
+    Convert a key read back from a JSON checkpoint to the Python type of its
+    column, e.g. the string of a datetime or Decimal key.
+    """
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if isinstance(value, python_type):
+        return value
+    if python_type in (datetime, date, time):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def _rows_to_documents(
+    rows,
+    columns: List[str],
+    key_index: int,
+    source: str,
+    table: str,
+    rows_per_document: int,
+) -> List[Document]:
+    documents = []
+    for start in range(0, len(rows), rows_per_document):
+        group = rows[start : start + rows_per_document]
+        # Same "column: value" layout as llama_index's DatabaseReader, one row per line
+        text = "\n".join(
+            ", ".join(f"{column}: {value}" for column, value in zip(columns, row))
+            for row in group
+        )
+        documents.append(
+            Document(
+                page_content=text,
+                metadata={
+                    "source": source,
+                    "table": table,
+                    "first_key": _json_value(group[0][key_index]),
+                    "last_key": _json_value(group[-1][key_index]),
+                    "rows": len(group),
+                },
+            )
+        )
+    return documents
+
+
+def lazy_load_batches(
+    uri: str,
+    table: str,
+    key_column: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    after_key: Any = None,
+    batch_size: Optional[int] = None,
+    rows_per_document: Optional[int] = None,
+) -> Iterator[RowBatch]:
+    """
+    Stream a table as batches of documents using keyset pagination.
+
+    Every batch is a separate ``WHERE key > :last ORDER BY key LIMIT n`` query,
+    so no cursor stays open between batches and memory is bounded by one batch.
+    The caller persists each batch before asking for the next one, and can
+    resume after a failure by passing the last saved key as after_key.
+
+    Args:
+        uri: SQLAlchemy database URL
+        table: Table name
+        key_column: Unique, ordered column to paginate on, defaults to the primary key
+        columns: Columns to include, defaults to all columns
+        after_key: Only load rows whose key is greater than this, converted to
+            the type of the key column
+        batch_size: Rows per query
+        rows_per_document: Rows per document
+
+    Returns:
+        Iterator of RowBatch(documents, last_key, rows)
+    """
+    batch_size = batch_size or constants.DB_INGEST_BATCH_SIZE
+    rows_per_document = rows_per_document or constants.DB_ROWS_PER_DOCUMENT
+    if batch_size < 1 or rows_per_document < 1:
+        raise ValueError("batch_size and rows_per_document must be at least 1")
+
+    engine = create_engine(uri)
+    try:
+        db_table = Table(table, MetaData(), autoload_with=engine)
+        if key_column is None:
+            primary_key = list(db_table.primary_key.columns)
+            if len(primary_key) != 1:
+                raise ValueError(
+                    f"Table {table} has no single-column primary key, set key_column"
+                )
+            key_column = primary_key[0].name
+        if key_column not in db_table.c:
+            raise ValueError(f"Column {key_column} not found in table {table}")
+        for column in columns or []:
+            if column not in db_table.c:
+                raise ValueError(f"Column {column} not found in table {table}")
+
+        key = db_table.c[key_column]
+        after_key = _key_value(key, after_key)
+        selected = [db_table.c[c] for c in columns] if columns else list(db_table.c)
+        names = [c.name for c in selected]
+        if key_column not in names:
+            selected.append(key)
+            names.append(key_column)
+        key_index = names.index(key_column)
+        source = source_of(uri, table)
+
+        while True:
+            query = select(*selected).order_by(key).limit(batch_size)
+            if after_key is not None:
+                query = query.where(key > after_key)
+            with engine.connect() as conn:
+                rows = conn.execute(query).all()
+            if not rows:
+                break
+
+            after_key = rows[-1][key_index]
+            yield RowBatch(
+                _rows_to_documents(
+                    rows, names, key_index, source, table, rows_per_document
+                ),
+                after_key,
+                len(rows),
+            )
+            if len(rows) < batch_size:
+                break
+    finally:
+        engine.dispose()
+
+
+def main():
+    for batch in lazy_load_batches("sqlite:///data/rag.db", "files"):
+        print(batch.last_key, batch.rows, batch.documents[0])
+
+
+if __name__ == "__main__":
+    main()
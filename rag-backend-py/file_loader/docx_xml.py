@@ -0,0 +1,217 @@
+"""
+Word document loader reading the document XML directly.
+
+A .docx file is a zip archive whose body lives in word/document.xml. The XML
+is parsed incrementally and every top-level element is discarded once it has
+been read, so only the current section is kept in memory.
+"""
+import logging
+import re
+import zipfile
+from typing import Dict, Iterator, List, Optional
+from xml.etree import ElementTree
+
+from langchain_core.documents import Document
+
+import constants
+
+logger = logging.getLogger("rag-backend.file_loader.docx_xml")
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_HEADING_NAME = re.compile(r"^heading\s*(\d)$")
+
+
+def _heading_styles(archive: zipfile.ZipFile) -> Dict[str, int]:
+    """
+    Map the ids of the heading paragraph styles to their level.
+
+    Style ids depend on the language of Word ("Heading1" in English, "1" in
+    Chinese), so headings are recognized by their built-in name or their
+    outline level instead.
+    """
+    try:
+        styles = ElementTree.fromstring(archive.read("word/styles.xml"))
+    except KeyError:
+        return {}
+
+    levels = {}
+    for style in styles.iter(f"{_W}style"):
+        if style.get(f"{_W}type") != "paragraph":
+            continue
+        style_id = style.get(f"{_W}styleId")
+        name = style.find(f"{_W}name")
+        name = name.get(f"{_W}val", "").lower() if name is not None else ""
+        outline = style.find(f"{_W}pPr/{_W}outlineLvl")
+
+        if name == "title":
+            levels[style_id] = 0
+        elif _HEADING_NAME.match(name):
+            levels[style_id] = int(_HEADING_NAME.match(name).group(1))
+        elif outline is not None and outline.get(f"{_W}val", "").isdigit():
+            levels[style_id] = int(outline.get(f"{_W}val")) + 1
+    return levels
+
+
+def _paragraph_text(paragraph) -> str:
+    parts = []
+    for element in paragraph.iter():
+        if element.tag == f"{_W}t" and element.text:
+            parts.append(element.text)
+        elif element.tag == f"{_W}tab":
+            parts.append("\t")
+        elif element.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts).strip()
+
+
+def _paragraph_level(paragraph, heading_styles: Dict[str, int]) -> Optional[int]:
+    """Heading level of a paragraph, or None for body text."""
+    properties = paragraph.find(f"{_W}pPr")
+    if properties is None:
+        return None
+    outline = properties.find(f"{_W}outlineLvl")
+    if outline is not None and outline.get(f"{_W}val", "").isdigit():
+        level = int(outline.get(f"{_W}val")) + 1
+        # Level 10 is Word's "body text" outline level
+        return level if level < 10 else None
+    style = properties.find(f"{_W}pStyle")
+    if style is not None:
+        return heading_styles.get(style.get(f"{_W}val"))
+    return None
+
+
+class _Section:
+    """Paragraphs under the current heading, flushed as one document."""
+
+    def __init__(self, source: str, headings: List[str], level: Optional[int]):
+        self.source = source
+        self.headings = headings
+        self.level = level
+        self.blocks: List[str] = []
+        self.size = 0
+        self.part = 0
+
+    def add(self, text: str):
+        self.blocks.append(text)
+        self.size += len(text)
+
+    def flush(self, index: int) -> Document:
+        doc = Document(
+            page_content="\n\n".join(self.blocks),
+            metadata={
+                "source": self.source,
+                "section": index,  # parts of a split section share the index
+                "heading": self.headings[-1] if self.headings else "",
+                "headings": list(self.headings),
+                "heading_level": self.level,
+                "part": self.part,
+                "paragraphs": len(self.blocks),
+            },
+        )
+        self.blocks = []
+        self.size = 0
+        self.part += 1
+        return doc
+
+
+def lazy_load(path, max_section_chars: Optional[int] = None) -> Iterator[Document]:
+    """
+    Lazily load a Word document, one document per heading section.
+
+    Each heading starts a new section holding the heading and the paragraphs
+    and tables below it. Sections longer than max_section_chars are split into
+    parts at paragraph boundaries. Tables are rendered one row per line with
+    " | " between cells.
+
+    Args:
+        path: Path of the docx file
+        max_section_chars: Maximum number of characters per document
+
+    Returns:
+        Iterator of documents, with the heading path of the section in the metadata
+    """
+    max_section_chars = max_section_chars or constants.DOCX_MAX_SECTION_CHARS
+    source = str(path)
+
+    with zipfile.ZipFile(path) as archive:
+        heading_styles = _heading_styles(archive)
+        # Heading texts from the top level down to the current section
+        headings: List[str] = []
+        section = _Section(source, [], None)
+        index = 0
+
+        # Number of open elements, w:body is the second one
+        depth = 0
+        body = None
+        table_depth = 0
+        paragraph_depth = 0
+        row: List[str] = []
+        cell: List[str] = []
+
+        with archive.open("word/document.xml") as f:
+            for event, element in ElementTree.iterparse(f, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and tag == f"{_W}body":
+                        body = element
+                    elif tag == f"{_W}tbl":
+                        table_depth += 1
+                    elif tag == f"{_W}p":
+                        paragraph_depth += 1
+                    continue
+
+                depth -= 1
+                if tag == f"{_W}p":
+                    paragraph_depth -= 1
+                    # Text boxes nest paragraphs, the outer one reads their text
+                    if paragraph_depth > 0:
+                        continue
+                    text = _paragraph_text(element)
+                    if text and table_depth:
+                        cell.append(text)
+                    elif text:
+                        level = _paragraph_level(element, heading_styles)
+                        if level is not None:
+                            if section.blocks:
+                                yield section.flush(index)
+                            if section.part:
+                                index += 1
+                            # Keep the ancestors of the new heading
+                            del headings[max(level, 1) - 1 :]
+                            headings.append(text)
+                            section = _Section(source, list(headings), level)
+                        section.add(text)
+                elif tag == f"{_W}tc" and table_depth == 1:
+                    row.append(" ".join(cell))
+                    cell = []
+                elif tag == f"{_W}tr" and table_depth == 1:
+                    if any(row):
+                        section.add(" | ".join(row))
+                    row = []
+                elif tag == f"{_W}tbl":
+                    table_depth -= 1
+
+                if depth == 2 and body is not None:
+                    # A top-level block has been read, drop it from the tree
+                    body.remove(element)
+                    if section.size >= max_section_chars:
+                        yield section.flush(index)
+
+        if section.blocks:
+            yield section.flush(index)
+
+
+def load(path):
+    return list(lazy_load(path))
+
+
+def main():
+    docs = load("./fixtures/山西文旅/云冈石窟.docx")
+    for doc in docs:
+        print(doc.metadata)
+        print(doc.page_content)
+
+
+if __name__ == "__main__":
+    main()
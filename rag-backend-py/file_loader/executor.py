@@ -0,0 +1,228 @@
+"""
+Executor for running CPU-bound document loaders off the event loop.
+"""
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import constants
+from file_loader.error import FileLoadError
+
+logger = logging.getLogger("rag-backend.file_loader.executor")
+
+
+def _ping(delay: float = 0.1) -> int:
+    """Occupy a worker briefly and report its process ID."""
+    time.sleep(delay)
+    return os.getpid()
+
+
+def mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the multiprocessing context worker pools start their processes with.
+
+    Pools are created inside the running server, whose other threads may hold
+    locks at the moment of a fork, so workers are not forked from it.
+    """
+    method = constants.LOADER_START_METHOD
+    if method not in multiprocessing.get_all_start_methods():
+        method = "spawn"
+    return multiprocessing.get_context(method)
+
+
+def map_page_batches(
+    fn: Callable[[str, List[int]], List[Any]],
+    path,
+    pages: List[int],
+    workers: int,
+) -> Iterator[Any]:
+    """
+    Run a page loader on batches of pages in a pool of worker processes.
+
+    Args:
+        fn: Picklable function loading a list of 0-based pages of a file
+        path: Path to the file
+        pages: 0-based page numbers to load
+        workers: Maximum number of worker processes
+
+    Yields:
+        The items returned by fn, in page order
+    """
+    # Twice as many batches as workers keeps the pool busy when some pages are slower
+    batch_size = max(1, math.ceil(len(pages) / (workers * 2)))
+    batches = [pages[i : i + batch_size] for i in range(0, len(pages), batch_size)]
+    with ProcessPoolExecutor(
+        mp_context=mp_context(), max_workers=min(workers, len(batches))
+    ) as pool:
+        # map() yields results in submission order, i.e. page order
+        for items in pool.map(fn, [str(path)] * len(batches), batches):
+            yield from items
+
+
+class LoaderExecutor:
+    """
+    Run loaders in a worker pool and await the result.
+
+    Each loading method gets its own concurrency limit and timeout, so a burst
+    of slow hi_res parses cannot take every worker from the cheaper loaders.
+    """
+
+    def __init__(
+        self,
+        mode: str = constants.LOADER_EXECUTOR,
+        max_workers: int = constants.LOADER_MAX_WORKERS,
+        concurrency: Optional[Dict[str, int]] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        if mode not in ("process", "thread", "inline"):
+            raise ValueError(f"Unsupported loader executor mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.concurrency = (
+            concurrency if concurrency is not None else constants.LOADER_CONCURRENCY
+        )
+        self.timeouts = timeouts if timeouts is not None else constants.LOADER_TIMEOUTS
+        self.initializer = initializer
+        self._pool: Optional[Executor] = None
+        # start() runs in a background thread while requests create the pool
+        self._pool_lock = threading.Lock()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_pool(self) -> Executor:
+        """Create the worker pool on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=mp_context(),
+                        initializer=self.initializer,
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="loader"
+                    )
+                logger.info(
+                    f"Started {self.mode} loader pool with {self.max_workers} workers"
+                )
+            return self._pool
+
+    def _get_semaphore(self, loading_method: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a loading method."""
+        if loading_method not in self._semaphores:
+            limit = self.concurrency.get(
+                loading_method, constants.LOADER_DEFAULT_CONCURRENCY
+            )
+            self._semaphores[loading_method] = asyncio.Semaphore(limit)
+        return self._semaphores[loading_method]
+
+    async def run(self, loading_method: str, fn: Callable, *args: Any) -> Any:
+        """
+        Run a loader function in the pool.
+
+        Args:
+            loading_method: Loading method, used to pick the concurrency limit and timeout
+            fn: Picklable loader function
+            *args: Arguments passed to the loader function
+
+        Returns:
+            The loader result
+        """
+        if self.mode == "inline":
+            return fn(*args)
+
+        timeout = self.timeouts.get(loading_method, constants.LOADER_DEFAULT_TIMEOUT)
+        semaphore = self._get_semaphore(loading_method)
+        await semaphore.acquire()
+        try:
+            job = self._get_pool().submit(fn, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        try:
+            # Shielded, a timeout or cancellation must not detach the job from its slot
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(job)), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise FileLoadError(
+                f"{loading_method} loader timed out after {timeout} seconds"
+            )
+        finally:
+            # A worker cannot be interrupted, so the slot is only given back once
+            # the job is done or was cancelled before it started
+            job.cancel()
+            self._release_when_done(job, semaphore)
+
+    def _release_when_done(self, job: Future, semaphore: asyncio.Semaphore) -> None:
+        """Release a concurrency slot once its job has finished."""
+        if job.done():
+            semaphore.release()
+            return
+
+        loop = asyncio.get_running_loop()
+
+        def release(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass  # the event loop is closed
+
+        job.add_done_callback(release)
+
+    def start(self) -> None:
+        """
+        Start every worker up front.
+
+        Process workers are otherwise spawned on demand, so the first requests
+        would also pay for the initializer.
+
+        Raises:
+            FileLoadError: If the workers do not answer within LOADER_DEFAULT_TIMEOUT
+        """
+        if self.mode == "inline":
+            return
+
+        pool = self._get_pool()
+        if self.mode == "process":
+            # Submitting while no worker is idle spawns a new one, up to max_workers.
+            # A worker only takes tasks once its initializer is done, so keep
+            # pinging until every worker has answered.
+            pids = set()
+            timeout = constants.LOADER_DEFAULT_TIMEOUT
+            deadline = time.monotonic() + timeout
+            try:
+                while len(pids) < self.max_workers:
+                    futures = [pool.submit(_ping) for _ in range(self.max_workers)]
+                    for future in futures:
+                        remaining = max(deadline - time.monotonic(), 0)
+                        pids.add(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                raise FileLoadError(
+                    f"Loader pool started {len(pids)} of {self.max_workers} "
+                    f"workers in {timeout} seconds"
+                )
+            logger.info(f"Loader pool ready with {len(pids)} worker processes")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            logger.info("Loader pool shut down")
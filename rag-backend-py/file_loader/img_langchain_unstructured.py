@@ -1,9 +1,148 @@
-from langchain_community.document_loaders import UnstructuredImageLoader
+import hashlib
+import io
+import logging
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.documents import Document
+from PIL import Image
+from unstructured.partition.image import partition_image
+
+import constants
+from file_loader.parse_cache import ParseCache
+
+logger = logging.getLogger("rag-backend.file_loader.img_langchain_unstructured")
+
+# OCR results are cached by pixel hash, the MD5 of the image as it is OCR'd
+OCR_CACHE_EXT = "pixels"
+
+
+def image_hash(image: Image.Image, hash_size: int = 8) -> str:
+    """
+    Compute the difference hash (dHash) of an image.
+
+    Each bit tells whether a pixel is brighter than its right neighbour in a
+    (hash_size + 1) x hash_size grayscale thumbnail, so the hash survives
+    rescaling, re-encoding and small edits.
+
+    Returns:
+        The hash as a hex string
+    """
+    gray = image.convert("L").resize(
+        (hash_size + 1, hash_size), Image.Resampling.LANCZOS, reducing_gap=2.0
+    )
+    pixels = list(gray.getdata())
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def pixel_hash(image: Image.Image) -> str:
+    """MD5 of an image's decoded pixels, mode and size."""
+    md5 = hashlib.md5(f"{image.mode} {image.size}".encode("utf-8"))
+    md5.update(image.tobytes())
+    return md5.hexdigest()
+
+
+def _prepare(img_path, max_side: int):
+    """Open an image, downscale it to the OCR resolution and hash it."""
+    with Image.open(img_path) as image:
+        # JPEGs are decoded directly at a reduced scale no smaller than max_side
+        image.draft("RGB", (max_side, max_side))
+        image.load()
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    if max(image.size) > max_side:
+        # thumbnail() keeps the aspect ratio and only ever shrinks
+        image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    # The dHash does not depend on scale, so compute it on the smaller image
+    return pixel_hash(image), image_hash(image), image
+
+
+def _ocr(image: Image.Image, img_path) -> List[Document]:
+    """OCR one image, in the same single-document form as UnstructuredImageLoader."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    buffer.seek(0)
+    elements = partition_image(file=buffer, strategy=constants.IMAGE_OCR_STRATEGY)
+    text = "\n\n".join(str(element) for element in elements)
+    return [Document(page_content=text, metadata={"source": str(img_path)})]
+
+
+def _with_source(docs: List[Document], img_path, **extra) -> List[Document]:
+    return [
+        Document(
+            page_content=doc.page_content,
+            metadata=doc.metadata | {"source": str(img_path)} | extra,
+        )
+        for doc in docs
+    ]
+
+
+def load_batch(
+    img_paths: Sequence,
+    max_side: Optional[int] = None,
+    cache: Optional[ParseCache] = None,
+) -> List[List[Document]]:
+    """
+    OCR a batch of images, skipping duplicates.
+
+    Images are downscaled to at most max_side pixels before OCR. An image
+    with the same pixels as an image already in the batch reuses that image's
+    text, and OCR results are cached by pixel hash across batches. The
+    perceptual hash is only recorded in the metadata: distinct pages of text
+    can be within a few bits of each other, so it never decides which text
+    an image gets.
+
+    Args:
+        img_paths: Paths of the images
+        max_side: Longest side in pixels for OCR
+        cache: Cache of OCR results, defaults to the parse cache
+
+    Returns:
+        Documents of every image, in input order
+    """
+    if max_side is None:
+        max_side = constants.IMAGE_OCR_MAX_SIDE
+    if cache is None:
+        cache = ParseCache()
+    options = {"max_side": max_side, "strategy": constants.IMAGE_OCR_STRATEGY}
+
+    results = []
+    # Pixel hashes of the images OCR'd or found in the cache in this batch
+    seen: Dict[str, tuple] = {}
+    ocr_count = 0
+    for img_path in img_paths:
+        pixels, dhash, image = _prepare(img_path, max_side)
+
+        if pixels in seen:
+            source, docs = seen[pixels]
+            results.append(_with_source(docs, img_path, duplicate_of=source))
+            continue
+
+        docs = cache.get(pixels, OCR_CACHE_EXT, "Unstructured", options)
+        if docs is None:
+            docs = _ocr(image, img_path)
+            cache.put(pixels, OCR_CACHE_EXT, "Unstructured", docs, options)
+            ocr_count += 1
+        docs = _with_source(docs, img_path, image_hash=dhash)
+
+        seen[pixels] = (str(img_path), docs)
+        results.append(docs)
+
+    logger.info(f"OCR'd {ocr_count} of {len(results)} images")
+    return results
+
+
+def lazy_load(img_path) -> Iterator[Document]:
+    yield from load_batch([img_path])[0]
 
 
 def load(img_path):
-    loader = UnstructuredImageLoader(file_path=img_path)
-    return loader.load()
+    return list(lazy_load(img_path))
 
 
 def main():
@@ -2,9 +2,13 @@ from langchain_community.document_loaders import UnstructuredMarkdownLoader
 from langchain_core.documents import Document
 
 
-def load(file):
+def lazy_load(file):
     loader = UnstructuredMarkdownLoader(file_path=file, mode="elements")
-    return loader.load()
+    return loader.lazy_load()
+
+
+def load(file):
+    return list(lazy_load(file))
 
 
 def main():
@@ -0,0 +1,211 @@
+"""
+Persistent on-disk cache for parsed documents.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from langchain_core.documents import Document
+
+import constants
+
+logger = logging.getLogger("rag-backend.file_loader.parse_cache")
+
+
+class ParseCache:
+    """
+    Cache of loader output keyed by file MD5, loading method and loader version.
+
+    Entries live under ``<cache_dir>/<loading_method>/v<version>/`` as gzipped
+    JSON lines, one document per line. Bumping a loader's version in
+    LOADER_VERSIONS points it at a fresh directory, so only that loader's
+    entries are invalidated.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = constants.PARSE_CACHE_DIR,
+        versions: Optional[Dict[str, str]] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.versions = versions if versions is not None else constants.LOADER_VERSIONS
+
+    def _entry_path(
+        self,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        version = self.versions.get(loading_method, "0")
+        name = f"{file_md5}.{file_ext}"
+        if options:
+            options_key = json.dumps(options, sort_keys=True, default=str)
+            name += "." + hashlib.md5(options_key.encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / loading_method / f"v{version}" / f"{name}.jsonl.gz"
+
+    def contains(
+        self,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Check whether documents are cached for a file."""
+        return self._entry_path(file_md5, file_ext, loading_method, options).exists()
+
+    def lazy_get(
+        self,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Document]:
+        """
+        Read cached documents one at a time.
+
+        Args:
+            file_md5: MD5 of the file content
+            file_ext: File extension
+            loading_method: Loading method
+            options: Loader options that affect the output
+
+        Yields:
+            Cached documents, in the order they were stored
+        """
+        path = self._entry_path(file_md5, file_ext, loading_method, options)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                yield Document(
+                    page_content=record["page_content"],
+                    metadata=record.get("metadata") or {},
+                )
+
+    def get(
+        self,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[Document]]:
+        """
+        Get cached documents.
+
+        Args:
+            file_md5: MD5 of the file content
+            file_ext: File extension
+            loading_method: Loading method
+            options: Loader options that affect the output
+
+        Returns:
+            List of documents, or None if not cached
+        """
+        if not self.contains(file_md5, file_ext, loading_method, options):
+            return None
+
+        try:
+            docs = list(self.lazy_get(file_md5, file_ext, loading_method, options))
+            logger.info(
+                f"Loaded {len(docs)} documents from parse cache for {loading_method} {file_md5}"
+            )
+            return docs
+        except Exception as e:
+            logger.warning(
+                f"Ignoring unreadable parse cache entry for {loading_method} {file_md5}: {e}"
+            )
+            return None
+
+    def write_through(
+        self,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        docs: Iterable[Document],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Document]:
+        """
+        Pass documents through while storing them in the cache.
+
+        The entry is written to a temporary file and only renamed into place
+        once every document has been consumed, so readers never see a partial
+        entry and an abandoned iteration leaves nothing behind.
+
+        Args:
+            file_md5: MD5 of the file content
+            file_ext: File extension
+            loading_method: Loading method
+            docs: Documents to store
+            options: Loader options that affect the output
+
+        Yields:
+            The stored documents
+        """
+        path = self._entry_path(file_md5, file_ext, loading_method, options)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        count = 0
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(
+                raw, "wt", encoding="utf-8", compresslevel=6
+            ) as f:
+                for doc in docs:
+                    record = {
+                        "page_content": doc.page_content,
+                        "metadata": doc.metadata,
+                    }
+                    f.write(json.dumps(record, ensure_ascii=False, default=str))
+                    f.write("\n")
+                    count += 1
+                    yield doc
+            os.replace(tmp_name, path)
+            logger.info(f"Saved {count} documents to parse cache: {path}")
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def put(
+        self,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        docs: List[Document],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store documents in the cache.
+
+        Args:
+            file_md5: MD5 of the file content
+            file_ext: File extension
+            loading_method: Loading method
+            docs: Documents to store
+            options: Loader options that affect the output
+        """
+        for _ in self.write_through(file_md5, file_ext, loading_method, docs, options):
+            pass
+
+    def delete(self, file_md5: str, loading_method: Optional[str] = None) -> None:
+        """Delete cached entries for a file, for one loader or all of them."""
+        pattern = f"{loading_method or '*'}/v*/{file_md5}.*"
+        for path in self.cache_dir.glob(pattern):
+            path.unlink(missing_ok=True)
+
+    def prune_stale_versions(self) -> None:
+        """Remove entries written by loader versions that are no longer current."""
+        if not self.cache_dir.exists():
+            return
+        for method_dir in self.cache_dir.iterdir():
+            if not method_dir.is_dir():
+                continue
+            current = f"v{self.versions.get(method_dir.name, '0')}"
+            for version_dir in method_dir.iterdir():
+                if version_dir.is_dir() and version_dir.name != current:
+                    shutil.rmtree(version_dir, ignore_errors=True)
+                    logger.info(f"Pruned stale parse cache: {version_dir}")
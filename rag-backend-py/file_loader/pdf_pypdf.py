@@ -1,23 +1,130 @@
 import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
 from langchain_community.document_loaders import PyPDFLoader
+from langchain_core.documents import Document
+from pypdf import PdfReader
+
+import constants
+from file_loader.executor import map_page_batches
 
 logger = logging.getLogger("rag-backend.file_loader.pdf_pypdf")
 
 
-def load(path):
+def _normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize PDF metadata the way PyPDFLoader does: lowercase keys without
+    the leading "/", ISO dates, and str or int values only.
+    """
+    normalized = {}
+    for key, value in metadata.items():
+        if type(value) not in (str, int):
+            value = str(value)
+        key = key.lstrip("/").lower()
+        if key in ("creationdate", "moddate"):
+            try:
+                value = datetime.strptime(
+                    value.replace("'", ""), "D:%Y%m%d%H%M%S%z"
+                ).isoformat("T")
+            except ValueError:
+                pass
+        elif isinstance(value, str):
+            value = value.strip()
+        normalized[key] = value
+    return normalized
+
+
+def _load_pages(path, pages: List[int]) -> List[Document]:
+    """
+    Load the given 0-based pages of a PDF, with the same content and metadata
+    that PyPDFLoader produces for those pages.
+    """
+    reader = PdfReader(path)
+    doc_metadata = _normalize_metadata(
+        {"producer": "PyPDF", "creator": "PyPDF", "creationdate": ""}
+        | dict(reader.metadata or {})
+        | {"source": str(path), "total_pages": len(reader.pages)}
+    )
+
+    # page_labels is recomputed for the whole document on every access
+    page_labels = reader.page_labels
+    docs = []
+    for page_number in pages:
+        text = reader.pages[page_number].extract_text(extraction_mode="plain")
+        docs.append(
+            Document(
+                page_content=text.strip(),
+                metadata=doc_metadata
+                | {
+                    "page": page_number,
+                    "page_label": page_labels[page_number],
+                },
+            )
+        )
+    return docs
+
+
+def is_page_parallel(
+    path, workers: Optional[int] = None, page_threshold: Optional[int] = None
+) -> bool:
+    """Whether lazy_load loads a PDF in page-parallel worker processes."""
+    if workers is None:
+        workers = constants.PYPDF_PARALLEL_WORKERS
+    if page_threshold is None:
+        page_threshold = constants.PYPDF_PARALLEL_PAGE_THRESHOLD
+    return workers > 1 and len(PdfReader(path).pages) >= page_threshold
+
+
+def lazy_load(
+    path, workers: Optional[int] = None, page_threshold: Optional[int] = None
+) -> Iterator[Document]:
+    """
+    Lazily load a PDF file page by page
+
+    PDFs with at least page_threshold pages are split into page batches that
+    are loaded in parallel worker processes.
+
+    Args:
+        path: Path to the PDF file
+        workers: Number of worker processes for page-parallel loading
+        page_threshold: Minimum page count for page-parallel loading
+
+    Yields:
+        Document objects with page content and metadata, in page order
+    """
+    if workers is None:
+        workers = constants.PYPDF_PARALLEL_WORKERS
+    if page_threshold is None:
+        page_threshold = constants.PYPDF_PARALLEL_PAGE_THRESHOLD
+
+    total_pages = len(PdfReader(path).pages)
+    if workers > 1 and total_pages >= page_threshold:
+        logger.info(
+            f"Loading {total_pages} pages of PDF from {path} with {workers} workers"
+        )
+        yield from map_page_batches(
+            _load_pages, path, list(range(total_pages)), workers
+        )
+    else:
+        logger.info(f"Loading PDF from {path} with PyPDFLoader")
+        yield from PyPDFLoader(file_path=path).lazy_load()
+
+
+def load(path, workers: Optional[int] = None, page_threshold: Optional[int] = None):
     """
     Load a PDF file using PyPDFLoader
 
     Args:
         path: Path to the PDF file
+        workers: Number of worker processes for page-parallel loading
+        page_threshold: Minimum page count for page-parallel loading
 
     Returns:
         List of document objects with page content and metadata
     """
     try:
-        logger.info(f"Loading PDF from {path} with PyPDFLoader")
-        loader = PyPDFLoader(file_path=path)
-        docs = loader.load()
+        docs = list(lazy_load(path, workers, page_threshold))
 
         if not docs:
             logger.warning(f"PyPDFLoader returned no documents for {path}")
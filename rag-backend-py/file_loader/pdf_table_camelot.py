@@ -1,15 +1,74 @@
+import logging
+from typing import Iterator, List, Optional
+
 import camelot
+from langchain_core.documents import Document
+
+from file_loader.pdf_tables import (
+    detect_table_pages,
+    lazy_load_table_pages,
+    table_to_document,
+)
+
+logger = logging.getLogger("rag-backend.file_loader.pdf_table_camelot")
 
 
-def load(path):
+def _extract_pages(path: str, pages: List[int]) -> List[Document]:
+    """Extract the tables of the given pages with camelot."""
     # https://camelot-py.readthedocs.io/en/master/user/quickstart.html#
-    tables = camelot.read_pdf(path)
-    print(tables)
+    tables = camelot.read_pdf(path, pages=",".join(str(p + 1) for p in pages))
+
+    docs = []
+    table_indexes = {}
+    for table in tables:
+        # camelot pages are 1-based strings
+        page_number = int(table.page) - 1
+        table_index = table_indexes.get(page_number, 0)
+        table_indexes[page_number] = table_index + 1
+
+        doc = table_to_document(
+            table.df.values.tolist(),
+            {
+                "source": path,
+                "page": page_number,
+                "table_index": table_index,
+                "accuracy": round(table.parsing_report.get("accuracy", 0.0), 2),
+            },
+        )
+        if doc is not None:
+            docs.append(doc)
+    return docs
+
+
+def lazy_load(path, workers: Optional[int] = None) -> Iterator[Document]:
+    """
+    Lazily load the tables of a PDF file, one document per table
+
+    Only pages detected as containing tables are handed to camelot, and those
+    are processed in parallel worker processes.
+
+    Args:
+        path: Path to the PDF file
+        workers: Number of worker processes
+
+    Yields:
+        Table documents, in page order
+    """
+    pages = detect_table_pages(path)
+    yield from lazy_load_table_pages(path, _extract_pages, pages, workers)
+
+
+def load(path, workers: Optional[int] = None) -> List[Document]:
+    return list(lazy_load(path, workers))
 
 
 def main():
-    load("./fixtures/复杂PDF/billionaires_page-1-5.pdf")
+    docs = load("./fixtures/复杂PDF/billionaires_page-1-5.pdf")
+    for doc in docs:
+        print(doc.metadata)
+        print(doc.page_content)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
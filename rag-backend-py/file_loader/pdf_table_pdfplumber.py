@@ -1,16 +1,73 @@
+import logging
+from typing import Iterator, List, Optional
+
 import pdfplumber
+from langchain_core.documents import Document
+
+from file_loader.pdf_tables import (
+    detect_table_pages,
+    lazy_load_table_pages,
+    table_to_document,
+)
+
+logger = logging.getLogger("rag-backend.file_loader.pdf_table_pdfplumber")
 
 
-def load(path):
+def _extract_pages(path: str, pages: List[int]) -> List[Document]:
+    """Extract the tables of the given pages with pdfplumber."""
+    docs = []
     # https://github.com/jsvine/pdfplumber?tab=readme-ov-file#extracting-tables
     with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            print(page.extract_tables(table_settings={}))
+        total_pages = len(pdf.pages)
+        for page_number in pages:
+            page = pdf.pages[page_number]
+            for table_index, table in enumerate(page.find_tables(table_settings={})):
+                doc = table_to_document(
+                    table.extract(),
+                    {
+                        "source": path,
+                        "page": page_number,
+                        "total_pages": total_pages,
+                        "table_index": table_index,
+                        "bbox": [round(v, 2) for v in table.bbox],
+                    },
+                )
+                if doc is not None:
+                    docs.append(doc)
+            # Release the parsed layout of the page
+            page.close()
+    return docs
+
+
+def lazy_load(path, workers: Optional[int] = None) -> Iterator[Document]:
+    """
+    Lazily load the tables of a PDF file, one document per table
+
+    Only pages detected as containing tables are handed to pdfplumber, and
+    those are processed in parallel worker processes.
+
+    Args:
+        path: Path to the PDF file
+        workers: Number of worker processes
+
+    Yields:
+        Table documents, in page order
+    """
+    pages = detect_table_pages(path)
+    yield from lazy_load_table_pages(path, _extract_pages, pages, workers)
+
+
+def load(path, workers: Optional[int] = None) -> List[Document]:
+    return list(lazy_load(path, workers))
 
 
 def main():
-    load("./fixtures/复杂PDF/billionaires_page-1-5.pdf")
+    docs = load("./fixtures/复杂PDF/billionaires_page-1-5.pdf")
+    for doc in docs:
+        print(doc.metadata)
+        print(doc.page_content)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -0,0 +1,290 @@
+"""
+Shared helpers for the PDF table loaders.
+"""
+import logging
+import math
+import re
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from langchain_core.documents import Document
+from pypdf import PdfReader
+
+import constants
+from file_loader.executor import map_page_batches
+
+logger = logging.getLogger("rag-backend.file_loader.pdf_tables")
+
+# Content stream tokens: string literals, hex strings and inline images, which are
+# skipped, XObjects painted with Do, and the operators of graphics state, path
+# construction and path painting with their operands
+_NUMBER = rb"[-+]?(?:\d+\.?\d*|\.\d+)"
+_NAME = rb"/(?P<name>[^\s/\[\]()<>{}%]+)\s+Do(?!\S)"
+_TOKEN = re.compile(
+    rb"\((?:\\.|[^\\)])*\)"
+    rb"|<[0-9A-Fa-f\s]*>"
+    rb"|(?<!\S)BI(?!\S).*?(?<!\S)ID\s.*?(?<!\S)EI(?!\S)"
+    rb"|" + _NAME + rb"|(?<!\S)(?P<operands>(?:" + _NUMBER + rb"\s+)*)"
+    rb"(?P<op>cm|re|[qQml]|[fFBb]\*?|[Ssn])(?!\S)",
+    re.DOTALL,
+)
+_DO = re.compile(_NAME)
+# Text showing operators, after whitespace or their string or array operand
+_TEXT = re.compile(rb"(?<![^\s)\]>])(?:Tj|TJ|'|\")(?!\S)")
+
+# Nesting depth of Form XObjects that are followed
+_MAX_FORM_DEPTH = 4
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def _concat(matrix, ctm):
+    """Concatenate a cm matrix to the current transformation matrix."""
+    a, b, c, d, e, f = matrix
+    a0, b0, c0, d0, e0, f0 = ctm
+    return (
+        a * a0 + b * c0,
+        a * b0 + b * d0,
+        c * a0 + d * c0,
+        c * b0 + d * d0,
+        e * a0 + f * c0 + e0,
+        e * b0 + f * d0 + f0,
+    )
+
+
+def _transform(ctm, x: float, y: float):
+    a, b, c, d, e, f = ctm
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def _rule_length(start, end) -> float:
+    """Length of a line in points if it is horizontal or vertical, else 0."""
+    width, height = abs(end[0] - start[0]), abs(end[1] - start[1])
+    if min(width, height) > constants.PDF_TABLE_RULE_MAX_THICKNESS:
+        return 0.0
+    return max(width, height)
+
+
+def _rect_rules(ctm, x: float, y: float, width: float, height: float) -> int:
+    """Count the ruling lines of a rectangle, 1 if it is thin, else its long edges."""
+    origin = _transform(ctm, x, y)
+    corners = _transform(ctm, x + width, y), _transform(ctm, x, y + height)
+    sides = [math.dist(origin, corner) for corner in corners]
+    if min(sides) <= constants.PDF_TABLE_RULE_MAX_THICKNESS:
+        return int(
+            max(_rule_length(origin, corner) for corner in corners)
+            >= constants.PDF_TABLE_RULE_MIN_LENGTH
+        )
+    return sum(
+        2
+        for corner in corners
+        if _rule_length(origin, corner) >= constants.PDF_TABLE_RULE_MIN_LENGTH
+    )
+
+
+def _form_xobject(resources, name: bytes):
+    """Get a Form XObject of the resources by name, None for images and unknown names."""
+    xobjects = resources.get("/XObject") if resources is not None else None
+    if xobjects is None:
+        return None
+    xobject = xobjects.get_object().get("/" + name.decode("latin-1"))
+    if xobject is None:
+        return None
+    xobject = xobject.get_object()
+    return xobject if xobject.get("/Subtype") == "/Form" else None
+
+
+def _form_resources(form, resources):
+    """Get the resources of a Form XObject, which default to those it is painted with."""
+    form_resources = form.get("/Resources")
+    return form_resources.get_object() if form_resources is not None else resources
+
+
+def _shows_text(data: bytes, resources, depth: int = 0) -> bool:
+    """Whether a content stream, or a Form XObject it paints, shows any text."""
+    if _TEXT.search(data):
+        return True
+    if depth >= _MAX_FORM_DEPTH:
+        return False
+    for name in set(_DO.findall(data)):
+        form = _form_xobject(resources, name)
+        if form is not None and _shows_text(
+            form.get_data(), _form_resources(form, resources), depth + 1
+        ):
+            return True
+    return False
+
+
+def _count_stream_rules(data: bytes, resources, ctm, depth: int = 0) -> int:
+    """Count the ruling lines of a content stream and the Form XObjects it paints."""
+    rules = 0
+    path_rules = 0  # counted once the path is painted
+    saved = []
+    point = None
+    for match in _TOKEN.finditer(data):
+        if match["name"] is not None:
+            form = _form_xobject(resources, match["name"])
+            if form is not None and depth < _MAX_FORM_DEPTH:
+                matrix = [float(x) for x in form.get("/Matrix", _IDENTITY)]
+                rules += _count_stream_rules(
+                    form.get_data(),
+                    _form_resources(form, resources),
+                    _concat(matrix, ctm),
+                    depth + 1,
+                )
+            continue
+
+        op = match["op"]
+        if op is None:
+            continue
+        operands = [float(x) for x in match["operands"].split()]
+        if op == b"q":
+            saved.append(ctm)
+        elif op == b"Q":
+            ctm = saved.pop() if saved else _IDENTITY
+        elif op == b"cm" and len(operands) >= 6:
+            ctm = _concat(operands[-6:], ctm)
+        elif op == b"re" and len(operands) >= 4:
+            path_rules += _rect_rules(ctm, *operands[-4:])
+        elif op == b"m" and len(operands) >= 2:
+            point = _transform(ctm, *operands[-2:])
+        elif op == b"l" and len(operands) >= 2:
+            end = _transform(ctm, *operands[-2:])
+            if point is not None:
+                path_rules += (
+                    _rule_length(point, end) >= constants.PDF_TABLE_RULE_MIN_LENGTH
+                )
+            point = end
+        elif op in (b"m", b"l", b"re", b"cm"):
+            continue
+        else:
+            if op != b"n":
+                rules += path_rules
+            path_rules, point = 0, None
+    return rules
+
+
+def _count_rules(page) -> int:
+    """
+    Count the ruling lines of a page, the lines table extractors find cells with.
+
+    These are the horizontal and vertical lines of painted paths, including
+    those of Form XObjects: thin rectangles, line segments, and the edges of
+    wider rectangles such as shaded rows. Lengths are in points, after the
+    current transformation matrix, and clipping paths are ignored.
+
+    Pages that show no text count no rules, the tables extractors find on them
+    have no text and are dropped. This filters pages whose text is drawn as
+    outlines, such as designed brochures. Rules that are not part of a table
+    still count on pages with text: vector drawings, chart gridlines, page
+    borders and underlines. A string literal with nested parentheses, or an
+    inline image whose data contains EI, can also throw the count off.
+    """
+    contents = page.get_contents()
+    if contents is None:
+        return 0
+
+    data = contents.get_data()
+    resources = page.get("/Resources")
+    if resources is not None:
+        resources = resources.get_object()
+    if not _shows_text(data, resources):
+        return 0
+    return _count_stream_rules(data, resources, _IDENTITY)
+
+
+def detect_table_pages(path, min_rules: Optional[int] = None) -> List[int]:
+    """
+    Find the pages of a PDF that are likely to contain tables.
+
+    Only the raw content streams are scanned, no text or layout is extracted,
+    so this costs a small fraction of running a table extractor on every page.
+
+    Args:
+        path: Path to the PDF file
+        min_rules: Minimum number of ruling lines for a page to be a candidate
+
+    Returns:
+        0-based page numbers of the candidate pages
+    """
+    if min_rules is None:
+        min_rules = constants.PDF_TABLE_MIN_RULES
+
+    reader = PdfReader(path)
+    pages = [
+        page_number
+        for page_number, page in enumerate(reader.pages)
+        if _count_rules(page) >= min_rules
+    ]
+    logger.info(
+        f"Detected {len(pages)} candidate table pages of {len(reader.pages)} in {path}"
+    )
+    return pages
+
+
+def table_to_document(
+    rows: Sequence[Sequence[Optional[str]]], metadata: dict
+) -> Optional[Document]:
+    """
+    Convert extracted table rows into a document.
+
+    The content is a Markdown table whose first row is the header. The header,
+    shape and any extractor-specific fields are kept in the metadata.
+
+    Returns:
+        The document, or None for a table without any text
+    """
+    cells = [
+        [" ".join((cell or "").split()).replace("|", "\\|") for cell in row]
+        for row in rows
+    ]
+    cells = [row for row in cells if any(row)]
+    if not cells:
+        return None
+
+    width = max(len(row) for row in cells)
+    cells = [row + [""] * (width - len(row)) for row in cells]
+    # Drop spacer columns that are empty in every row
+    keep = [i for i in range(width) if any(row[i] for row in cells)]
+    cells = [[row[i] for i in keep] for row in cells]
+    columns = len(keep)
+    lines = [
+        "| " + " | ".join(cells[0]) + " |",
+        "|" + " --- |" * columns,
+    ]
+    lines.extend("| " + " | ".join(row) + " |" for row in cells[1:])
+
+    return Document(
+        page_content="\n".join(lines),
+        metadata=metadata
+        | {"header": cells[0], "rows": len(cells), "columns": columns},
+    )
+
+
+def lazy_load_table_pages(
+    path,
+    extract: Callable[[str, List[int]], List[Document]],
+    pages: List[int],
+    workers: Optional[int] = None,
+) -> Iterator[Document]:
+    """
+    Run a table extractor on the given pages, in parallel worker processes.
+
+    Args:
+        path: Path to the PDF file
+        extract: Picklable function extracting the tables of a list of pages
+        pages: 0-based page numbers to extract tables from
+        workers: Number of worker processes
+
+    Yields:
+        Table documents, in page order
+    """
+    if workers is None:
+        workers = constants.PDF_TABLE_WORKERS
+    if not pages:
+        return
+
+    if workers <= 1 or len(pages) == 1:
+        yield from extract(str(path), pages)
+        return
+
+    yield from map_page_batches(extract, path, pages, workers)
@@ -1,15 +1,133 @@
+import io
+import logging
+from itertools import groupby
+from typing import Iterator, List, Optional
+
+from langchain_core.documents import Document
 from langchain_unstructured import UnstructuredLoader
+from pypdf import PdfReader, PdfWriter
+
+import constants
+
+logger = logging.getLogger("rag-backend.file_loader.pdf_unstructured")
+
 
+def _has_fonts(page) -> bool:
+    """Check whether a page declares any fonts, i.e. can have a text layer."""
+    resources = page.get("/Resources")
+    return bool(resources and resources.get_object().get("/Font"))
+
+
+def _count_images(page) -> int:
+    """Count the image XObjects drawn on a page."""
+    resources = page.get("/Resources")
+    if not resources:
+        return 0
+    xobjects = resources.get_object().get("/XObject")
+    if not xobjects:
+        return 0
+    xobjects = xobjects.get_object()
+    return sum(
+        1
+        for name in xobjects
+        if xobjects[name].get_object().get("/Subtype") == "/Image"
+    )
+
+
+def classify_pages(reader: PdfReader) -> List[str]:
+    """
+    Pick a partition strategy for each page from its text layer.
+
+    Pages with little extractable text (scans) or many images need layout
+    detection and OCR, so they use "hi_res". Everything else uses "fast".
+    """
+    strategies = []
+    for page in reader.pages:
+        # Pages without fonts are pure images, skip the text extraction
+        text = (page.extract_text() or "") if _has_fonts(page) else ""
+        text_chars = len("".join(text.split()))
+        if (
+            text_chars < constants.UNSTRUCTURED_AUTO_MIN_TEXT_CHARS
+            or _count_images(page) > constants.UNSTRUCTURED_AUTO_MAX_IMAGES
+        ):
+            strategies.append("hi_res")
+        else:
+            strategies.append("fast")
+    return strategies
+
+
+def _lazy_load_pages(reader: PdfReader, path, start: int, stop: int, strategy: str):
+    """Partition pages [start, stop) with the given strategy."""
+    writer = PdfWriter()
+    for page_number in range(start, stop):
+        writer.add_page(reader.pages[page_number])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
 
-def load(path):
     loader = UnstructuredLoader(
-        file_path=path, strategy="hi_res", partition_via_api=False, coordiantes=True
+        file=buffer,
+        strategy=strategy,
+        partition_via_api=False,
+        coordiantes=True,
+        metadata_filename=str(path),
+        starting_page_number=start + 1,
     )
-    docs = []
     for doc in loader.lazy_load():
-        docs.append(doc)
+        doc.metadata["source"] = str(path)
+        yield doc
+
+
+def _lazy_load_auto(path) -> Iterator[Document]:
+    reader = PdfReader(path)
+    strategies = classify_pages(reader)
+    hi_res_pages = strategies.count("hi_res")
+    logger.info(
+        f"Auto strategy for {path}: {hi_res_pages} hi_res pages, "
+        f"{len(strategies) - hi_res_pages} fast pages"
+    )
+
+    # A single strategy for the whole file needs no splitting
+    if len(set(strategies)) <= 1:
+        yield from _lazy_load(path, strategies[0] if strategies else "fast")
+        return
+
+    # Partition each run of consecutive pages that share a strategy
+    start = 0
+    for strategy, run in groupby(strategies):
+        stop = start + len(list(run))
+        yield from _lazy_load_pages(reader, path, start, stop, strategy)
+        start = stop
+
+
+def _lazy_load(path, strategy: str) -> Iterator[Document]:
+    loader = UnstructuredLoader(
+        file_path=path, strategy=strategy, partition_via_api=False, coordiantes=True
+    )
+    yield from loader.lazy_load()
+
+
+def lazy_load(path, strategy: Optional[str] = None) -> Iterator[Document]:
+    """
+    Lazily load a PDF file with Unstructured.
+
+    Args:
+        path: Path to the PDF file
+        strategy: "hi_res", "fast", or "auto" to choose per page from the text
+            layer. Defaults to UNSTRUCTURED_PDF_STRATEGY.
+
+    Yields:
+        Documents, one per element
+    """
+    strategy = strategy or constants.UNSTRUCTURED_PDF_STRATEGY
+    if strategy == "auto":
+        yield from _lazy_load_auto(path)
+    else:
+        yield from _lazy_load(path, strategy)
+
 
-    return docs
+def load(path, strategy: Optional[str] = None):
+    return list(lazy_load(path, strategy))
 
 
 def main():
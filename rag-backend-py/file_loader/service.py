@@ -1,38 +1,94 @@
 """
 File loader service for handling file operations.
 """
+import asyncio
 import logging
 import os
 import uuid
 import hashlib
+import json
+import tempfile
+import time
 from datetime import datetime
-from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from pathlib import Path, PurePosixPath
+from typing import (
+    Any,
+    BinaryIO,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import urlparse
+
+import aiohttp
 from langchain_core.documents import Document
+from sqlalchemy.exc import ArgumentError
 
 from fastapi import UploadFile
 
 import constants
-from models.file import FileDetailInfo, FileInfo
-from database import DatabaseService
-
+from models.file import (
+    ArchiveIngestJob,
+    DatabaseIngestJob,
+    DatabaseIngestRequest,
+    FileDetailInfo,
+    FileInfo,
+    FileIngestJob,
+    FileIngestRequest,
+    FileIngestResult,
+    WebIngestJob,
+    WebIngestRequest,
+)
+from database import (
+    AsyncDatabaseService,
+    DatabaseService,
+    dispose_async_engine,
+    reset_engine,
+)
+
+from file_loader.archive import archive_format, iter_members as iter_archive_members
+from file_loader.cache import LRUCache, estimate_docs_size, estimate_file_info_size
 from file_loader.error import FileLoadError
+from file_loader.executor import LoaderExecutor
+from file_loader.parse_cache import ParseCache
+from file_loader.unstructured_worker import init_worker as init_unstructured_worker
+from file_loader.web_cache import WebCache
+
+from file_loader.pdf_pypdf import lazy_load as PDFPyPDFLoader
+from file_loader.pdf_pypdf import is_page_parallel as pypdf_is_page_parallel
+from file_loader.pdf_unstructured import lazy_load as PDFUnstructuredLoader
+from file_loader.pdf_table_camelot import lazy_load as PDFCamelotLoader
+from file_loader.pdf_table_pdfplumber import lazy_load as PDFPlumberLoader
+
+from file_loader.csv_langchain import lazy_load as CSVLangchainLoader
+from file_loader.csv_unstructured import lazy_load as CSVUnstructuredLoader
 
-from file_loader.pdf_pypdf import load as PDFPyPDFLoader
-from file_loader.pdf_unstructured import load as PDFUnstructuredLoader
-from file_loader.pdf_table_camelot import load as PDFCamelotLoader
-from file_loader.pdf_table_pdfplumber import load as PDFPlumberLoader
+from file_loader.txt_langchain_textloader import lazy_load as TxtLangchainLoader
 
-from file_loader.csv_langchain import load as CSVLangchainLoader
-from file_loader.csv_unstructured import load as CSVUnstructuredLoader
+from file_loader.xlsx_openpyxl import lazy_load as XlsxOpenPyXLLoader
 
-from file_loader.txt_langchain_textloader import load as TxtLangchainLoader
+from file_loader.docx_xml import lazy_load as DocxXMLLoader
 
-from file_loader.img_langchain_unstructured import load as ImgUnstructuredLoader
+from file_loader.img_langchain_unstructured import lazy_load as ImgUnstructuredLoader
+from file_loader.img_langchain_unstructured import load_batch as ImgBatchLoader
 
-from file_loader.ppt_unstructured import load as PPTUnstructuredLoader
+from file_loader.ppt_unstructured import lazy_load as PPTUnstructuredLoader
 
-from file_loader.md_langchain_unstructured import load as MDUnstructuredLoader
+from file_loader.md_langchain_unstructured import lazy_load as MDUnstructuredLoader
+
+from file_loader.db_sqlalchemy import lazy_load_batches as DBBatchLoader
+from file_loader.db_sqlalchemy import source_of as db_source_of
+
+from file_loader.web_langchain_webbaseloader import fetch as fetch_page
+from file_loader.web_langchain_webbaseloader import parse as WebPageParser
+from file_loader.web_langchain_webbaseloader import (
+    PublicResolver,
+    public_hosts_trace_config,
+)
 
 
 logger = logging.getLogger("rag-backend.file_loader")
@@ -43,17 +99,184 @@ class FileLoaderService:
     Service for handling file operations like upload, listing, and deletion.
     """
 
-    # Cache structure: {md5: {loading_method: docs}}
-    _docs_cache: Dict[str, Dict[str, List]] = {}
-    _file_cache: Dict[str, FileInfo] = {}
+    # Cache structure: {(file_id, loading_method): docs}, bounded by estimated size
+    _docs_cache = LRUCache(constants.DOCS_CACHE_MAX_BYTES, estimate_docs_size)
+    # Cache structure: {file_id: FileInfo}, bounded by estimated size
+    _file_cache = LRUCache(constants.FILE_CACHE_MAX_BYTES, estimate_file_info_size)
+
+    # Parse results persisted across restarts and workers
+    parse_cache = ParseCache()
+
+    # HTTP validators of ingested web pages, for conditional refresh crawls
+    web_cache = WebCache()
+
+    # Shared pool that runs the CPU-bound loaders off the event loop
+    loader_executor = LoaderExecutor(initializer=reset_engine)
+    # Resident pool for the Unstructured loaders, whose workers keep models loaded
+    unstructured_executor = LoaderExecutor(
+        max_workers=constants.UNSTRUCTURED_WORKERS,
+        initializer=init_unstructured_worker,
+    )
+
+    # Bulk ingestion jobs: {job_id: FileIngestJob}
+    _ingest_jobs: Dict[str, FileIngestJob] = {}
+    _ingest_tasks: Set[asyncio.Task] = set()
 
     def __init__(self):
+        # Sync service for loader threads and processes, async one for the event loop
         self.db_service = DatabaseService()
+        self.async_db_service = AsyncDatabaseService()
 
     async def upload_file(self, file: UploadFile, loading_method: str) -> FileInfo:
         filename = file.filename or "unnamed_file"
         file_ext = Path(filename).suffix.lstrip(".").lower()
+        self._check_loading_method(file_ext, loading_method)
+
+        file_md5, file_size, storage_path = await self._store_upload(file, file_ext)
+
+        return await self._load_and_save(
+            storage_path, file_md5, file_size, file_ext, filename, loading_method
+        )
+
+    async def upload_files(
+        self, files: List[UploadFile], loading_method: str
+    ) -> List[FileInfo]:
+        """
+        Upload several files at once.
+
+        Images are OCR'd together, IMAGE_BATCH_SIZE per worker call, so
+        near-duplicate images of the upload are only OCR'd once. Other files
+        are loaded like single uploads.
+
+        Args:
+            files: Uploaded files
+            loading_method: Loading method for every file
+
+        Returns:
+            File information of every file, in upload order
+        """
+        # Validate every file before storing any of them
+        uploads = []
+        for file in files:
+            filename = file.filename or "unnamed_file"
+            file_ext = Path(filename).suffix.lstrip(".").lower()
+            self._check_loading_method(file_ext, loading_method)
+            uploads.append((file, filename, file_ext))
+
+        stored = []
+        for file, filename, file_ext in uploads:
+            file_md5, file_size, storage_path = await self._store_upload(file, file_ext)
+            stored.append((storage_path, file_md5, file_size, file_ext, filename))
+
+        # OCR the images in batches, the executor bounds how many run at once
+        images = [
+            item
+            for item in stored
+            if item[3] in constants.IMAGE_TYPES and loading_method == "Unstructured"
+        ]
+        batches = [
+            images[start : start + constants.IMAGE_BATCH_SIZE]
+            for start in range(0, len(images), constants.IMAGE_BATCH_SIZE)
+        ]
+        batch_results = await asyncio.gather(
+            *(
+                self._get_executor(loading_method).run(
+                    loading_method, ImgBatchLoader, [item[0] for item in batch]
+                )
+                for batch in batches
+            )
+        )
+        image_docs = {}
+        for batch, batch_docs in zip(batches, batch_results):
+            for item, docs in zip(batch, batch_docs):
+                image_docs[item[0]] = docs
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self._load_and_save(*item, loading_method, image_docs.get(item[0]))
+                    for item in stored
+                )
+            )
+        )
+
+    async def _store_upload(
+        self, file: UploadFile, file_ext: str
+    ) -> Tuple[str, int, Path]:
+        """
+        Store an upload by content hash.
+
+        Returns:
+            Tuple of (file md5, file size, storage path)
+        """
+        # Hash the upload while streaming it to disk, so it is read only once
+        file_md5, file_size, tmp_path = await self._spool_upload(file)
+        storage_path = self._store_blob(tmp_path, file_md5, file_ext)
+
+        # Reset file pointer to allow rereading if needed
+        await file.seek(0)
+        return file_md5, file_size, storage_path
+
+    async def ingest_path(
+        self, path: Path, loading_method: Optional[str] = None
+    ) -> FileInfo:
+        """
+        Ingest a file that is already on the server.
+
+        Args:
+            path: Path of the file
+            loading_method: Loading method, defaults to the first supported
+                method for the file extension
+
+        Returns:
+            File information
+        """
+        file_ext = path.suffix.lstrip(".").lower()
+        if loading_method is None:
+            loading_method = self._default_loading_method(file_ext)
+        self._check_loading_method(file_ext, loading_method)
+
+        file_md5, file_size, tmp_path = await asyncio.to_thread(self._spool_path, path)
+        storage_path = self._store_blob(tmp_path, file_md5, file_ext)
+
+        return await self._load_and_save(
+            storage_path, file_md5, file_size, file_ext, path.name, loading_method
+        )
 
+    def _blob_path(self, file_md5: str, file_ext: str) -> Path:
+        """
+        Get the storage path of an original file. Originals are keyed by
+        content only, so every loading method shares one copy of the bytes.
+        """
+        return constants.ORIGINAL_FILES_DIR / f"{file_md5}.{file_ext}"
+
+    def _store_blob(self, tmp_path: Path, file_md5: str, file_ext: str) -> Path:
+        """
+        Move a spooled file to its storage path, or drop it if the same bytes
+        are already stored.
+
+        Returns:
+            Storage path of the file
+        """
+        storage_path = self._blob_path(file_md5, file_ext)
+        if storage_path.exists():
+            tmp_path.unlink(missing_ok=True)
+            logger.info(f"File already stored, skipping write: {storage_path}")
+        else:
+            os.replace(tmp_path, storage_path)
+            logger.info(f"File saved: {storage_path}")
+        return storage_path
+
+    def _default_loading_method(self, file_ext: str) -> str:
+        """Get the first supported loading method for a file extension."""
+        loading_methods = constants.LOADING_METHODS.get(file_ext)
+        if not loading_methods:
+            valid_types = ", ".join(constants.ALLOWED_FILE_TYPES)
+            raise ValueError(f"Unsupported file type. Supported types: {valid_types}")
+        return loading_methods[0]
+
+    def _check_loading_method(self, file_ext: str, loading_method: str) -> None:
+        """Raise ValueError if the extension or loading method is unsupported."""
         # Check extension
         if file_ext not in constants.ALLOWED_FILE_TYPES:
             valid_types = ", ".join(constants.ALLOWED_FILE_TYPES)
@@ -65,42 +288,62 @@ class FileLoaderService:
                 f"Unsupported loading methods for {file_ext}. Supported methods: {loading_methods}"
             )
 
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
+    async def _load_and_save(
+        self,
+        storage_path: Path,
+        file_md5: str,
+        file_size: int,
+        file_ext: str,
+        filename: str,
+        loading_method: str,
+        docs: Optional[List[Document]] = None,
+    ) -> FileInfo:
+        """
+        Load the documents of a stored file and save them.
 
-        # Check size limitation
-        if file_size > constants.MAX_FILE_SIZE:
-            max_size_mb = constants.MAX_FILE_SIZE / (1024 * 1024)
-            raise FileLoadError(f"File too large. Maximum size: {max_size_mb} MB")
+        Args:
+            storage_path: Path of the stored original file
+            file_md5: MD5 of the file content
+            file_size: File size in bytes
+            file_ext: File extension
+            filename: Original file name
+            loading_method: Loading method
+            docs: Documents already loaded for the file
 
-        # Calculate file md5 based on the content
-        file_md5 = hashlib.md5(content).hexdigest()
+        Returns:
+            File information
+        """
         file_id = loading_method + "_" + file_md5
 
-        # Build path
-        storage_path = constants.ORIGINAL_FILES_DIR / f"{file_id}.{file_ext}"
-
-        # Save file
-        file_exists = storage_path.exists()
-        if not file_exists:
-            with open(storage_path, "wb") as f:
-                f.write(content)
-            logger.info(f"File saved: {storage_path}")
+        if docs is not None:
+            self._docs_cache.put((file_id, loading_method), docs)
+            document_count = len(
+                await self.async_db_service.save_documents(file_id, docs, filename)
+            )
+        elif file_size >= constants.LAZY_LOAD_MIN_FILE_SIZE:
+            # Stream documents from the loader into the database in batches
+            docs = None
+            document_count = await self._get_executor(loading_method).run(
+                await self._concurrency_key(file_ext, loading_method, storage_path),
+                self._stream_docs_to_database,
+                file_id,
+                file_md5,
+                file_ext,
+                loading_method,
+                storage_path,
+                filename,
+            )
         else:
-            logger.info(f"File already exists: {storage_path}")
-
-        # Reset file pointer to allow rereading if needed
-        await file.seek(0)
-
-        # Get or load documents based on the md5 and loading_method
-        docs = self._get_or_load_docs(file_id, file_ext, loading_method, storage_path)
+            # Get or load documents based on the md5 and loading_method
+            docs = await self._get_or_load_docs(
+                file_id, file_md5, file_ext, loading_method, storage_path
+            )
 
-        # Save documents to database
-        document_ids = self.db_service.save_documents(file_id, docs, filename)
-        logger.info(
-            f"Saved {len(document_ids)} documents to database for file {file_id}"
-        )
+            # Save documents to database
+            document_count = len(
+                await self.async_db_service.save_documents(file_id, docs, filename)
+            )
+        logger.info(f"Saved {document_count} documents to database for file {file_id}")
 
         # Return file info
         file_info = FileInfo(
@@ -113,18 +356,178 @@ class FileLoaderService:
             docs=docs,
         )
 
-        # Cache file info
-        self._file_cache[file_info.file_id] = file_info
+        # Record the file in the files catalog
+        await self.async_db_service.save_file_record(
+            file_id=file_id,
+            file_name=filename,
+            file_size=file_size,
+            loading_method=loading_method,
+            storage_path=str(storage_path),
+            created_at=file_info.created_at,
+        )
+
+        # Cache file info, streamed files have no docs in memory and get_file
+        # reads them from the database instead
+        if docs is not None:
+            self._file_cache.put(file_info.file_id, file_info)
+        else:
+            self._file_cache.pop(file_info.file_id)
         return file_info
 
-    def _get_or_load_docs(
-        self, file_id: str, file_ext: str, loading_method: str, path: Path
+    async def _hash_upload(
+        self,
+        file: UploadFile,
+        dst: Optional[BinaryIO] = None,
+        max_size: Optional[int] = None,
+    ) -> Tuple[str, int]:
+        """
+        Read an upload in fixed-size blocks, computing its MD5 and optionally
+        copying it to dst.
+
+        Only one block is held in memory at a time. The upload is rejected as
+        soon as it exceeds max_size.
+
+        Args:
+            file: Uploaded file
+            dst: Optional binary file to copy the content to
+            max_size: Maximum size in bytes, defaults to MAX_FILE_SIZE
+
+        Returns:
+            Tuple of (file md5, file size)
+        """
+        max_size = max_size or constants.MAX_FILE_SIZE
+        md5 = hashlib.md5()
+        file_size = 0
+        while True:
+            block = await file.read(constants.UPLOAD_CHUNK_SIZE)
+            if not block:
+                break
+
+            file_size += len(block)
+            # Check size limitation
+            if file_size > max_size:
+                max_size_mb = max_size / (1024 * 1024)
+                raise FileLoadError(f"File too large. Maximum size: {max_size_mb} MB")
+
+            md5.update(block)
+            if dst is not None:
+                dst.write(block)
+
+        return md5.hexdigest(), file_size
+
+    async def _spool_upload(
+        self, file: UploadFile, max_size: Optional[int] = None
+    ) -> Tuple[str, int, Path]:
+        """
+        Stream an upload to a temporary file in fixed-size blocks.
+
+        Args:
+            file: Uploaded file
+            max_size: Maximum size in bytes, defaults to MAX_FILE_SIZE
+
+        Returns:
+            Tuple of (file md5, file size, temporary file path)
+        """
+        fd, tmp_path = self._make_temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                file_md5, file_size = await self._hash_upload(file, f, max_size)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return file_md5, file_size, tmp_path
+
+    def _hash_path(self, path: Path, dst: Optional[BinaryIO] = None) -> Tuple[str, int]:
+        """
+        Read a server-side file in fixed-size blocks, computing its MD5 and
+        optionally copying it to dst.
+
+        Args:
+            path: Path of the file
+            dst: Optional binary file to copy the content to
+
+        Returns:
+            Tuple of (file md5, file size)
+        """
+        if path.stat().st_size > constants.MAX_FILE_SIZE:
+            max_size_mb = constants.MAX_FILE_SIZE / (1024 * 1024)
+            raise FileLoadError(f"File too large. Maximum size: {max_size_mb} MB")
+
+        with open(path, "rb") as src:
+            return self._hash_stream(src, dst)
+
+    def _hash_stream(
+        self, src: BinaryIO, dst: Optional[BinaryIO] = None
+    ) -> Tuple[str, int]:
+        """
+        Read a binary stream in fixed-size blocks, computing its MD5 and
+        optionally copying it to dst. The stream is rejected as soon as it
+        exceeds MAX_FILE_SIZE.
+
+        Returns:
+            Tuple of (file md5, file size)
+        """
+        md5 = hashlib.md5()
+        file_size = 0
+        while True:
+            block = src.read(constants.UPLOAD_CHUNK_SIZE)
+            if not block:
+                break
+            file_size += len(block)
+            if file_size > constants.MAX_FILE_SIZE:
+                max_size_mb = constants.MAX_FILE_SIZE / (1024 * 1024)
+                raise FileLoadError(f"File too large. Maximum size: {max_size_mb} MB")
+            md5.update(block)
+            if dst is not None:
+                dst.write(block)
+
+        return md5.hexdigest(), file_size
+
+    def _spool_path(self, path: Path) -> Tuple[str, int, Path]:
+        """
+        Copy a server-side file to a temporary file in fixed-size blocks.
+
+        Args:
+            path: Path of the file
+
+        Returns:
+            Tuple of (file md5, file size, temporary file path)
+        """
+        fd, tmp_path = self._make_temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                file_md5, file_size = self._hash_path(path, f)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return file_md5, file_size, tmp_path
+
+    def _make_temp_file(self) -> Tuple[int, Path]:
+        """Create a temporary file next to the stored originals, so it can be renamed into place."""
+        constants.ORIGINAL_FILES_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=constants.ORIGINAL_FILES_DIR, prefix=".upload-", suffix=".tmp"
+        )
+        return fd, Path(tmp_name)
+
+    async def _get_or_load_docs(
+        self,
+        file_id: str,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        path: Path,
     ):
         """
-        Get documents from cache or load and cache them
+        Get documents from the memory cache, then the parse cache on disk,
+        or load and cache them
 
         Args:
-            file_id: File ID (MD5)
+            file_id: File ID
+            file_md5: MD5 of the file content
+            file_ext: File extension
             loading_method: Loading method
             path: File path
 
@@ -132,31 +535,143 @@ class FileLoaderService:
             List of loaded documents
         """
         # Check cache
-        if file_id in self._docs_cache and loading_method in self._docs_cache[file_id]:
+        docs = self._docs_cache.get((file_id, loading_method))
+        if docs is not None:
             logger.info(
                 f"Using cached docs for file {file_id} with method {loading_method}"
             )
-            return self._docs_cache[file_id][loading_method]
+            return docs
 
-        # Load documents
-        docs = self.load_file(file_ext, loading_method, path)
+        # Check the parse cache on disk
+        options = self._loader_options(file_ext, loading_method)
+        docs = await asyncio.to_thread(
+            self.parse_cache.get, file_md5, file_ext, loading_method, options
+        )
+
+        if docs is None:
+            # Load documents in the loader pool
+            docs = await self._get_executor(loading_method).run(
+                await self._concurrency_key(file_ext, loading_method, path),
+                self.load_file,
+                file_ext,
+                loading_method,
+                path,
+            )
+            await asyncio.to_thread(
+                self.parse_cache.put, file_md5, file_ext, loading_method, docs, options
+            )
 
         # Update cache
-        if file_id not in self._docs_cache:
-            self._docs_cache[file_id] = {}
-        self._docs_cache[file_id][loading_method] = docs
+        self._docs_cache.put((file_id, loading_method), docs)
 
         return docs
 
+    def _stream_docs_to_database(
+        self,
+        file_id: str,
+        file_md5: str,
+        file_ext: str,
+        loading_method: str,
+        path: Path,
+        original_filename: str,
+    ) -> int:
+        """
+        Load documents lazily and save them to the database in batches.
+
+        Runs in the loader pool. Documents come from the parse cache when
+        present, otherwise from the loader while being written to the parse
+        cache, so only one batch is held in memory at a time.
+
+        Returns:
+            Number of documents saved
+        """
+        options = self._loader_options(file_ext, loading_method)
+        if self.parse_cache.contains(file_md5, file_ext, loading_method, options):
+            docs = self.parse_cache.lazy_get(
+                file_md5, file_ext, loading_method, options
+            )
+        else:
+            docs = self.parse_cache.write_through(
+                file_md5,
+                file_ext,
+                loading_method,
+                self.lazy_load_file(file_ext, loading_method, path),
+                options,
+            )
+        return len(self.db_service.save_documents(file_id, docs, original_filename))
+
+    def _get_executor(self, loading_method: str) -> LoaderExecutor:
+        """Get the pool that runs a loading method."""
+        if loading_method == "Unstructured":
+            return self.unstructured_executor
+        return self.loader_executor
+
+    async def _concurrency_key(
+        self, file_ext: str, loading_method: str, path: Path
+    ) -> str:
+        """
+        Get the key the loader pool limits a load by, the loading method
+        except for PDFs that PyPDF loads page-parallel. Those start their own
+        worker processes, so they are limited separately and small PDFs keep
+        the PyPDF concurrency.
+        """
+        if (
+            file_ext == "pdf"
+            and loading_method == "PyPDF"
+            and await asyncio.to_thread(pypdf_is_page_parallel, path)
+        ):
+            return "PyPDF-parallel"
+        return loading_method
+
+    def _loader_options(self, file_ext: str, loading_method: str) -> Dict[str, Any]:
+        """
+        Get the loader options that change the parse output, used as part of
+        the parse cache key.
+        """
+        if file_ext == "pdf" and loading_method == "Unstructured":
+            return {
+                "strategy": constants.UNSTRUCTURED_PDF_STRATEGY,
+                "auto_min_text_chars": constants.UNSTRUCTURED_AUTO_MIN_TEXT_CHARS,
+                "auto_max_images": constants.UNSTRUCTURED_AUTO_MAX_IMAGES,
+            }
+        if file_ext == "pdf" and loading_method in ["PDFPlumber", "Camelot"]:
+            return {
+                "min_rules": constants.PDF_TABLE_MIN_RULES,
+                "rule_max_thickness": constants.PDF_TABLE_RULE_MAX_THICKNESS,
+                "rule_min_length": constants.PDF_TABLE_RULE_MIN_LENGTH,
+            }
+        if file_ext in constants.IMAGE_TYPES and loading_method == "Unstructured":
+            return {
+                "max_side": constants.IMAGE_OCR_MAX_SIDE,
+                "strategy": constants.IMAGE_OCR_STRATEGY,
+            }
+        if file_ext == "csv" and loading_method == "Langchain":
+            return {
+                "rows_per_document": constants.CSV_ROWS_PER_DOCUMENT,
+                "encoding": constants.CSV_ENCODING,
+            }
+        if file_ext == "xlsx" and loading_method == "OpenPyXL":
+            return {"rows_per_document": constants.XLSX_ROWS_PER_DOCUMENT}
+        if file_ext == "docx" and loading_method == "DocxXML":
+            return {"max_section_chars": constants.DOCX_MAX_SECTION_CHARS}
+        return {}
+
     def load_file(self, file_ext: str, loading_method: str, path: Path):
+        docs = list(self.lazy_load_file(file_ext, loading_method, path))
+        if docs and len(docs) > 0 and str(docs[0]):
+            logger.info(f"First document sample: {str(docs[0])}...")
+        return docs
+
+    def lazy_load_file(
+        self, file_ext: str, loading_method: str, path: Path
+    ) -> Iterator[Document]:
         logger.info(f"Loading file: {path} with method: {loading_method}")
 
-        docs = []
         if file_ext == "pdf":
             docs = self.load_pdf(loading_method, path)
         elif file_ext == "csv":
             docs = self.load_csv(loading_method, path)
-        elif file_ext in ["jpg", "jpeg", "png"]:
+        elif file_ext in constants.IMAGE_TYPES:
             docs = self.load_img(loading_method, path)
         elif file_ext == "txt":
             docs = self.load_txt(loading_method, path)
@@ -164,21 +679,27 @@ class FileLoaderService:
             docs = self.load_ppt(loading_method, path)
         elif file_ext in ["md", "markdown"]:
             docs = self.load_md(loading_method, path)
+        elif file_ext == "xlsx":
+            docs = self.load_xlsx(loading_method, path)
+        elif file_ext == "docx":
+            docs = self.load_docx(loading_method, path)
         else:
             raise FileLoadError(f"unsupported file extension: {file_ext}")
-        if docs and len(docs) > 0 and str(docs[0]):
-            logger.info(f"First document sample: {str(docs[0])}...")
         return docs
 
-    def load_pdf(self, loading_method: str, path: Path) -> List[Document]:
+    def load_pdf(self, loading_method: str, path: Path) -> Iterator[Document]:
         if loading_method == "PyPDF":
             return PDFPyPDFLoader(path)
         elif loading_method == "Unstructured":
             return PDFUnstructuredLoader(path)
+        elif loading_method == "PDFPlumber":
+            return PDFPlumberLoader(path)
+        elif loading_method == "Camelot":
+            return PDFCamelotLoader(path)
         raise FileLoadError(f"unsupported loading method for pdf: {loading_method}")
 
     def load_csv(self, loading_method: str, path: Path):
-        if loading_method == "Langchian":
+        if loading_method == "Langchain":
             return CSVLangchainLoader(path)
         elif loading_method == "Unstructured":
             return CSVUnstructuredLoader(path)
@@ -214,93 +735,753 @@ class FileLoaderService:
             f"unsupported file loading method for svc: {loading_method}"
         )
 
-    async def get_all_files(self, page: int, limit: int) -> Tuple[List[FileInfo], int]:
+    def load_xlsx(self, loading_method: str, path: Path):
+        if loading_method == "OpenPyXL":
+            return XlsxOpenPyXLLoader(path)
+        raise FileLoadError(
+            f"unsupported file loading method for svc: {loading_method}"
+        )
+
+    def load_docx(self, loading_method: str, path: Path):
+        if loading_method == "DocxXML":
+            return DocxXMLLoader(path)
+        raise FileLoadError(
+            f"unsupported file loading method for svc: {loading_method}"
+        )
+
+    async def start_ingest(self, request: FileIngestRequest) -> FileIngestJob:
         """
-        Get a paginated list of all files.
+        Start ingesting server-side files in the background.
+
+        Files are processed concurrently, at most BULK_INGEST_CONCURRENCY at a
+        time, and parsed in the loader pool.
 
         Args:
-            page: Page number (1-indexed)
-            limit: Number of items per page
+            request: Directory or paths to ingest and loading method overrides
 
         Returns:
-            Tuple of (list of file info, total count)
+            The ingestion job, whose progress is available from get_ingest_job
         """
-        # Query database for file information
-        documents_by_file = {}
-        all_documents = self.db_service.get_all_documents()
+        # Listing a large directory tree blocks, keep it off the event loop
+        paths = await asyncio.to_thread(self._resolve_ingest_paths, request)
+        job = FileIngestJob(
+            job_id=str(uuid.uuid4()),
+            total=len(paths),
+            started_at=datetime.utcnow(),
+            results=[FileIngestResult(path=str(path)) for path in paths],
+        )
+        self._start_job(job, self._run_ingest(job, request.loading_methods or {}))
 
-        # Group documents by file_id
-        for doc in all_documents:
-            if doc.file_id not in documents_by_file:
-                documents_by_file[doc.file_id] = []
-            documents_by_file[doc.file_id].append(doc)
+        logger.info(f"Started ingest job {job.job_id} with {job.total} files")
+        return job
 
-        files = []
+    def _start_job(self, job: FileIngestJob, coro: Coroutine) -> asyncio.Task:
+        """
+        Register an ingestion job and run it in the background.
 
-        # For each file_id found in database, try to reconstruct FileInfo
-        for file_id, docs in documents_by_file.items():
-            # Check if file exists in cache first
-            if file_id in self._file_cache:
-                files.append(self._file_cache[file_id])
-                continue
+        Args:
+            job: The job, available from get_ingest_job until it is evicted
+            coro: Coroutine that runs the job
 
-            # Try to reconstruct from filesystem and database
-            file_path = None
-            for file_ext in constants.ALLOWED_FILE_TYPES:
-                potential_path = constants.ORIGINAL_FILES_DIR / f"{file_id}.{file_ext}"
-                if potential_path.exists():
-                    file_path = potential_path
-                    break
+        Returns:
+            The task running the job
+        """
+        self._evict_ingest_jobs()
+        self._ingest_jobs[job.job_id] = job
+
+        def on_done(task: asyncio.Task) -> None:
+            self._ingest_tasks.discard(task)
+            # A job whose task failed or was cancelled ends too, so it can be evicted
+            if job.finished_at is None:
+                job.status = "completed"
+                job.finished_at = datetime.utcnow()
+
+        task = asyncio.create_task(coro)
+        # Keep a reference so the task is not garbage collected
+        self._ingest_tasks.add(task)
+        task.add_done_callback(on_done)
+        return task
+
+    def _evict_ingest_jobs(self) -> None:
+        """
+        Forget finished jobs older than INGEST_JOB_TTL, then the oldest finished
+        ones until a new job fits within INGEST_JOB_MAX_COUNT. Running jobs are
+        always kept.
+        """
+        now = datetime.utcnow()
+        finished = sorted(
+            (job for job in self._ingest_jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at,
+        )
+        excess = len(self._ingest_jobs) + 1 - constants.INGEST_JOB_MAX_COUNT
+        for job in finished:
+            expired = (now - job.finished_at).total_seconds() > constants.INGEST_JOB_TTL
+            if not expired and excess <= 0:
+                break
+            del self._ingest_jobs[job.job_id]
+            excess -= 1
+
+    def get_ingest_job(
+        self, job_id: str, include_results: bool = True
+    ) -> Optional[FileIngestJob]:
+        """
+        Get the progress of an ingestion job.
 
-            if file_path and docs:
-                # Extract metadata from first document
-                first_doc = docs[0]
-                # Try to get original filename from metadata first, then fallback to file path
-                file_name = None
-                if (
-                    first_doc.doc_metadata
-                    and "original_filename" in first_doc.doc_metadata
-                ):
-                    file_name = first_doc.doc_metadata["original_filename"]
-                else:
-                    # Fallback: try to extract from source path or use file path name
-                    file_name = (
-                        first_doc.doc_metadata.get("source", file_path.name)
-                        if first_doc.doc_metadata
-                        else file_path.name
+        Args:
+            job_id: Job ID
+            include_results: Whether to include per-file results
+
+        Returns:
+            FileIngestJob or None if not found
+        """
+        job = self._ingest_jobs.get(job_id)
+        if job is None:
+            return None
+
+        end = job.finished_at or datetime.utcnow()
+        elapsed = max((end - job.started_at).total_seconds(), 1e-6)
+        job.files_per_second = (job.succeeded + job.failed) / elapsed
+        job.bytes_per_second = job.bytes_processed / elapsed
+        if isinstance(job, WebIngestJob):
+            job.pages_per_second = job.files_per_second
+        if isinstance(job, DatabaseIngestJob):
+            job.rows_per_second = job.rows / elapsed
+        if include_results:
+            return job
+        return job.model_copy(update={"results": None})
+
+    def _resolve_ingest_paths(self, request: FileIngestRequest) -> List[Path]:
+        """Collect the supported files to ingest, limited to INGEST_ALLOWED_DIRS."""
+        allowed_dirs = [d.resolve() for d in constants.INGEST_ALLOWED_DIRS]
+
+        def check_allowed(path: Path) -> Path:
+            resolved = path.resolve()
+            if not any(resolved.is_relative_to(d) for d in allowed_dirs):
+                raise ValueError(
+                    f"Path is outside the allowed ingest directories: {path}"
+                )
+            return resolved
+
+        paths = []
+        if request.directory:
+            directory = check_allowed(Path(request.directory))
+            if not directory.is_dir():
+                raise ValueError(f"Directory not found: {request.directory}")
+            candidates = (
+                directory.rglob("*") if request.recursive else directory.iterdir()
+            )
+            paths.extend(sorted(p for p in candidates if p.is_file()))
+        for path in request.paths or []:
+            path = check_allowed(Path(path))
+            if not path.is_file():
+                raise ValueError(f"File not found: {path}")
+            paths.append(path)
+
+        return [
+            path
+            for path in paths
+            if path.suffix.lstrip(".").lower() in constants.ALLOWED_FILE_TYPES
+        ]
+
+    async def _run_ingest(
+        self, job: FileIngestJob, loading_methods: Dict[str, str]
+    ) -> None:
+        """Ingest every file of a job with bounded concurrency."""
+        semaphore = asyncio.Semaphore(constants.BULK_INGEST_CONCURRENCY)
+
+        async def ingest_one(result: FileIngestResult) -> None:
+            path = Path(result.path)
+            file_ext = path.suffix.lstrip(".").lower()
+            async with semaphore:
+                result.status = "running"
+                start = time.perf_counter()
+                try:
+                    file_info = await self.ingest_path(
+                        path, loading_methods.get(file_ext)
                     )
-                    if isinstance(file_name, str):
-                        file_name = Path(file_name).name
-
-                # Create FileInfo object
-                file_info = FileInfo(
-                    file_id=file_id,
-                    file_name=file_name if file_name else file_path.name,
-                    file_size=file_path.stat().st_size if file_path.exists() else 0,
-                    storage_path=str(file_path),
-                    created_at=datetime.fromtimestamp(file_path.stat().st_ctime)
-                    if file_path.exists()
-                    else datetime.utcnow(),
-                    loadingMethod=file_id.split("_")[0]
-                    if "_" in file_id
-                    else "Unknown",
-                    docs=[doc.to_langchain_document() for doc in docs],
+                    result.file_id = file_info.file_id
+                    result.loading_method = file_info.loadingMethod
+                    result.file_size = file_info.file_size
+                    result.status = "success"
+                    job.succeeded += 1
+                    job.bytes_processed += file_info.file_size
+                except Exception as e:
+                    logger.error(f"Error ingesting {path}: {str(e)}")
+                    result.status = "failed"
+                    result.error = str(e)
+                    job.failed += 1
+                finally:
+                    result.seconds = time.perf_counter() - start
+
+        await asyncio.gather(*(ingest_one(result) for result in job.results))
+        job.status = "completed"
+        job.finished_at = datetime.utcnow()
+        logger.info(
+            f"Ingest job {job.job_id} completed: {job.succeeded} succeeded, {job.failed} failed"
+        )
+
+    async def start_archive_ingest(
+        self,
+        file: UploadFile,
+        loading_methods: Optional[Dict[str, str]] = None,
+        wait: bool = False,
+    ) -> ArchiveIngestJob:
+        """
+        Start ingesting the files of an uploaded zip or tar archive in the background.
+
+        The archive is spooled to disk as uploaded, then its members are read
+        one at a time in archive order without extracting the archive. Each
+        member is stored by content hash and loaded like a single upload, with
+        at most BULK_INGEST_CONCURRENCY members read but not yet loaded.
+
+        Args:
+            file: Uploaded archive
+            loading_methods: Loading method per file extension, defaults to the
+                first supported method of each extension
+            wait: Whether to return only once every member is ingested
+
+        Returns:
+            The ingestion job, whose progress is available from get_ingest_job
+        """
+        loading_methods = loading_methods or {}
+        for file_ext, loading_method in loading_methods.items():
+            self._check_loading_method(file_ext, loading_method)
+
+        _, _, archive_path = await self._spool_upload(file, constants.MAX_ARCHIVE_SIZE)
+        try:
+            archive_format(archive_path)
+        except ValueError:
+            archive_path.unlink(missing_ok=True)
+            raise
+
+        job = ArchiveIngestJob(
+            job_id=str(uuid.uuid4()),
+            archive_name=file.filename or "unnamed_archive",
+            total=0,
+            started_at=datetime.utcnow(),
+            results=[],
+        )
+        task = self._start_job(
+            job, self._run_archive_ingest(job, archive_path, loading_methods)
+        )
+
+        logger.info(f"Started archive ingest job {job.job_id} for {job.archive_name}")
+        if wait:
+            await task
+            # Fill in the throughput figures of the completed job
+            return self.get_ingest_job(job.job_id)
+        return job
+
+    async def _run_archive_ingest(
+        self,
+        job: ArchiveIngestJob,
+        archive_path: Path,
+        loading_methods: Dict[str, str],
+    ) -> None:
+        """Read the members of an archive in order and load them concurrently."""
+        semaphore = asyncio.Semaphore(constants.BULK_INGEST_CONCURRENCY)
+
+        async def ingest_one(
+            result: FileIngestResult, stored: Tuple[str, int, Path], start: float
+        ) -> None:
+            file_md5, file_size, storage_path = stored
+            load_start = time.perf_counter()
+            try:
+                file_info = await self._load_and_save(
+                    storage_path,
+                    file_md5,
+                    file_size,
+                    storage_path.suffix.lstrip("."),
+                    PurePosixPath(result.path).name,
+                    result.loading_method,
                 )
+                result.file_id = file_info.file_id
+                result.status = "success"
+                job.succeeded += 1
+                job.bytes_processed += file_size
+            except Exception as e:
+                logger.error(f"Error ingesting {result.path}: {str(e)}")
+                result.status = "failed"
+                result.error = str(e)
+                job.failed += 1
+            finally:
+                job.load_seconds += time.perf_counter() - load_start
+                result.seconds = time.perf_counter() - start
+                semaphore.release()
+
+        members = iter_archive_members(archive_path)
+        tasks = []
+        try:
+            while True:
+                # Wait for a free slot before reading on, so stored members do not pile up
+                await semaphore.acquire()
+                start = time.perf_counter()
+                try:
+                    item = await asyncio.to_thread(
+                        self._read_archive_member, job, members, loading_methods
+                    )
+                except Exception as e:
+                    semaphore.release()
+                    logger.error(f"Error reading archive {job.archive_name}: {str(e)}")
+                    job.results.append(
+                        FileIngestResult(
+                            path=job.archive_name, status="failed", error=str(e)
+                        )
+                    )
+                    job.total += 1
+                    job.failed += 1
+                    break
+                finally:
+                    job.extract_seconds += time.perf_counter() - start
+
+                if item is None:
+                    semaphore.release()
+                    break
+                result, stored = item
+                job.results.append(result)
+                job.total += 1
+                if stored is None:
+                    job.failed += 1
+                    semaphore.release()
+                    continue
+                tasks.append(asyncio.create_task(ingest_one(result, stored, start)))
+
+            await asyncio.gather(*tasks)
+        finally:
+            members.close()
+            archive_path.unlink(missing_ok=True)
+
+        job.status = "completed"
+        job.finished_at = datetime.utcnow()
+        logger.info(
+            f"Archive ingest job {job.job_id} completed: {job.succeeded} succeeded, "
+            f"{job.failed} failed, {job.skipped} skipped"
+        )
+
+    def _read_archive_member(
+        self,
+        job: ArchiveIngestJob,
+        members: Iterator[Tuple[str, BinaryIO]],
+        loading_methods: Dict[str, str],
+    ) -> Optional[Tuple[FileIngestResult, Optional[Tuple[str, int, Path]]]]:
+        """
+        Read the next supported member of an archive and store it by content hash.
+
+        Runs in a worker thread. The member is copied to a temporary file in
+        fixed-size blocks while being hashed, members of unsupported types are
+        counted as skipped.
+
+        Returns:
+            None once the archive is exhausted, otherwise the member's result
+            and (file md5, file size, storage path), or None if it failed
+        """
+        for name, f in members:
+            file_ext = PurePosixPath(name).suffix.lstrip(".").lower()
+            if file_ext not in constants.ALLOWED_FILE_TYPES:
+                job.skipped += 1
+                continue
+
+            result = FileIngestResult(
+                path=name,
+                status="running",
+                loading_method=loading_methods.get(file_ext)
+                or self._default_loading_method(file_ext),
+            )
+            try:
+                fd, tmp_path = self._make_temp_file()
+                try:
+                    with os.fdopen(fd, "wb") as dst:
+                        file_md5, file_size = self._hash_stream(f, dst)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+            except Exception as e:
+                logger.error(f"Error reading {name} from {job.archive_name}: {str(e)}")
+                result.status = "failed"
+                result.error = str(e)
+                return result, None
+
+            result.file_size = file_size
+            storage_path = self._blob_path(file_md5, file_ext)
+            if storage_path.exists():
+                tmp_path.unlink()
+                logger.info(f"File already stored, skipping write: {storage_path}")
+            else:
+                os.replace(tmp_path, storage_path)
+                logger.info(f"File saved: {storage_path}")
+            return result, (file_md5, file_size, storage_path)
+        return None
+
+    async def start_web_ingest(self, request: WebIngestRequest) -> WebIngestJob:
+        """
+        Start ingesting web pages in the background.
+
+        Pages are fetched concurrently through one pooled HTTP session with
+        total and per-host connection limits. Pages ingested before are
+        requested conditionally, and pages the server reports as not modified
+        are skipped.
+
+        Args:
+            request: URLs to ingest and concurrency limits
+
+        Returns:
+            The ingestion job, whose progress is available from get_ingest_job
+        """
+        urls = list(dict.fromkeys(request.urls))
+        if not urls:
+            raise ValueError("No URLs to ingest")
+        for url in urls:
+            if urlparse(url).scheme not in ("http", "https"):
+                raise ValueError(f"Unsupported URL: {url}")
+
+        job = WebIngestJob(
+            job_id=str(uuid.uuid4()),
+            total=len(urls),
+            started_at=datetime.utcnow(),
+            results=[FileIngestResult(path=url) for url in urls],
+        )
+        self._start_job(
+            job,
+            self._run_web_ingest(
+                job,
+                request.concurrency or constants.WEB_FETCH_CONCURRENCY,
+                request.per_host_concurrency
+                or constants.WEB_FETCH_PER_HOST_CONCURRENCY,
+            ),
+        )
+
+        logger.info(f"Started web ingest job {job.job_id} with {job.total} pages")
+        return job
+
+    async def _run_web_ingest(
+        self, job: WebIngestJob, concurrency: int, per_host_concurrency: int
+    ) -> None:
+        """Fetch and ingest every page of a job through a shared session."""
+        trace_configs = []
+        resolver = None
+        if not constants.WEB_FETCH_ALLOW_PRIVATE_HOSTS:
+            resolver = PublicResolver()
+            trace_configs.append(public_hosts_trace_config())
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=per_host_concurrency, resolver=resolver
+        )
+        timeout = aiohttp.ClientTimeout(total=constants.WEB_FETCH_TIMEOUT)
+        headers = {"User-Agent": constants.WEB_USER_AGENT}
+
+        async def ingest_one(
+            session: aiohttp.ClientSession, result: FileIngestResult
+        ) -> None:
+            result.status = "running"
+            start = time.perf_counter()
+            try:
+                await self._ingest_page(session, job, result)
+            except Exception as e:
+                logger.error(f"Error ingesting {result.path}: {str(e)}")
+                result.status = "failed"
+                result.error = str(e)
+                job.failed += 1
+            finally:
+                result.seconds = time.perf_counter() - start
+
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=headers,
+                trace_configs=trace_configs,
+            ) as session:
+                await asyncio.gather(
+                    *(ingest_one(session, result) for result in job.results)
+                )
+        finally:
+            self.web_cache.flush()
+            job.status = "completed"
+            job.finished_at = datetime.utcnow()
+
+        logger.info(
+            f"Web ingest job {job.job_id} completed: {job.succeeded} succeeded "
+            f"({job.unchanged} unchanged), {job.failed} failed"
+        )
+
+    async def _ingest_page(
+        self,
+        session: aiohttp.ClientSession,
+        job: WebIngestJob,
+        result: FileIngestResult,
+    ) -> None:
+        """Fetch one page, conditionally if it was ingested before, and store it."""
+        url = result.path
+        cached = self.web_cache.get(url)
+        # Validators are only useful while the stored copy still exists
+        if (
+            cached
+            and await self.async_db_service.get_file_record(cached["file_id"]) is None
+        ):
+            cached = None
+
+        page = await fetch_page(
+            session,
+            url,
+            cached["etag"] if cached else None,
+            cached["last_modified"] if cached else None,
+        )
+        result.loading_method = constants.WEB_LOADING_METHOD
+
+        if page.content is None:
+            result.file_id = cached["file_id"]
+            result.file_size = cached["file_size"]
+            result.status = "unchanged"
+            job.succeeded += 1
+            job.unchanged += 1
+            job.bytes_saved += cached["file_size"]
+            return
+
+        file_info = await self._save_page(url, page.content)
+        self.web_cache.put(
+            url, file_info.file_id, file_info.file_size, page.etag, page.last_modified
+        )
+
+        # Drop the previous version of the page once no other URL refers to it
+        if (
+            cached
+            and cached["file_id"] != file_info.file_id
+            and not self.web_cache.urls_for_file(cached["file_id"])
+        ):
+            await self.delete_file(cached["file_id"])
+
+        result.file_id = file_info.file_id
+        result.file_size = file_info.file_size
+        result.status = "success"
+        job.succeeded += 1
+        job.bytes_processed += file_info.file_size
+
+    async def _save_page(self, url: str, content: bytes) -> FileInfo:
+        """
+        Store a fetched page and its documents.
+
+        Pages are stored by content hash like uploaded files, so a page whose
+        content is already stored is not parsed again.
+
+        Args:
+            url: Page URL, used as the file name
+            content: Raw page content
+
+        Returns:
+            File information
+        """
+        loading_method = constants.WEB_LOADING_METHOD
+        file_md5 = hashlib.md5(content).hexdigest()
+        file_id = loading_method + "_" + file_md5
+        storage_path = self._blob_path(file_md5, "html")
+
+        if not storage_path.exists():
+            await asyncio.to_thread(self._write_blob, storage_path, content)
+            logger.info(f"File saved: {storage_path}")
+
+        docs = None
+        if await self.async_db_service.get_file_record(file_id) is None:
+            docs = await self._get_executor(loading_method).run(
+                loading_method, WebPageParser, content, url
+            )
+            await self.async_db_service.save_documents(file_id, docs, url)
+
+        file_info = FileInfo(
+            file_id=file_id,
+            file_name=url,
+            file_size=len(content),
+            storage_path=str(storage_path),
+            created_at=datetime.utcnow(),
+            loadingMethod=loading_method,
+            docs=docs,
+        )
+        await self.async_db_service.save_file_record(
+            file_id=file_id,
+            file_name=url,
+            file_size=file_info.file_size,
+            loading_method=loading_method,
+            storage_path=str(storage_path),
+            created_at=file_info.created_at,
+        )
+        self._file_cache.pop(file_id)
+        return file_info
 
-                # Update cache
-                self._file_cache[file_id] = file_info
-                files.append(file_info)
+    def _write_blob(self, storage_path: Path, content: bytes) -> None:
+        """Write content to the store through a temporary file."""
+        fd, tmp_path = self._make_temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, storage_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-        # Sort by creation date (newest first)
-        files.sort(key=lambda x: x.created_at, reverse=True)
+    async def start_db_ingest(
+        self, request: DatabaseIngestRequest
+    ) -> DatabaseIngestJob:
+        """
+        Start ingesting a database table in the background.
+
+        Rows are read in keyset-paginated batches and every batch is saved,
+        together with a checkpoint, before the next one is read. A job for a
+        table that was ingested before, completely or not, continues after the
+        last saved row unless resume is disabled.
 
-        # Apply pagination
-        total_files = len(files)
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_files = files[start_idx:end_idx]
+        Only the sources of DB_INGEST_SOURCES can be ingested, requests name
+        a source rather than passing a database URL.
 
-        return paginated_files, total_files
+        Args:
+            request: Source name, table and batching options
+
+        Returns:
+            The ingestion job, whose progress is available from get_ingest_job
+        """
+        uri = self._db_source_uri(request.source)
+        try:
+            source = db_source_of(uri, request.table)
+        except ArgumentError as e:
+            raise ValueError(
+                f"Invalid database URL for source {request.source}: {str(e)}"
+            )
+        job = DatabaseIngestJob(
+            job_id=str(uuid.uuid4()),
+            total=1,
+            started_at=datetime.utcnow(),
+            results=[FileIngestResult(path=source)],
+        )
+        self._start_job(job, self._run_db_ingest(job, request))
+
+        logger.info(f"Started database ingest job {job.job_id} for {source}")
+        return job
+
+    def _db_source_uri(self, name: str) -> str:
+        """Get the database URL of a source of DB_INGEST_SOURCES."""
+        uri = constants.DB_INGEST_SOURCES.get(name)
+        if uri is None:
+            raise ValueError(f"Unknown database source: {name}")
+        return uri
+
+    async def _run_db_ingest(
+        self, job: DatabaseIngestJob, request: DatabaseIngestRequest
+    ) -> None:
+        """Ingest the table of a job off the event loop."""
+        result = job.results[0]
+        result.status = "running"
+        result.loading_method = constants.DB_LOADING_METHOD
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(self._ingest_table, job, request)
+            result.status = "success"
+            job.succeeded += 1
+        except Exception as e:
+            logger.error(f"Error ingesting {result.path}: {str(e)}")
+            result.status = "failed"
+            result.error = str(e)
+            job.failed += 1
+        finally:
+            result.seconds = time.perf_counter() - start
+            job.status = "completed"
+            job.finished_at = datetime.utcnow()
+
+        logger.info(
+            f"Database ingest job {job.job_id} completed: {job.rows} rows, "
+            f"{job.documents} documents"
+        )
+
+    def _ingest_table(
+        self, job: DatabaseIngestJob, request: DatabaseIngestRequest
+    ) -> None:
+        """Save a table batch by batch, continuing from its checkpoint."""
+        result = job.results[0]
+        source = result.path
+        key = json.dumps(
+            [source, request.key_column, request.columns, request.rows_per_document]
+        )
+        file_id = (
+            constants.DB_LOADING_METHOD + "_" + hashlib.md5(key.encode()).hexdigest()
+        )
+        result.file_id = file_id
+
+        if not request.resume:
+            self.db_service.delete_file_data(file_id)
+
+        record = self.db_service.get_file_record(file_id)
+        checkpoint = self.db_service.get_ingest_checkpoint(file_id)
+        after_key = None
+        file_size = 0
+        if record is not None and checkpoint is not None:
+            after_key = json.loads(checkpoint.last_key)
+            job.rows = checkpoint.rows
+            job.documents = checkpoint.documents
+            file_size = record.file_size
+            logger.info(f"Resuming {source} after key {after_key}")
+        else:
+            # Drop documents of an ingestion that never saved a batch
+            self.db_service.delete_file_data(file_id)
+            self.db_service.save_file_record(
+                file_id=file_id,
+                file_name=source,
+                file_size=0,
+                loading_method=constants.DB_LOADING_METHOD,
+                storage_path=source,
+            )
+
+        for batch in DBBatchLoader(
+            self._db_source_uri(request.source),
+            request.table,
+            request.key_column,
+            request.columns,
+            after_key,
+            request.batch_size,
+            request.rows_per_document,
+        ):
+            batch_bytes = sum(len(doc.page_content.encode()) for doc in batch.documents)
+            file_size += batch_bytes
+            self.db_service.save_document_batch(
+                file_id,
+                batch.documents,
+                start_index=job.documents,
+                last_key=json.dumps(batch.last_key, default=str),
+                rows=job.rows + batch.rows,
+                file_size=file_size,
+                original_filename=source,
+            )
+            job.rows += batch.rows
+            job.documents += len(batch.documents)
+            job.bytes_processed += batch_bytes
+            result.file_size = file_size
+
+        self._file_cache.pop(file_id)
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Dict[str, int]]:
+        """
+        Get usage and hit/miss/eviction counters for the in-memory caches.
+
+        Returns:
+            Dictionary of cache statistics keyed by cache name
+        """
+        return {
+            "docs": cls._docs_cache.stats(),
+            "files": cls._file_cache.stats(),
+        }
+
+    async def get_all_files(self, page: int, limit: int) -> Tuple[List[FileInfo], int]:
+        """
+        Get a paginated list of all files from the files catalog.
+
+        Args:
+            page: Page number (1-indexed)
+            limit: Number of items per page
+
+        Returns:
+            Tuple of (list of file info, total count)
+        """
+        records, total_files = await self.async_db_service.list_file_records(
+            page, limit
+        )
+        files = [self._file_info_from_record(record) for record in records]
+        return files, total_files
 
     async def get_file(self, file_id: str) -> Optional[FileDetailInfo]:
         """
@@ -312,15 +1493,79 @@ class FileLoaderService:
         Returns:
             FileDetailInfo or None if not found
         """
-        # In a real implementation, this would query a database
-        # For now, we'll read from the filesystem
+        cached_file = self._file_cache.get(file_id)
+        if cached_file is not None:
+            return cached_file
 
-        # Find the file with matching ID
-        if file_id in self._file_cache:
-            return self._file_cache[file_id]
-        else:
+        record = await self.async_db_service.get_file_record(file_id)
+        if record is None:
             return None
 
+        docs = [
+            doc.to_langchain_document()
+            for doc in await self.async_db_service.get_documents(file_id)
+        ]
+        file_info = self._file_info_from_record(record, docs)
+        self._file_cache.put(file_id, file_info)
+        return file_info
+
+    def _file_info_from_record(
+        self, record: Any, docs: Optional[List[Document]] = None
+    ) -> FileInfo:
+        """Build a FileInfo from a files catalog record."""
+        return FileInfo(
+            file_id=record.id,
+            file_name=record.file_name,
+            file_size=record.file_size,
+            storage_path=record.storage_path,
+            created_at=record.created_at,
+            loadingMethod=record.loading_method,
+            docs=docs,
+        )
+
+    def sync_file_catalog(self) -> int:
+        """
+        Add catalog entries for files that were loaded before the files
+        catalog existed, reconstructing them from the stored originals and
+        the metadata of their first document.
+
+        Returns:
+            Number of files added to the catalog
+        """
+        added = 0
+        for file_id in self.db_service.get_uncataloged_file_ids():
+            file_path = None
+            for file_ext in constants.ALLOWED_FILE_TYPES:
+                potential_path = constants.ORIGINAL_FILES_DIR / f"{file_id}.{file_ext}"
+                if potential_path.exists():
+                    file_path = potential_path
+                    break
+            if file_path is None:
+                continue
+
+            # Try to get original filename from metadata first, then fallback to file path
+            metadata = self.db_service.get_first_document_metadata(file_id) or {}
+            file_name = metadata.get("original_filename")
+            if not file_name:
+                file_name = metadata.get("source", file_path.name)
+                if isinstance(file_name, str):
+                    file_name = Path(file_name).name
+
+            stat = file_path.stat()
+            self.db_service.save_file_record(
+                file_id=file_id,
+                file_name=file_name if file_name else file_path.name,
+                file_size=stat.st_size,
+                loading_method=file_id.split("_")[0] if "_" in file_id else "Unknown",
+                storage_path=str(file_path),
+                created_at=datetime.fromtimestamp(stat.st_ctime),
+            )
+            added += 1
+
+        if added:
+            logger.info(f"Added {added} existing files to the files catalog")
+        return added
+
     async def delete_file(self, file_id: str) -> bool:
         """
         Delete a file and its related data.
@@ -331,31 +1576,52 @@ class FileLoaderService:
         Returns:
             True if deleted, False if not found
         """
-        # Find the file with matching ID
-        found = False
-
         try:
+            record = await self.async_db_service.get_file_record(file_id)
+            found = record is not None
+
+            # Remove from cache
+            for key in self._docs_cache.keys():
+                if key[0] == file_id:
+                    self._docs_cache.pop(key)
+                    logger.info(f"Removed docs cache for file {file_id}")
+
+            if "_" in file_id:
+                loading_method, file_md5 = file_id.split("_", 1)
+                self.parse_cache.delete(file_md5, loading_method)
+                logger.info(f"Removed parse cache for file {file_id}")
+
+            # Delete from database (documents, chunks and catalog entry)
+            await self.async_db_service.delete_file_data(file_id)
+            logger.info(f"Deleted database data for file {file_id}")
+
+            # Delete the stored original once no other file refers to it
+            if record is not None:
+                storage_path = Path(record.storage_path)
+                if (
+                    storage_path.parent == constants.ORIGINAL_FILES_DIR
+                    and storage_path.is_file()
+                    and not await self.async_db_service.count_file_records(
+                        storage_path=record.storage_path
+                    )
+                ):
+                    os.remove(storage_path)
+                    logger.info(f"Deleted stored file {storage_path}")
+
+            # Files stored before originals were keyed by content
             for file_path in constants.ORIGINAL_FILES_DIR.glob(f"{file_id}.*"):
                 if file_path.is_file():
-                    # Delete the file
                     os.remove(file_path)
                     found = True
 
-                    # Remove from cache
-                    if file_id in self._docs_cache:
-                        del self._docs_cache[file_id]
-                        logger.info(f"Removed docs cache for file {file_id}")
-
-                    break
-
-            # Delete from database (documents and chunks)
-            self.db_service.delete_file_data(file_id)
-            logger.info(f"Deleted database data for file {file_id}")
-
-            if file_id in self._file_cache:
-                del self._file_cache[file_id]
+            if self._file_cache.pop(file_id) is not None:
                 logger.info(f"Removed file cache for file {file_id}")
 
+            # Forget the validators of web pages stored as this file
+            for url in self.web_cache.urls_for_file(file_id):
+                self.web_cache.delete(url)
+            self.web_cache.flush()
+
             return found
         except Exception as e:
             logger.error(f"Error deleting file {file_id}: {str(e)}")
@@ -378,4 +1644,7 @@ if __name__ == "__main__":
         for file in files:
             print(f"  - {file.file_name} ({file.file_id})")
 
+        # Close the async engine's connections, whose threads keep the process alive
+        await dispose_async_engine()
+
     asyncio.run(test_file_service())
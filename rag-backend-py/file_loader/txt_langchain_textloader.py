@@ -1,10 +1,13 @@
 from langchain_community.document_loaders import TextLoader
 
 
-def load(file):
+def lazy_load(file):
     loader = TextLoader(file)
-    documents = loader.load()
-    return documents
+    return loader.lazy_load()
+
+
+def load(file):
+    return list(lazy_load(file))
 
 
 def main():
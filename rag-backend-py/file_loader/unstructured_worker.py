@@ -0,0 +1,53 @@
+"""
+Setup of the resident worker processes that run the Unstructured loaders.
+"""
+import logging
+import time
+
+import constants
+from database import reset_engine
+
+logger = logging.getLogger("rag-backend.file_loader.unstructured_worker")
+
+
+def init_worker() -> None:
+    """
+    Process pool initializer for the Unstructured workers.
+
+    Runs once per worker process, so every parse after the first one finds the
+    partition modules imported and the layout model loaded.
+    """
+    reset_engine()
+    if constants.UNSTRUCTURED_WARM_UP:
+        warm_up()
+
+
+def warm_up() -> None:
+    """Import the partitioners and load the models used by the Unstructured loaders."""
+    start = time.perf_counter()
+
+    try:
+        # Heavy imports, paid once per worker instead of on the first request
+        import unstructured.partition.image  # noqa: F401
+        import unstructured.partition.pdf  # noqa: F401
+        import unstructured.partition.ppt  # noqa: F401
+        import unstructured.partition.pptx  # noqa: F401
+        from unstructured.partition.md import partition_md
+
+        # Exercise the text pipeline once, which loads its tokenizer data
+        partition_md(text="# Warm up\n\nThe worker is ready.")
+    except Exception as e:
+        logger.warning(f"Failed to warm up Unstructured partitioners: {str(e)}")
+
+    if constants.UNSTRUCTURED_PRELOAD_LAYOUT_MODEL:
+        try:
+            # Models are cached per process, hi_res partitions reuse this instance
+            from unstructured_inference.models.base import get_model
+
+            get_model()
+        except Exception as e:
+            logger.warning(f"Failed to preload the layout model: {str(e)}")
+
+    logger.info(
+        f"Unstructured worker warmed up in {time.perf_counter() - start:.1f} seconds"
+    )
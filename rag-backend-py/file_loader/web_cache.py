@@ -0,0 +1,111 @@
+"""
+Persistent cache of HTTP validators for web ingestion.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import constants
+
+logger = logging.getLogger("rag-backend.file_loader.web_cache")
+
+
+class WebCache:
+    """
+    ETag and Last-Modified of every ingested page, keyed by URL.
+
+    Refresh crawls send these validators with a conditional GET, so pages the
+    server reports as not modified are neither downloaded nor parsed again.
+    Entries are kept in memory and written to a single JSON file, atomically,
+    on flush.
+    """
+
+    def __init__(self, path: Path = constants.WEB_CACHE_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable web cache {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._save()
+            self._dirty = False
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=".web-cache-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cache entry of a URL."""
+        with self._lock:
+            return self._load().get(url)
+
+    def put(
+        self,
+        url: str,
+        file_id: str,
+        file_size: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """
+        Record the validators of a fetched page.
+
+        Args:
+            url: Page URL
+            file_id: ID of the file the page was stored as
+            file_size: Page size in bytes, reported as saved on later cache hits
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        with self._lock:
+            self._load()[url] = {
+                "file_id": file_id,
+                "file_size": file_size,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            self._dirty = True
+
+    def delete(self, url: str) -> None:
+        """Remove the cache entry of a URL."""
+        with self._lock:
+            if self._load().pop(url, None) is not None:
+                self._dirty = True
+
+    def urls_for_file(self, file_id: str) -> List[str]:
+        """Get the URLs whose current content is stored as file_id."""
+        with self._lock:
+            return [
+                url
+                for url, entry in self._load().items()
+                if entry.get("file_id") == file_id
+            ]
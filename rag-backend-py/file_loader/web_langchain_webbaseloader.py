@@ -1,4 +1,81 @@
+import ipaddress
+from typing import List, NamedTuple, Optional
+
+import aiohttp
+from aiohttp.resolver import ThreadedResolver
+from bs4 import BeautifulSoup
 from langchain_community.document_loaders import WebBaseLoader
+from langchain_core.documents import Document
+from yarl import URL
+
+import constants
+
+
+class FetchResult(NamedTuple):
+    url: str
+    status: int
+    content: Optional[bytes]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+def is_public_address(address: str) -> bool:
+    """Whether an IP address is publicly routable, not loopback, private or link-local."""
+    try:
+        return ipaddress.ip_address(address.split("%", 1)[0]).is_global
+    except ValueError:
+        return False
+
+
+class PublicResolver(ThreadedResolver):
+    """
+    DNS resolver that drops non-public addresses.
+
+    Used for user supplied URLs, so a page cannot make the server request
+    hosts of its own network, such as cloud metadata endpoints.
+    """
+
+    async def resolve(self, host, port=0, family=0):
+        hosts = [
+            result
+            for result in await super().resolve(host, port, family)
+            if is_public_address(result["host"])
+        ]
+        if not hosts:
+            raise OSError(f"{host} does not resolve to a public address")
+        return hosts
+
+
+def _check_host(host: Optional[str]) -> None:
+    """Raise ValueError if host is a non-public IP address."""
+    host = host or ""
+    try:
+        ipaddress.ip_address(host.split("%", 1)[0])
+    except ValueError:
+        return  # a name, checked by PublicResolver
+    if not is_public_address(host):
+        raise ValueError(f"Refusing to fetch non-public address {host}")
+
+
+async def _check_request_host(session, trace_config_ctx, params) -> None:
+    _check_host(params.url.host)
+
+
+async def _check_redirect_host(session, trace_config_ctx, params) -> None:
+    location = params.response.headers.get("Location")
+    if location:
+        _check_host(params.url.join(URL(location)).host)
+
+
+def public_hosts_trace_config() -> aiohttp.TraceConfig:
+    """
+    Trace config refusing requests and redirects to non-public IP addresses,
+    which bypass the resolver.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_check_request_host)
+    trace_config.on_request_redirect.append(_check_redirect_host)
+    return trace_config
 
 
 def load(page_url):
@@ -7,6 +84,91 @@ def load(page_url):
     return docs
 
 
+def _page_metadata(soup: BeautifulSoup, page_url: str) -> dict:
+    """Build the metadata of a page the way WebBaseLoader does."""
+    metadata = {"source": page_url}
+    if title := soup.find("title"):
+        metadata["title"] = title.get_text()
+    if description := soup.find("meta", attrs={"name": "description"}):
+        metadata["description"] = description.get("content", "No description found.")
+    if html := soup.find("html"):
+        metadata["language"] = html.get("lang", "No language found.")
+    return metadata
+
+
+def parse(content: bytes, page_url: str) -> List[Document]:
+    """
+    Parse a fetched page the same way WebBaseLoader does.
+
+    Args:
+        content: Raw page content, BeautifulSoup detects its encoding
+        page_url: URL the page was fetched from
+
+    Returns:
+        List with a single document for the page
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    return [
+        Document(page_content=soup.get_text(), metadata=_page_metadata(soup, page_url))
+    ]
+
+
+async def fetch(
+    session: aiohttp.ClientSession,
+    page_url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    max_size: int = constants.MAX_FILE_SIZE,
+) -> FetchResult:
+    """
+    Fetch a page with a conditional GET.
+
+    Args:
+        session: Shared client session, its connector limits concurrency
+        page_url: URL to fetch
+        etag: ETag of the cached copy, sent as If-None-Match
+        last_modified: Last-Modified of the cached copy, sent as If-Modified-Since
+        max_size: Maximum page size in bytes
+
+    Returns:
+        FetchResult, with no content when the server answered 304 Not Modified
+
+    Raises:
+        ValueError: If the page is larger than max_size
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    async with session.get(page_url, headers=headers) as resp:
+        if resp.status == 304:
+            return FetchResult(page_url, resp.status, None, etag, last_modified)
+        resp.raise_for_status()
+        if resp.content_length is not None and resp.content_length > max_size:
+            raise ValueError(
+                f"Page too large: {resp.content_length} bytes, limit is {max_size}"
+            )
+
+        # Content-Length may be missing or wrong, enforce the limit while reading
+        chunks = []
+        size = 0
+        async for chunk in resp.content.iter_chunked(constants.UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_size:
+                raise ValueError(f"Page too large: over {max_size} bytes")
+            chunks.append(chunk)
+        content = b"".join(chunks)
+        return FetchResult(
+            page_url,
+            resp.status,
+            content,
+            resp.headers.get("ETag"),
+            resp.headers.get("Last-Modified"),
+        )
+
+
 def main():
     docs = load("https://hedon.top/2025/04/13/ai-rag-tech-overview/")
     assert len(docs) == 1
@@ -1,8 +1,13 @@
+import asyncio
 import logging
 from pathlib import Path
 
 import uvicorn
 from dotenv import load_dotenv
+
+# Load environment variables before the modules that read them on import
+load_dotenv()
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -16,13 +21,11 @@ from api.search import router as search_router
 from api.generation import router as generation_router
 from api.pipeline import router as pipeline_router
 from api.system import router as system_router
-from constants import API_PREFIX
+from constants import API_PREFIX, UNSTRUCTURED_START_WORKERS_ON_STARTUP
 
 # Import database setup
-from database import create_tables
-
-# Load environment variables
-load_dotenv()
+from database import create_tables, dispose_async_engine
+from file_loader import FileLoaderService
 
 # Configure logging
 logging.basicConfig(
@@ -92,14 +95,41 @@ async def startup_event():
         dir_path.mkdir(parents=True, exist_ok=True)
     logger.info("Data directories created")
 
+    # Drop parse results written by outdated loader versions
+    FileLoaderService.parse_cache.prune_stale_versions()
+
     # Initialize database tables
     try:
         create_tables()
         logger.info("Database tables initialized")
+        FileLoaderService().sync_file_catalog()
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    # Warm the Unstructured workers in the background, without delaying startup
+    if UNSTRUCTURED_START_WORKERS_ON_STARTUP:
+        app.state.unstructured_warm_up = asyncio.get_running_loop().run_in_executor(
+            None, FileLoaderService.unstructured_executor.start
+        )
+        app.state.unstructured_warm_up.add_done_callback(_log_warm_up_error)
+
+
+def _log_warm_up_error(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(
+            f"Failed to start the Unstructured workers: {future.exception()}",
+            exc_info=future.exception(),
+        )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    FileLoaderService.loader_executor.shutdown(wait=False)
+    FileLoaderService.unstructured_executor.shutdown(wait=False)
+    logger.info("Loader executors shut down")
+    await dispose_async_engine()
+
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -2,13 +2,55 @@
 Document model for storing loaded documents.
 """
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 import json
-from sqlalchemy import Column, String, Text, DateTime, JSON, Integer
+from sqlalchemy import Column, String, Text, DateTime, JSON, Index, Integer
 from sqlalchemy.orm import relationship
 from .base import Base
 
 
+class FileRecord(Base):
+    """Model for the catalog of uploaded files."""
+
+    __tablename__ = "files"
+
+    id = Column(String, primary_key=True)  # file ID
+    file_name = Column(String, nullable=False)  # original file name
+    file_size = Column(Integer, nullable=False)  # file size in bytes
+    loading_method = Column(String, nullable=True)  # loading method used
+    storage_path = Column(String, nullable=False)  # path of the stored original
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<FileRecord(id='{self.id}', file_name='{self.file_name}')>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "file_name": self.file_name,
+            "file_size": self.file_size,
+            "loading_method": self.loading_method,
+            "storage_path": self.storage_path,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+class IngestCheckpoint(Base):
+    """Model for the progress of a resumable database ingestion."""
+
+    __tablename__ = "ingest_checkpoints"
+
+    file_id = Column(String, primary_key=True)  # file ID
+    last_key = Column(Text, nullable=True)  # JSON encoded key of the last saved row
+    rows = Column(Integer, nullable=False, default=0)  # rows saved so far
+    documents = Column(Integer, nullable=False, default=0)  # documents saved so far
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<IngestCheckpoint(file_id='{self.file_id}', rows={self.rows})>"
+
+
 class Document(Base):
     """Model for storing loaded documents."""
 
@@ -48,6 +90,15 @@ class DocumentChunk(Base):
     """Model for storing document chunks."""
 
     __tablename__ = "document_chunks"
+    __table_args__ = (
+        # Serves the listing of a file's chunks in order, filter and sort included
+        Index(
+            "ix_document_chunks_file_strategy_index",
+            "file_id",
+            "chunk_strategy",
+            "chunk_index",
+        ),
+    )
 
     id = Column(String, primary_key=True)  # chunk UUID
     file_id = Column(String, nullable=False, index=True)  # file UUID
@@ -97,3 +148,67 @@ class DocumentChunk(Base):
             }
         )
         return LCDocument(page_content=self.content, metadata=metadata)
+
+
+class DocumentRecord(NamedTuple):
+    """
+    Read-only row of the documents table.
+
+    Returned by the read queries of DatabaseService instead of ORM objects,
+    it is a plain tuple built straight from the selected columns. Fields are
+    named after the Document attributes, page_content is None when the query
+    skipped it.
+    """
+
+    id: str
+    file_id: str
+    page_content: Optional[str]
+    doc_metadata: Optional[Dict[str, Any]]
+    page_number: Optional[int]
+    created_at: Optional[datetime]
+
+    def to_langchain_document(self):
+        """Convert to LangChain Document format."""
+        from langchain.schema import Document as LCDocument
+
+        return LCDocument(
+            page_content=self.page_content or "", metadata=self.doc_metadata or {}
+        )
+
+
+class ChunkRecord(NamedTuple):
+    """
+    Read-only row of the document_chunks table.
+
+    Fields are named after the DocumentChunk attributes, content is None when
+    the query skipped it.
+    """
+
+    id: str
+    file_id: str
+    document_id: Optional[str]
+    content: Optional[str]
+    chunk_metadata: Optional[Dict[str, Any]]
+    start_offset: Optional[int]
+    end_offset: Optional[int]
+    chunk_index: int
+    chunk_strategy: str
+    window_size: Optional[int]
+    overlap: Optional[int]
+    created_at: Optional[datetime]
+
+    def to_langchain_document(self):
+        """Convert to LangChain Document format."""
+        from langchain.schema import Document as LCDocument
+
+        metadata = self.chunk_metadata.copy() if self.chunk_metadata else {}
+        metadata.update(
+            {
+                "chunk_id": self.id,
+                "file_id": self.file_id,
+                "chunk_index": self.chunk_index,
+                "start_offset": self.start_offset,
+                "end_offset": self.end_offset,
+            }
+        )
+        return LCDocument(page_content=self.content or "", metadata=metadata)
@@ -2,7 +2,7 @@
 Schema models for file operations.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -36,7 +36,7 @@ class FileInfo(FileBase):
     storage_path: str = Field(..., description="Storage path for the file")
     created_at: datetime = Field(..., description="File creation timestamp")
     loadingMethod: Optional[str] = Field(None, description="File loading method")
-    docs: List[Document] = Field(
+    docs: Optional[List[Document]] = Field(
         None, description="Langchian Documents generated after loading file"
     )
 
@@ -64,6 +64,118 @@ class FileListResponse(BaseModel):
     files: List[FileInfo] = Field(..., description="List of files")
 
 
+class FileIngestRequest(BaseModel):
+    """Request model for bulk ingestion of server-side files."""
+
+    directory: Optional[str] = Field(None, description="Directory to ingest")
+    paths: Optional[List[str]] = Field(None, description="File paths to ingest")
+    recursive: bool = Field(True, description="Include files in subdirectories")
+    loading_methods: Optional[Dict[str, str]] = Field(
+        None,
+        description="Loading method per file extension, defaults to the first supported method",
+    )
+
+
+class FileIngestResult(BaseModel):
+    """Ingestion result for a single file."""
+
+    path: str = Field(..., description="Server-side file path")
+    status: str = Field("pending", description="pending, running, success or failed")
+    file_id: Optional[str] = Field(None, description="File ID once ingested")
+    loading_method: Optional[str] = Field(None, description="Loading method used")
+    file_size: Optional[int] = Field(None, description="File size in bytes")
+    error: Optional[str] = Field(None, description="Error message if failed")
+    seconds: Optional[float] = Field(None, description="Time spent on this file")
+
+
+class FileIngestJob(BaseModel):
+    """Bulk ingestion job progress."""
+
+    job_id: str = Field(..., description="Unique job ID")
+    status: str = Field("running", description="running or completed")
+    total: int = Field(..., description="Number of files in the job")
+    succeeded: int = Field(0, description="Number of files ingested")
+    failed: int = Field(0, description="Number of files that failed")
+    bytes_processed: int = Field(0, description="Bytes of ingested files")
+    started_at: datetime = Field(..., description="Job start timestamp")
+    finished_at: Optional[datetime] = Field(None, description="Job end timestamp")
+    files_per_second: float = Field(0.0, description="Ingestion throughput in files")
+    bytes_per_second: float = Field(0.0, description="Ingestion throughput in bytes")
+    results: Optional[List[FileIngestResult]] = Field(
+        None, description="Per-file results"
+    )
+
+
+class WebIngestRequest(BaseModel):
+    """Request model for ingestion of web pages."""
+
+    urls: List[str] = Field(..., description="Page URLs to ingest")
+    concurrency: Optional[int] = Field(
+        None, ge=1, description="Maximum concurrent requests in total"
+    )
+    per_host_concurrency: Optional[int] = Field(
+        None, ge=1, description="Maximum concurrent requests per host"
+    )
+
+
+class WebIngestJob(FileIngestJob):
+    """Web ingestion job progress, results are keyed by URL."""
+
+    unchanged: int = Field(
+        0, description="Number of pages the server reported as not modified"
+    )
+    bytes_saved: int = Field(
+        0, description="Bytes not downloaded thanks to conditional requests"
+    )
+    pages_per_second: float = Field(0.0, description="Ingestion throughput in pages")
+
+
+class DatabaseIngestRequest(BaseModel):
+    """Request model for ingestion of a database table."""
+
+    source: str = Field(
+        ..., description="Name of a database source configured on the server"
+    )
+    table: str = Field(..., description="Table to ingest")
+    key_column: Optional[str] = Field(
+        None,
+        description="Unique, ordered column to paginate on, defaults to the primary key",
+    )
+    columns: Optional[List[str]] = Field(
+        None, description="Columns to include, defaults to all columns"
+    )
+    batch_size: Optional[int] = Field(
+        None, ge=1, description="Rows per query and commit"
+    )
+    rows_per_document: Optional[int] = Field(
+        None, ge=1, description="Rows per document"
+    )
+    resume: bool = Field(
+        True, description="Continue after the last saved row instead of starting over"
+    )
+
+
+class DatabaseIngestJob(FileIngestJob):
+    """Database ingestion job progress, with a single result for the table."""
+
+    rows: int = Field(0, description="Rows saved so far, including resumed ones")
+    documents: int = Field(0, description="Documents saved so far")
+    rows_per_second: float = Field(0.0, description="Ingestion throughput in rows")
+
+
+class ArchiveIngestJob(FileIngestJob):
+    """Archive ingestion job progress, with one result per archive member."""
+
+    archive_name: str = Field(..., description="File name of the uploaded archive")
+    skipped: int = Field(0, description="Members skipped for their file type")
+    extract_seconds: float = Field(
+        0.0, description="Time spent reading members out of the archive"
+    )
+    load_seconds: float = Field(
+        0.0, description="Time spent loading members, summed over members"
+    )
+
+
 class FileDeleteResponse(BaseModel):
     """File deletion response model."""
 
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import List, Tuple
 
 import constants
+from database import AsyncDatabaseService
 from models.search import (
     RetrievedChunk,
     SearchHistoryItem,
@@ -24,6 +25,9 @@ class SearchService:
     Service for handling search operations.
     """
 
+    def __init__(self):
+        self.db_service = AsyncDatabaseService()
+
     async def search(
         self, request: SearchRequest
     ) -> Tuple[List[RetrievedChunk], SearchScores, datetime]:
@@ -114,10 +118,8 @@ class SearchService:
                     chunk_data = json.load(f)
 
                 # Find the original file name
-                file_name = "unknown"
-                for file_path in constants.ORIGINAL_FILES_DIR.glob(f"{file_id}.*"):
-                    file_name = file_path.name
-                    break
+                file_record = await self.db_service.get_file_record(file_id)
+                file_name = file_record.file_name if file_record else "unknown"
 
                 # Create a retrieved chunk
                 retrieved_chunk = RetrievedChunk(
@@ -9,6 +9,8 @@ from datetime import datetime
 import logging
 from typing import Dict, Any
 
+from file_loader import FileLoaderService
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +76,7 @@ class SystemService:
                     "threads": process.num_threads(),
                     "pid": process.pid,
                 },
+                "cache": FileLoaderService.get_cache_stats(),
             }
 
             return system_info
@@ -1,4 +1,5 @@
 import asyncio
+from database import dispose_async_engine
 from database.service import DatabaseService
 from file_loader.service import FileLoaderService
 
@@ -33,6 +34,8 @@ async def test_filename_display():
                 print(f"  No original_filename in metadata")
         print()
 
+    await dispose_async_engine()
+
 
 if __name__ == "__main__":
     asyncio.run(test_filename_display())
@@ -12,6 +12,7 @@ from typing import List, Optional
 import numpy as np
 
 import constants
+from database import AsyncDatabaseService
 from models.vector_index import DetailedIndexInfo, IndexOptions
 
 logger = logging.getLogger("rag-backend.vector_index")
@@ -22,6 +23,9 @@ class VectorIndexService:
     Service for handling vector index operations.
     """
 
+    def __init__(self):
+        self.db_service = AsyncDatabaseService()
+
     async def create_index(
         self,
         index_type: str,
@@ -47,8 +51,7 @@ class VectorIndexService:
 
         # Check if files exist and have vectors
         for file_id in file_ids:
-            file_paths = list(constants.ORIGINAL_FILES_DIR.glob(f"{file_id}.*"))
-            if not file_paths:
+            if await self.db_service.get_file_record(file_id) is None:
                 raise FileNotFoundError(f"File with ID {file_id} not found")
 
             vector_dir = constants.VECTORS_DIR / file_id